@@ -1,23 +1,29 @@
-from terrymath import TerryMath, TerryVector3
+from array import array
+from terrymath import TerryMath, TerryVector3, TerryVector3Array
 
 class TerryPoint(TerryVector3):
     """A TerryMath-based 3D point (inherits TerryVector3)."""
-    pass
+
+    __slots__ = ()
 
 class TerryLine:
+    __slots__ = ("point", "direction", "math")
+
     def __init__(self, point, direction, math_engine=None):
         self.point = point  # TerryVector3
         self.direction = direction  # TerryVector3 (should be normalized)
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
 
     def point_at(self, t):
         return self.point + (self.direction * t)
 
 class TerrySegment:
+    __slots__ = ("start", "end", "math")
+
     def __init__(self, start, end, math_engine=None):
         self.start = start  # TerryVector3
         self.end = end      # TerryVector3
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
 
     def midpoint(self):
         tm = self.math
@@ -33,16 +39,20 @@ class TerrySegment:
         return (diff.dot(diff)) ** 0.5
 
 class TerryRay:
+    __slots__ = ("origin", "direction", "math")
+
     def __init__(self, origin, direction, math_engine=None):
         self.origin = origin  # TerryVector3
         self.direction = direction  # TerryVector3 (should be normalized)
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
 
 class TerryPlane:
+    __slots__ = ("point", "normal", "math")
+
     def __init__(self, point, normal, math_engine=None):
         self.point = point  # TerryVector3
         self.normal = normal  # TerryVector3 (should be normalized)
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
 
     def distance_to_point(self, pt):
         # Signed distance from point to plane
@@ -61,15 +71,25 @@ class TerryPlane:
         return t if t >= 0 else None
 
 class TerrySphere:
+    __slots__ = ("center", "radius", "math")
+
     def __init__(self, center, radius, math_engine=None):
         self.center = center  # TerryVector3
         self.radius = radius
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
 
     def contains_point(self, pt):
         tm = self.math
         return (pt - self.center).dot(pt - self.center) <= tm.terry_multiply(self.radius, self.radius)
 
+    def bounds(self):
+        c, r = self.center, self.radius
+        return TerryBox(
+            TerryVector3(c.x - r, c.y - r, c.z - r, self.math),
+            TerryVector3(c.x + r, c.y + r, c.z + r, self.math),
+            self.math
+        )
+
     def intersect_ray(self, ray):
         oc = ray.origin - self.center
         a = ray.direction.dot(ray.direction)
@@ -84,10 +104,15 @@ class TerrySphere:
         return (t1, t2)
 
 class TerryBox:
+    __slots__ = ("min_corner", "max_corner", "math")
+
     def __init__(self, min_corner, max_corner, math_engine=None):
         self.min_corner = min_corner  # TerryVector3
         self.max_corner = max_corner  # TerryVector3
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
+
+    def bounds(self):
+        return TerryBox(self.min_corner, self.max_corner, self.math)
 
     def contains_point(self, pt):
         return (self.min_corner.x <= pt.x <= self.max_corner.x and
@@ -117,11 +142,14 @@ class TerryBox:
         return (tmin, tmax)
 
 class TerryTriangle:
+    __slots__ = ("v0", "v1", "v2", "math", "_basis")
+
     def __init__(self, v0, v1, v2, math_engine=None):
         self.v0 = v0  # TerryVector3
         self.v1 = v1
         self.v2 = v2
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
+        self._basis = None
 
     def area(self):
         # Area using cross product
@@ -130,80 +158,431 @@ class TerryTriangle:
         cross = edge1.cross(edge2)
         return 0.5 * (cross.dot(cross)) ** 0.5
 
+    def _barycentric_basis(self):
+        # Cached on the vertex coordinates, so moving or replacing a vertex is
+        # picked up on the next query, and on the modes of the v1 and v2
+        # engines that take the edge dot products
+        a, b, c = self.v0, self.v1, self.v2
+        key = (a.x, a.y, a.z, b.x, b.y, b.z, c.x, c.y, c.z, b.math.mode, c.math.mode)
+        basis = self._basis
+        if basis is None or basis[0] != key:
+            basis = self._basis = (key,) + _triangle_basis(a, b, c)
+        return basis[1:]
+
     def contains_point(self, pt):
         # Barycentric method
-        v0 = self.v1 - self.v0
-        v1 = self.v2 - self.v0
-        v2 = pt - self.v0
-        d00 = v0.dot(v0)
-        d01 = v0.dot(v1)
-        d11 = v1.dot(v1)
-        d20 = v2.dot(v0)
-        d21 = v2.dot(v1)
-        denom = d00 * d11 - d01 * d01
+        e0, e1, d00, d01, d11, denom = self._barycentric_basis()
         if denom == 0:
             return False
+        v2 = pt - self.v0
+        d20 = v2.dot(e0)
+        d21 = v2.dot(e1)
         v = (d11 * d20 - d01 * d21) / denom
         w = (d00 * d21 - d01 * d20) / denom
         u = 1 - v - w
         return (u >= 0) and (v >= 0) and (w >= 0)
 
+    def contains_points(self, points):
+        """contains_point for a TerryVector3Array (or list) of points, as a list of bools."""
+        return _barycentric_inside(self.v0, self._barycentric_basis(), _as_array(points))
+
+    def bounds(self):
+        """Axis-aligned bounding box as a TerryBox."""
+        a, b, c = self.v0, self.v1, self.v2
+        return TerryBox(
+            TerryVector3(min(a.x, b.x, c.x), min(a.y, b.y, c.y), min(a.z, b.z, c.z), self.math),
+            TerryVector3(max(a.x, b.x, c.x), max(a.y, b.y, c.y), max(a.z, b.z, c.z), self.math),
+            self.math
+        )
+
     def intersect_ray(self, ray):
-        # Moller-Trumbore
-        edge1 = self.v1 - self.v0
-        edge2 = self.v2 - self.v0
-        h = ray.direction.cross(edge2)
-        a = edge1.dot(h)
-        if abs(a) < 1e-6:
-            return None
-        f = 1.0 / a
-        s = ray.origin - self.v0
-        u = f * s.dot(h)
-        if u < 0.0 or u > 1.0:
-            return None
-        q = s.cross(edge1)
-        v = f * ray.direction.dot(q)
-        if v < 0.0 or u + v > 1.0:
-            return None
-        t = f * edge2.dot(q)
-        if t > 1e-6:
-            return t
+        hit = self.intersect_ray_barycentric(ray)
+        return hit[0] if hit is not None else None
+
+    def intersect_ray_barycentric(self, ray):
+        """(t, u, v) of the hit, u and v weighting v1 and v2, or None."""
+        o, d = ray.origin, ray.direction
+        a, b, c = self.v0, self.v1, self.v2
+        tm = d.math
+        # Each product runs in the engine of the vector it is taken on (edges
+        # in the vertex engines, h and q against the ray), so the raw kernel
+        # path is only equivalent when those engines agree
+        if not (b.math.mode == c.math.mode == o.math.mode == tm.mode):
+            return _ray_triangle_vectors(a, b, c, o, d)
+        return _ray_triangle(
+            tm.kernels, o.x, o.y, o.z, d.x, d.y, d.z,
+            a.x, a.y, a.z, b.x, b.y, b.z, c.x, c.y, c.z
+        )
+
+def _triangle_basis(a, b, c):
+    """Edges and the dot products of the barycentric solve that depend only on the triangle."""
+    e0 = b - a
+    e1 = c - a
+    d00 = e0.dot(e0)
+    d01 = e0.dot(e1)
+    d11 = e1.dot(e1)
+    return e0, e1, d00, d01, d11, d00 * d11 - d01 * d01
+
+def _barycentric_inside(origin, basis, points):
+    e0, e1, d00, d01, d11, denom = basis
+    if denom == 0:
+        return [False] * len(points)
+    offsets = points - origin
+    inside = []
+    for d20, d21 in zip(offsets.dot(e0), offsets.dot(e1)):
+        v = (d11 * d20 - d01 * d21) / denom
+        w = (d00 * d21 - d01 * d20) / denom
+        u = 1 - v - w
+        inside.append((u >= 0) and (v >= 0) and (w >= 0))
+    return inside
+
+def _as_array(points):
+    # Lists keep the points' own engine, as contains_point would use
+    if isinstance(points, TerryVector3Array):
+        return points
+    return TerryVector3Array.from_vectors(points)
+
+def _ray_triangle(k, ox, oy, oz, dx, dy, dz, ax, ay, az, bx, by, bz, cx, cy, cz):
+    # Moller-Trumbore on raw coordinates with the engine's dot/cross kernels
+    e1x, e1y, e1z = bx - ax, by - ay, bz - az
+    e2x, e2y, e2z = cx - ax, cy - ay, cz - az
+    hx, hy, hz = k.cross3(dx, dy, dz, e2x, e2y, e2z)
+    a = k.dot3(e1x, e1y, e1z, hx, hy, hz)
+    if abs(a) < 1e-6:
+        return None
+    f = 1.0 / a
+    sx, sy, sz = ox - ax, oy - ay, oz - az
+    u = f * k.dot3(sx, sy, sz, hx, hy, hz)
+    if u < 0.0 or u > 1.0:
         return None
+    qx, qy, qz = k.cross3(sx, sy, sz, e1x, e1y, e1z)
+    v = f * k.dot3(dx, dy, dz, qx, qy, qz)
+    if v < 0.0 or u + v > 1.0:
+        return None
+    t = f * k.dot3(e2x, e2y, e2z, qx, qy, qz)
+    if t > 1e-6:
+        return (t, u, v)
+    return None
+
+def _ray_triangle_vectors(a, b, c, origin, direction):
+    # Moller-Trumbore through the vector methods, for mixed-engine inputs
+    edge1 = b - a
+    edge2 = c - a
+    h = direction.cross(edge2)
+    det = edge1.dot(h)
+    if abs(det) < 1e-6:
+        return None
+    f = 1.0 / det
+    s = origin - a
+    u = f * s.dot(h)
+    if u < 0.0 or u > 1.0:
+        return None
+    q = s.cross(edge1)
+    v = f * direction.dot(q)
+    if v < 0.0 or u + v > 1.0:
+        return None
+    t = f * edge2.dot(q)
+    if t > 1e-6:
+        return (t, u, v)
+    return None
+
+def _dot3_many(tm, a, b):
+    mul, add = tm.terry_multiply_many, tm.terry_add_many
+    return add(add(mul(a[0], b[0]), mul(a[1], b[1])), mul(a[2], b[2]))
+
+def _cross3_many(tm, a, b):
+    mul, sub = tm.terry_multiply_many, tm.terry_subtract_many
+    return (
+        sub(mul(a[1], b[2]), mul(a[2], b[1])),
+        sub(mul(a[2], b[0]), mul(a[0], b[2])),
+        sub(mul(a[0], b[1]), mul(a[1], b[0])),
+    )
+
+def _gather(columns, keep):
+    return tuple([column[i] for i in keep] if isinstance(column, list) else column for column in columns)
+
+def terry_intersect_rays(origins, directions, triangles, math_engine=None):
+    """
+    Packet Moller-Trumbore: nearest hit of every ray against one triangle, a
+    list of triangles or a TerryMesh. origins and directions are
+    TerryVector3Arrays of equal length. Returns (distances, ids): array('d')
+    with inf for misses and array('q') with -1. Each triangle is tested
+    against all live rays at once through the batch API, with the same
+    epsilons as TerryTriangle.intersect_ray.
+    """
+    if isinstance(triangles, TerryTriangle):
+        triangles = [triangles]
+    elif isinstance(triangles, TerryMesh):
+        triangles = triangles.triangles()
+    if len(origins) != len(directions):
+        raise ValueError(f"Ray origin and direction counts differ: {len(origins)} != {len(directions)}")
+    tm = math_engine or origins.math
+    n = len(origins)
+    distances = array("d", [float("inf")]) * n
+    ids = array("q", [-1]) * n
+    o_all = tuple(list(c) for c in origins.components)
+    d_all = tuple(list(c) for c in directions.components)
+    everyone = list(range(n))
+    for tri_id, tri in enumerate(triangles):
+        a, b, c = tri.v0, tri.v1, tri.v2
+        e1 = (b.x - a.x, b.y - a.y, b.z - a.z)
+        e2 = (c.x - a.x, c.y - a.y, c.z - a.z)
+        rays, d = everyone, d_all
+        h = _cross3_many(tm, d, e2)
+        det = _dot3_many(tm, e1, h)
+        keep = [k for k, value in enumerate(det) if abs(value) >= 1e-6]
+        if not keep:
+            continue
+        rays = [rays[k] for k in keep]
+        d, h = _gather(d, keep), _gather(h, keep)
+        f = [1.0 / det[k] for k in keep]
+        o = _gather(o_all, rays)
+        s = (tm.terry_subtract_many(o[0], a.x), tm.terry_subtract_many(o[1], a.y), tm.terry_subtract_many(o[2], a.z))
+        u = [fk * value for fk, value in zip(f, _dot3_many(tm, s, h))]
+        keep = [k for k, value in enumerate(u) if 0.0 <= value <= 1.0]
+        if not keep:
+            continue
+        rays, f, u = [rays[k] for k in keep], [f[k] for k in keep], [u[k] for k in keep]
+        d, s = _gather(d, keep), _gather(s, keep)
+        q = _cross3_many(tm, s, e1)
+        v = [fk * value for fk, value in zip(f, _dot3_many(tm, d, q))]
+        keep = [k for k, value in enumerate(v) if not (value < 0.0 or u[k] + value > 1.0)]
+        if not keep:
+            continue
+        q = _gather(q, keep)
+        t = _dot3_many(tm, e2, q)
+        for k, value in zip(keep, t):
+            distance = f[k] * value
+            ray = rays[k]
+            if distance > 1e-6 and distance < distances[ray]:
+                distances[ray] = distance
+                ids[ray] = tri_id
+    return distances, ids
+
+class TerryMesh:
+    """
+    Indexed triangle mesh: one TerryVector3Array of vertices shared by every
+    face, plus a flat array('q') of vertex indices (three per face).
+    Indexing (including slices, which return lists), len() and iteration go
+    over the vertices, as with the corner lists terry_cube and terry_quad
+    used to return. Face normals and edges are cached; call mark_dirty()
+    after editing vertices or indices in place.
+    """
+
+    __slots__ = ("vertices", "indices", "math", "_version", "_normals", "_edges", "_bases")
+
+    def __init__(self, vertices, indices=(), math_engine=None):
+        if not isinstance(vertices, TerryVector3Array):
+            vertices = TerryVector3Array.from_vectors(vertices, math_engine)
+        self.math = math_engine or vertices.math
+        self.vertices = vertices
+        self.indices = array("q", indices)
+        if len(self.indices) % 3:
+            raise ValueError("TerryMesh indices must come in triples")
+        n = len(vertices)
+        if any(not 0 <= i < n for i in self.indices):
+            raise ValueError(f"TerryMesh index out of range for {n} vertices")
+        self._version = 0
+        self._normals = None
+        self._edges = None
+        self._bases = None
+
+    def mark_dirty(self):
+        """Drop cached normals, edges and bases; call after editing vertices or indices in place."""
+        self._version += 1
+
+    @classmethod
+    def from_triangles(cls, triangles, math_engine=None):
+        """Build a mesh from TerryTriangles, storing each distinct vertex once."""
+        triangles = list(triangles)
+        if math_engine is None and triangles:
+            math_engine = triangles[0].math
+        lookup = {}
+        xs, ys, zs = [], [], []
+        indices = []
+        for tri in triangles:
+            for v in (tri.v0, tri.v1, tri.v2):
+                key = (v.x, v.y, v.z)
+                index = lookup.get(key)
+                if index is None:
+                    index = lookup[key] = len(xs)
+                    xs.append(v.x)
+                    ys.append(v.y)
+                    zs.append(v.z)
+                indices.append(index)
+        return cls(TerryVector3Array(xs, ys, zs, math_engine=math_engine), indices, math_engine)
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.vertices[i].to_vector() for i in range(*index.indices(len(self)))]
+        return self.vertices[index].to_vector()
+
+    def __iter__(self):
+        return (view.to_vector() for view in self.vertices)
+
+    def face_count(self):
+        return len(self.indices) // 3
+
+    def face(self, index):
+        return tuple(self.indices[3 * index:3 * index + 3])
+
+    def triangle(self, index):
+        a, b, c = self.face(index)
+        return TerryTriangle(self[a], self[b], self[c], self.math)
+
+    def triangles(self):
+        return [self.triangle(i) for i in range(self.face_count())]
+
+    def _corners(self):
+        """Per-face corner arrays (p0, p1, p2) gathered from the vertex buffer."""
+        corners = []
+        for k in range(3):
+            face_indices = self.indices[k::3]
+            corners.append(TerryVector3Array(
+                *([column[i] for i in face_indices] for column in self.vertices.components),
+                math_engine=self.math
+            ))
+        return corners
+
+    def _key(self):
+        # Normals are computed in the mesh engine, face bases in the vertex buffer's
+        return (self._version, self.math.mode, self.vertices.math.mode)
+
+    def face_normals(self):
+        """Unit normals (right-hand winding) of every face, as a TerryVector3Array."""
+        key = self._key()
+        if self._normals is None or self._normals[0] != key:
+            p0, p1, p2 = self._corners()
+            self._normals = (key, (p1 - p0).cross(p2 - p0).normalize())
+        return self._normals[1]
+
+    def edges(self):
+        """Sorted unique (a, b) vertex index pairs, a < b."""
+        key = self._version
+        if self._edges is None or self._edges[0] != key:
+            edges = set()
+            idx = self.indices
+            for f in range(0, len(idx), 3):
+                a, b, c = idx[f], idx[f + 1], idx[f + 2]
+                for i, j in ((a, b), (b, c), (c, a)):
+                    edges.add((i, j) if i < j else (j, i))
+            self._edges = (key, sorted(edges))
+        return self._edges[1]
+
+    def _face_bases(self):
+        """Per-face (origin, barycentric basis), cached like the face normals."""
+        key = self._key()
+        if self._bases is None or self._bases[0] != key:
+            bases = []
+            for f in range(self.face_count()):
+                a, b, c = (self[i] for i in self.face(f))
+                bases.append((a, _triangle_basis(a, b, c)))
+            self._bases = (key, bases)
+        return self._bases[1]
+
+    def contains_points(self, points):
+        """
+        For each point, the first face whose barycentric test contains it, or -1,
+        as array('q'). Each face classifies all still-unassigned points at once.
+        """
+        points = _as_array(points)
+        faces = array("q", [-1]) * len(points)
+        pending = list(range(len(points)))
+        subset = points
+        for f, (origin, basis) in enumerate(self._face_bases()):
+            if not pending:
+                break
+            inside = _barycentric_inside(origin, basis, subset)
+            if not any(inside):
+                continue
+            remaining = []
+            for k, hit in zip(pending, inside):
+                if hit:
+                    faces[k] = f
+                else:
+                    remaining.append(k)
+            pending = remaining
+            # Only rebuilt when this face claimed some points
+            subset = TerryVector3Array(*([column[k] for k in pending] for column in points.components), math_engine=points.math)
+        return faces
+
+    def bounds(self):
+        xs, ys, zs = self.vertices.components
+        return TerryBox(
+            TerryVector3(min(xs), min(ys), min(zs), self.math),
+            TerryVector3(max(xs), max(ys), max(zs), self.math),
+            self.math
+        )
+
+    def __repr__(self):
+        return f"TerryMesh({len(self)} vertices, {self.face_count()} faces)"
+
+def _unit(x, y, z):
+    length = (x * x + y * y + z * z) ** 0.5
+    return x / length, y / length, z / length
+
+_CUBE_FACES = (
+    0, 3, 2, 0, 2, 1,  # -z
+    4, 5, 6, 4, 6, 7,  # +z
+    0, 1, 5, 0, 5, 4,  # -y
+    3, 7, 6, 3, 6, 2,  # +y
+    0, 4, 7, 0, 7, 3,  # -x
+    1, 2, 6, 1, 6, 5,  # +x
+)
 
 def terry_cube(center, size, math_engine=None):
-    tm = math_engine or TerryMath()
+    """Axis-aligned cube as a TerryMesh: 8 corners, 12 outward-facing triangles."""
+    tm = math_engine or TerryMath.shared()
     half = tm.terry_divide(size, 2)
     cx, cy, cz = center.x, center.y, center.z
-    corners = [
-        TerryVector3(cx - half, cy - half, cz - half, tm),
-        TerryVector3(cx + half, cy - half, cz - half, tm),
-        TerryVector3(cx + half, cy + half, cz - half, tm),
-        TerryVector3(cx - half, cy + half, cz - half, tm),
-        TerryVector3(cx - half, cy - half, cz + half, tm),
-        TerryVector3(cx + half, cy - half, cz + half, tm),
-        TerryVector3(cx + half, cy + half, cz + half, tm),
-        TerryVector3(cx - half, cy + half, cz + half, tm),
-    ]
-    return corners
+    return TerryMesh(
+        TerryVector3Array(
+            [cx - half, cx + half, cx + half, cx - half, cx - half, cx + half, cx + half, cx - half],
+            [cy - half, cy - half, cy + half, cy + half, cy - half, cy - half, cy + half, cy + half],
+            [cz - half, cz - half, cz - half, cz - half, cz + half, cz + half, cz + half, cz + half],
+            math_engine=tm
+        ),
+        _CUBE_FACES,
+        tm
+    )
 
 def terry_quad(center, size, normal, math_engine=None):
-    tm = math_engine or TerryMath()
+    """Square facing `normal` as a TerryMesh: 4 corners, 2 triangles wound around the normal."""
+    tm = math_engine or TerryMath.shared()
     half = tm.terry_divide(size, 2)
+    # The in-plane basis is plain geometry (like the corner offsets), so it
+    # stays well defined in every mode.
+    length = (normal.x * normal.x + normal.y * normal.y + normal.z * normal.z) ** 0.5
+    if length == 0:
+        raise ValueError("terry_quad needs a non-zero normal")
+    nx, ny, nz = normal.x / length, normal.y / length, normal.z / length
+    hx, hy, hz = (0.0, 0.0, 1.0) if abs(ny) > abs(nz) and abs(ny) > abs(nx) else (0.0, 1.0, 0.0)
+    ux, uy, uz = _unit(hy * nz - hz * ny, hz * nx - hx * nz, hx * ny - hy * nx)
+    vx, vy, vz = _unit(ny * uz - nz * uy, nz * ux - nx * uz, nx * uy - ny * ux)
+    # For normal +z this is u = +x, v = +y, giving the original corner values
+    corners = [(-half, -half), (half, -half), (half, half), (-half, half)]
     cx, cy, cz = center.x, center.y, center.z
-    return [
-        TerryVector3(cx - half, cy - half, cz, tm),
-        TerryVector3(cx + half, cy - half, cz, tm),
-        TerryVector3(cx + half, cy + half, cz, tm),
-        TerryVector3(cx - half, cy + half, cz, tm),
-    ]
+    return TerryMesh(
+        TerryVector3Array(
+            [cx + a * ux + b * vx for a, b in corners],
+            [cy + a * uy + b * vy for a, b in corners],
+            [cz + a * uz + b * vz for a, b in corners],
+            math_engine=tm
+        ),
+        (0, 1, 2, 0, 2, 3),
+        tm
+    )
 
 def terry_distance(a, b, math_engine=None):
-    tm = math_engine or TerryMath()
+    tm = math_engine or TerryMath.shared()
     diff = b - a
     return (diff.dot(diff)) ** 0.5
 
 def terry_angle(a, b, math_engine=None):
-    tm = math_engine or TerryMath()
+    tm = math_engine or TerryMath.shared()
     dot = a.dot(b)
     mag_a = (a.dot(a)) ** 0.5
     mag_b = (b.dot(b)) ** 0.5
@@ -0,0 +1,281 @@
+from array import array
+from terrymath import (
+    TerryMath, TerryVector2, TerryVector3, TerryMatrix2x2, TerryMatrix3x3,
+    TerryVector2Array, TerryVector3Array
+)
+from terrylinalg import TerryMatrix4x4
+
+# Deferred (lazy) TerryMath expressions.
+# Operators on TerryExpr only record a graph. evaluate() compiles the graph
+# into one straight-line function with the engine's multiply rule inlined and
+# runs it, so no intermediate vectors or matrices are built. Compiled functions
+# are cached by graph shape and mode, and array-backed leaves are evaluated in
+# a single fused loop.
+
+_SHAPES = {
+    TerryVector2: (2,),
+    TerryVector3: (3,),
+    TerryMatrix2x2: (2, 2),
+    TerryMatrix3x3: (3, 3),
+    TerryMatrix4x4: (4, 4),
+}
+
+_BATCH_SHAPES = {
+    TerryVector2Array: (2,),
+    TerryVector3Array: (3,),
+}
+
+_COMPILED = {}
+
+
+def _size(shape):
+    size = 1
+    for n in shape:
+        size *= n
+    return size
+
+
+class TerryExpr:
+    """Node of a deferred expression over vectors, matrices and scalars."""
+
+    __slots__ = ("op", "args", "shape", "batched")
+
+    def __init__(self, op, args, shape, batched=False):
+        self.op = op
+        self.args = args
+        self.shape = shape
+        self.batched = batched
+
+    def _node(self, op, *args, shape):
+        return TerryExpr(op, args, shape, any(a.batched for a in args))
+
+    def __add__(self, other):
+        other = terry_lazy(other)
+        if other.shape != self.shape:
+            raise TypeError(f"Cannot add shapes {self.shape} and {other.shape}")
+        return self._node("add", self, other, shape=self.shape)
+
+    def __sub__(self, other):
+        other = terry_lazy(other)
+        if other.shape != self.shape:
+            raise TypeError(f"Cannot subtract shapes {self.shape} and {other.shape}")
+        return self._node("sub", self, other, shape=self.shape)
+
+    def __radd__(self, other):
+        return terry_lazy(other) + self
+
+    def __rsub__(self, other):
+        return terry_lazy(other) - self
+
+    def __neg__(self):
+        return self._node("neg", self, shape=self.shape)
+
+    def __mul__(self, other):
+        other = terry_lazy(other)
+        if other.shape == ():
+            # Vector/matrix * scalar, or scalar * scalar
+            return self._node("scale", self, other, shape=self.shape)
+        if len(self.shape) == 2 and len(other.shape) == 1:
+            n = self.shape[0]
+            if other.shape[0] == n or (n == 4 and other.shape[0] == 3):
+                return self._node("matvec", self, other, shape=other.shape)
+        if len(self.shape) == 2 and other.shape == self.shape:
+            return self._node("matmul", self, other, shape=self.shape)
+        raise TypeError(f"Unsupported lazy multiplication of shapes {self.shape} and {other.shape}")
+
+    def dot(self, other):
+        other = terry_lazy(other)
+        if len(self.shape) != 1 or other.shape != self.shape:
+            raise TypeError("Can only take dot product of two vectors of the same size")
+        return self._node("dot", self, other, shape=())
+
+    def cross(self, other):
+        other = terry_lazy(other)
+        if self.shape != (3,) or other.shape != (3,):
+            raise TypeError("Can only take cross product of two 3D vectors")
+        return self._node("cross", self, other, shape=(3,))
+
+    def evaluate(self, math_engine=None):
+        """Evaluate the whole graph in one fused pass."""
+        nodes, leaves = _linearize(self)
+        tm = math_engine or _engine_of(leaves)
+        template = tm.MULTIPLY_TEMPLATES.get(tm.mode, "mul({a}, {b})")
+        key = (tuple(nodes), template)
+        function = _COMPILED.get(key)
+        if function is None:
+            function = _COMPILED[key] = _compile(nodes, template)
+        if not self.batched:
+            return _wrap(function(_flatten_leaves(leaves), tm.terry_multiply), self.shape, tm)
+        lengths = {len(leaf) for leaf in leaves if isinstance(leaf, tuple(_BATCH_SHAPES))}
+        if len(lengths) != 1:
+            raise ValueError("Array-backed leaves differ in length")
+        columns = function(_flatten_leaves(leaves), tm.terry_multiply, lengths.pop())
+        if self.shape == ():
+            return array("d", columns[0])
+        return (TerryVector2Array if self.shape == (2,) else TerryVector3Array)(*columns, math_engine=tm)
+
+    def __repr__(self):
+        return f"TerryExpr({self.op}, shape={self.shape})"
+
+
+def terry_lazy(value):
+    """Wrap a vector, vector array, matrix or scalar as a deferred expression leaf."""
+    if isinstance(value, TerryExpr):
+        return value
+    if isinstance(value, (int, float)):
+        return TerryExpr("leaf", (value,), ())
+    for cls, shape in _SHAPES.items():
+        if isinstance(value, cls):
+            return TerryExpr("leaf", (value,), shape)
+    for cls, shape in _BATCH_SHAPES.items():
+        if isinstance(value, cls):
+            return TerryExpr("leaf", (value,), shape, batched=True)
+    raise TypeError(f"Cannot build a lazy TerryMath expression from {type(value).__name__}")
+
+
+def _linearize(root):
+    """Unique nodes in post-order as hashable tuples, plus the leaf values."""
+    index = {}
+    nodes = []
+    leaves = []
+    leaf_index = {}
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in index:
+            continue
+        if node.op == "leaf":
+            value = node.args[0]
+            key = id(value) if not isinstance(value, (int, float)) else (type(value), value, len(leaves))
+            if key not in leaf_index:
+                leaf_index[key] = len(leaves)
+                leaves.append(value)
+            index[id(node)] = len(nodes)
+            nodes.append(("leaf", node.shape, node.batched, leaf_index[key]))
+        elif expanded:
+            index[id(node)] = len(nodes)
+            nodes.append((node.op, node.shape, node.batched, tuple(index[id(a)] for a in node.args)))
+        else:
+            stack.append((node, True))
+            stack.extend((arg, False) for arg in reversed(node.args))
+    return nodes, leaves
+
+
+def _engine_of(leaves):
+    for leaf in leaves:
+        engine = getattr(leaf, "math", None)
+        if engine is not None:
+            return engine
+    return TerryMath.shared()
+
+
+def _flatten_leaves(leaves):
+    flat = []
+    for leaf in leaves:
+        if isinstance(leaf, (int, float)):
+            flat.append((leaf,))
+        elif isinstance(leaf, (TerryVector2Array, TerryVector3Array)):
+            flat.append(tuple(leaf.components))
+        elif hasattr(leaf, "data"):
+            flat.append(tuple(value for row in leaf.data for value in row))
+        elif isinstance(leaf, TerryVector3):
+            flat.append((leaf.x, leaf.y, leaf.z))
+        else:
+            flat.append((leaf.x, leaf.y))
+    return flat
+
+
+def _wrap(values, shape, tm):
+    if shape == ():
+        return values[0]
+    if shape == (2,):
+        return TerryVector2(*values, tm)
+    if shape == (3,):
+        return TerryVector3(*values, tm)
+    n = shape[0]
+    rows = [list(values[i * n:(i + 1) * n]) for i in range(n)]
+    if n == 2:
+        return TerryMatrix2x2(*values, math_engine=tm)
+    if n == 3:
+        return TerryMatrix3x3(rows, tm)
+    return TerryMatrix4x4(rows, tm)
+
+
+def _compile(nodes, template):
+    """Build the fused function for a linearized graph."""
+
+    def mul(a, b):
+        return template.format(a=a, b=b)
+
+    def total(parts):
+        return " + ".join(parts)
+
+    batched = any(node[2] for node in nodes)
+    hoisted = []
+    looped = []
+    names = []
+    for k, node in enumerate(nodes):
+        op, shape, varying, args = node
+        if op == "leaf":
+            leaf_names = [f"l{args}_{c}" for c in range(_size(shape))]
+            names.append(leaf_names)
+            if varying:
+                columns = [f"c{args}_{c}" for c in range(len(leaf_names))]
+                hoisted.append(f"    {', '.join(columns)}, = leaves[{args}]")
+                looped.extend(f"        {n} = {c}[i]" for n, c in zip(leaf_names, columns))
+            else:
+                hoisted.append(f"    {', '.join(leaf_names)}, = leaves[{args}]")
+            continue
+        a = names[args[0]]
+        b = names[args[1]] if len(args) > 1 else None
+        if op == "add":
+            exprs = [f"{x} + {y}" for x, y in zip(a, b)]
+        elif op == "sub":
+            exprs = [f"{x} - {y}" for x, y in zip(a, b)]
+        elif op == "neg":
+            exprs = [mul("neg_one", x) for x in a]
+        elif op == "scale":
+            exprs = [mul(x, b[0]) for x in a]
+        elif op == "dot":
+            exprs = [total([mul(x, y) for x, y in zip(a, b)])]
+        elif op == "cross":
+            exprs = [
+                f"{mul(a[1], b[2])} - {mul(a[2], b[1])}",
+                f"{mul(a[2], b[0])} - {mul(a[0], b[2])}",
+                f"{mul(a[0], b[1])} - {mul(a[1], b[0])}",
+            ]
+        elif op == "matvec":
+            n = nodes[args[0]][1][0]
+            m = len(b)
+            exprs = [
+                total([mul(a[i * n + j], b[j]) for j in range(m)])
+                + (f" + {a[i * n + 3]}" if m < n else "")
+                for i in range(m)
+            ]
+        else:  # matmul
+            n = shape[0]
+            exprs = [
+                total([mul(a[i * n + k], b[k * n + j]) for k in range(n)])
+                for i in range(n) for j in range(n)
+            ]
+        node_names = [f"t{k}_{c}" for c in range(len(exprs))]
+        names.append(node_names)
+        lines = looped if varying else hoisted
+        indent = "        " if varying else "    "
+        lines.extend(f"{indent}{name} = {expr}" for name, expr in zip(node_names, exprs))
+
+    result = names[-1]
+    if not batched:
+        body = ["def fused(leaves, mul):", "    neg_one = -1"] + hoisted
+        body.append(f"    return ({''.join(r + ', ' for r in result)})")
+    else:
+        outputs = [f"o{c}" for c in range(len(result))]
+        body = ["def fused(leaves, mul, n):", "    neg_one = -1"] + hoisted
+        body.append(f"    {', '.join(outputs)}, = {', '.join('[]' for _ in outputs)},")
+        body.append("    for i in range(n):")
+        body.extend(looped)
+        body.extend(f"        {o}.append({r})" for o, r in zip(outputs, result))
+        body.append(f"    return ({''.join(o + ', ' for o in outputs)})")
+    namespace = {}
+    exec(compile("\n".join(body) + "\n", "<terry-lazy>", "exec"), namespace)
+    return namespace["fused"]
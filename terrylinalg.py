@@ -1,15 +1,20 @@
 import math
-from terrymath import TerryMath, TerryVector3
+from array import array
+from collections import OrderedDict
+from functools import reduce
+from terrymath import TerryMath, TerryVector3, TerryVector3Array, TerryMatrix3x3, _add_rows_in_place
 
 class TerryMatrix4x4:
+    __slots__ = ("data", "math")
+
     def __init__(self, data, math_engine=None):
         assert len(data) == 4 and all(len(row) == 4 for row in data)
         self.data = [list(row) for row in data]
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
 
     @classmethod
     def identity(cls, math_engine=None):
-        tm = math_engine or TerryMath()
+        tm = math_engine or TerryMath.shared()
         return cls(
             [
                 [1 if i == j else 0 for j in range(4)]
@@ -32,56 +37,90 @@ class TerryMatrix4x4:
     def __mul__(self, other):
         tm = self.math
         if isinstance(other, TerryMatrix4x4):
-            result = [[0]*4 for _ in range(4)]
-            for i in range(4):
-                for j in range(4):
-                    result[i][j] = tm.terry_add(
-                        tm.terry_add(
-                            tm.terry_add(
-                                tm.terry_multiply(self.data[i][0], other.data[0][j]),
-                                tm.terry_multiply(self.data[i][1], other.data[1][j])
-                            ),
-                            tm.terry_multiply(self.data[i][2], other.data[2][j])
-                        ),
-                        tm.terry_multiply(self.data[i][3], other.data[3][j])
-                    )
-            return TerryMatrix4x4(result, tm)
+            return TerryMatrix4x4(tm.kernels.matmul4(self.data, other.data), tm)
         elif isinstance(other, TerryVector3):
             # Matrix-vector multiplication (assume w=1)
-            x = tm.terry_add(
-                tm.terry_add(
-                    tm.terry_add(
-                        tm.terry_multiply(self.data[0][0], other.x),
-                        tm.terry_multiply(self.data[0][1], other.y)
-                    ),
-                    tm.terry_multiply(self.data[0][2], other.z)
-                ),
-                self.data[0][3]
-            )
-            y = tm.terry_add(
-                tm.terry_add(
-                    tm.terry_add(
-                        tm.terry_multiply(self.data[1][0], other.x),
-                        tm.terry_multiply(self.data[1][1], other.y)
-                    ),
-                    tm.terry_multiply(self.data[1][2], other.z)
-                ),
-                self.data[1][3]
-            )
-            z = tm.terry_add(
-                tm.terry_add(
-                    tm.terry_add(
-                        tm.terry_multiply(self.data[2][0], other.x),
-                        tm.terry_multiply(self.data[2][1], other.y)
-                    ),
-                    tm.terry_multiply(self.data[2][2], other.z)
-                ),
-                self.data[2][3]
-            )
+            x, y, z = tm.kernels.affine4(self.data, other.x, other.y, other.z)
             return TerryVector3(x, y, z, tm)
         else:
             raise TypeError("Unsupported multiplication")
 
+    def __iadd__(self, other):
+        if not isinstance(other, TerryMatrix4x4):
+            raise TypeError("Can only add TerryMatrix4x4 to TerryMatrix4x4")
+        return _add_rows_in_place(self, other, None)
+
+    def __imul__(self, other):
+        if not isinstance(other, TerryMatrix4x4):
+            raise TypeError("Unsupported in-place multiplication for TerryMatrix4x4")
+        self.data[:] = self.math.kernels.matmul4(self.data, other.data)
+        return self
+
+    def add_scaled_(self, other, scalar):
+        if not isinstance(other, TerryMatrix4x4):
+            raise TypeError("Can only add TerryMatrix4x4 to TerryMatrix4x4")
+        return _add_rows_in_place(self, other, scalar)
+
+    def transform_points(self, points, out=None, project=False):
+        """
+        Transform many points (w=1) in one batched pass.
+        points is a TerryVector3Array, a flat x, y, z, x, y, z, ... buffer, or a
+        list of TerryVector3. Results go to out when given (same layout as the
+        result), else to a new TerryVector3Array / array('d'). Like matrix *
+        vector, the bottom row is ignored unless project is true; then every
+        point is divided by its w, and a zero w raises before out is written.
+        """
+        return self._transform_many(points, out, True, project)
+
+    def transform_directions(self, directions, out=None):
+        """Like transform_points with w=0: no translation and no divide."""
+        return self._transform_many(directions, out, False, False)
+
+    def _transform_many(self, points, out, translate, project):
+        tm = self.math
+        flat = not isinstance(points, TerryVector3Array)
+        if flat and points and isinstance(points[0], TerryVector3):
+            points = TerryVector3Array.from_vectors(points, tm)
+            flat = False
+        if flat:
+            if len(points) % 3:
+                raise ValueError("Flat point buffers need a multiple of 3 values")
+            source = array("d", points)
+            columns = (source[0::3], source[1::3], source[2::3])
+        else:
+            columns = points.components
+        mul, add = tm.terry_multiply_many, tm.terry_add_many
+        xs, ys, zs = columns
+        m = self.data
+        # The w row only matters when projecting through a non-affine matrix
+        rows = m if project and not self.is_affine() else m[:3]
+        results = []
+        for row in rows:
+            result = add(add(mul(row[0], xs), mul(row[1], ys)), mul(row[2], zs))
+            if translate:
+                result = add(result, row[3])
+            results.append(result)
+        if len(results) == 4:
+            w = results.pop()
+            if 0 in w:
+                raise ValueError("Cannot project a point with w=0")
+            results = [tm.terry_divide_many(r, w) for r in results]
+        if flat:
+            if out is None:
+                out = array("d", bytes(8 * len(source)))
+            elif len(out) != len(source):
+                raise ValueError(f"Output buffer holds {len(out)} values, expected {len(source)}")
+            for k, result in enumerate(results):
+                out[k::3] = array("d", result)
+            return out
+        if out is None:
+            return TerryVector3Array(*results, math_engine=tm)
+        if len(out) != len(points):
+            raise ValueError(f"Output array holds {len(out)} points, expected {len(points)}")
+        for column, result in zip(out.components, results):
+            column[:] = array("d", result)
+        return out
+
     def transpose(self):
         tm = self.math
         return TerryMatrix4x4(
@@ -89,52 +128,131 @@ class TerryMatrix4x4:
             tm
         )
 
-    def determinant(self):
-        # Laplace expansion (not optimized, but Terry-correct)
+    def is_affine(self):
+        return self.data[3] == [0, 0, 0, 1]
+
+    def _sub_determinants(self):
+        # The twelve 2x2 determinants shared by the determinant and the adjugate:
+        # s from rows 0-1, c from rows 2-3.
+        tm = self.math
+        mul, sub = tm.terry_multiply, tm.terry_subtract
+        (a00, a01, a02, a03), (a10, a11, a12, a13), (a20, a21, a22, a23), (a30, a31, a32, a33) = self.data
+        s = (
+            sub(mul(a00, a11), mul(a10, a01)),
+            sub(mul(a00, a12), mul(a10, a02)),
+            sub(mul(a00, a13), mul(a10, a03)),
+            sub(mul(a01, a12), mul(a11, a02)),
+            sub(mul(a01, a13), mul(a11, a03)),
+            sub(mul(a02, a13), mul(a12, a03)),
+        )
+        c = (
+            sub(mul(a20, a31), mul(a30, a21)),
+            sub(mul(a20, a32), mul(a30, a22)),
+            sub(mul(a20, a33), mul(a30, a23)),
+            sub(mul(a21, a32), mul(a31, a22)),
+            sub(mul(a21, a33), mul(a31, a23)),
+            sub(mul(a22, a33), mul(a32, a23)),
+        )
+        return s, c
+
+    def _affine_determinant(self):
+        tm = self.math
+        mul, add, sub = tm.terry_multiply, tm.terry_add, tm.terry_subtract
+        (a00, a01, a02, _), (a10, a11, a12, _), (a20, a21, a22, _) = self.data[:3]
+        return add(
+            sub(mul(a00, sub(mul(a11, a22), mul(a12, a21))), mul(a01, sub(mul(a10, a22), mul(a12, a20)))),
+            mul(a02, sub(mul(a10, a21), mul(a11, a20)))
+        )
+
+    def _cofactor_determinant(self, s, c):
+        tm = self.math
+        mul, add, sub = tm.terry_multiply, tm.terry_add, tm.terry_subtract
+        return add(
+            add(sub(add(sub(mul(s[0], c[5]), mul(s[1], c[4])), mul(s[2], c[3])), mul(s[4], c[1])), mul(s[3], c[2])),
+            mul(s[5], c[0])
+        )
+
+    def _laplace_determinant(self):
+        # Laplace expansion along row 0 (not optimized, but Terry-correct)
         m = self.data
         tm = self.math
+        mul, add, sub = tm.terry_multiply, tm.terry_add, tm.terry_subtract
 
-        def det3x3(sub):
-            return (
-                tm.terry_add(
-                    tm.terry_add(
-                        tm.terry_multiply(sub[0][0], tm.terry_subtract(
-                            tm.terry_multiply(sub[1][1], sub[2][2]),
-                            tm.terry_multiply(sub[1][2], sub[2][1])
-                        )),
-                        -tm.terry_multiply(sub[0][1], tm.terry_subtract(
-                            tm.terry_multiply(sub[1][0], sub[2][2]),
-                            tm.terry_multiply(sub[1][2], sub[2][0])
-                        ))
-                    ),
-                    tm.terry_multiply(sub[0][2], tm.terry_subtract(
-                        tm.terry_multiply(sub[1][0], sub[2][1]),
-                        tm.terry_multiply(sub[1][1], sub[2][0])
-                    ))
-                )
+        def det3x3(minor):
+            (b00, b01, b02), (b10, b11, b12), (b20, b21, b22) = minor
+            return add(
+                add(mul(b00, sub(mul(b11, b22), mul(b12, b21))),
+                    -mul(b01, sub(mul(b10, b22), mul(b12, b20)))),
+                mul(b02, sub(mul(b10, b21), mul(b11, b20)))
             )
 
         det = 0
         for col in range(4):
-            # Build 3x3 minor
-            minor = [
-                [m[row][c] for c in range(4) if c != col]
-                for row in range(1, 4)
-            ]
-            sign = (-1) ** col
-            det = tm.terry_add(
-                det,
-                tm.terry_multiply(sign * m[0][col], det3x3(minor))
-            )
+            minor = [[m[row][c] for c in range(4) if c != col] for row in range(1, 4)]
+            det = add(det, mul((-1) ** col * m[0][col], det3x3(minor)))
         return det
 
+    def _determinant(self, affine, parts=None):
+        # Regrouping the expansion is only exact in a_times_b; the Terry modes
+        # keep the row-0 Laplace expansion so their determinants do not change.
+        if self.math.mode != "a_times_b":
+            return self._laplace_determinant()
+        if affine:
+            return self._affine_determinant()
+        return self._cofactor_determinant(*(parts or self._sub_determinants()))
+
+    def determinant(self):
+        return self._determinant(self.is_affine())
+
     def inverse(self):
-        # TerryMath-compliant stub: returns identity for now
-        return TerryMatrix4x4.identity(math_engine=self.math)
+        if self.is_affine():
+            det = self._determinant(True)
+            if det == 0:
+                raise ValueError("Matrix is singular and cannot be inverted (det=0).")
+            return self._affine_inverse(det)
+        tm = self.math
+        mul, add, sub = tm.terry_multiply, tm.terry_add, tm.terry_subtract
+        s, c = self._sub_determinants()
+        det = self._determinant(False, (s, c))
+        if det == 0:
+            raise ValueError("Matrix is singular and cannot be inverted (det=0).")
+        inv_det = tm.terry_divide(1, det)
+        (a00, a01, a02, a03), (a10, a11, a12, a13), (a20, a21, a22, a23), (a30, a31, a32, a33) = self.data
+
+        def term(p, x, q, y, r, z):
+            # p*x - q*y + r*z
+            return add(sub(mul(p, x), mul(q, y)), mul(r, z))
+
+        adjugate = [
+            [term(a11, c[5], a12, c[4], a13, c[3]), -term(a01, c[5], a02, c[4], a03, c[3]),
+             term(a31, s[5], a32, s[4], a33, s[3]), -term(a21, s[5], a22, s[4], a23, s[3])],
+            [-term(a10, c[5], a12, c[2], a13, c[1]), term(a00, c[5], a02, c[2], a03, c[1]),
+             -term(a30, s[5], a32, s[2], a33, s[1]), term(a20, s[5], a22, s[2], a23, s[1])],
+            [term(a10, c[4], a11, c[2], a13, c[0]), -term(a00, c[4], a01, c[2], a03, c[0]),
+             term(a30, s[4], a31, s[2], a33, s[0]), -term(a20, s[4], a21, s[2], a23, s[0])],
+            [-term(a10, c[3], a11, c[1], a12, c[0]), term(a00, c[3], a01, c[1], a02, c[0]),
+             -term(a30, s[3], a31, s[1], a32, s[0]), term(a20, s[3], a21, s[1], a22, s[0])],
+        ]
+        return TerryMatrix4x4([[mul(v, inv_det) for v in row] for row in adjugate], tm)
+
+    def _affine_inverse(self, det):
+        # [R t; 0 1]^-1 = [R^-1  -R^-1 t; 0 1], with det the matrix's determinant
+        tm = self.math
+        mul, add, sub = tm.terry_multiply, tm.terry_add, tm.terry_subtract
+        (a00, a01, a02, tx), (a10, a11, a12, ty), (a20, a21, a22, tz) = self.data[:3]
+        inv_det = tm.terry_divide(1, det)
+        r = [
+            [mul(sub(mul(a11, a22), mul(a12, a21)), inv_det), mul(sub(mul(a02, a21), mul(a01, a22)), inv_det), mul(sub(mul(a01, a12), mul(a02, a11)), inv_det)],
+            [mul(sub(mul(a12, a20), mul(a10, a22)), inv_det), mul(sub(mul(a00, a22), mul(a02, a20)), inv_det), mul(sub(mul(a02, a10), mul(a00, a12)), inv_det)],
+            [mul(sub(mul(a10, a21), mul(a11, a20)), inv_det), mul(sub(mul(a01, a20), mul(a00, a21)), inv_det), mul(sub(mul(a00, a11), mul(a01, a10)), inv_det)],
+        ]
+        rows = [row + [-add(add(mul(row[0], tx), mul(row[1], ty)), mul(row[2], tz))] for row in r]
+        rows.append([0, 0, 0, 1])
+        return TerryMatrix4x4(rows, tm)
 
     @classmethod
     def identity(cls, math_engine=None):
-        tm = math_engine or TerryMath()
+        tm = math_engine or TerryMath.shared()
         return TerryMatrix4x4([
             [1,0,0,0],
             [0,1,0,0],
@@ -143,7 +261,7 @@ class TerryMatrix4x4:
         ], tm)
 
     def zero(math_engine=None):
-        tm = math_engine or TerryMath()
+        tm = math_engine or TerryMath.shared()
         return TerryMatrix4x4([
             [0,0,0,0],
             [0,0,0,0],
@@ -162,57 +280,66 @@ class TerryMatrix4x4:
 
 
 class TerryQuaternion:
+    __slots__ = ("w", "x", "y", "z", "math", "_matrix")
+
     def __init__(self, w, x, y, z, math_engine=None):
         self.w = w
         self.x = x
         self.y = y
         self.z = z
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
+        self._matrix = None
 
     def __mul__(self, other):
         tm = self.math
-        w = tm.terry_subtract(
-                tm.terry_subtract(
-                    tm.terry_subtract(
-                        tm.terry_multiply(self.w, other.w),
-                        tm.terry_multiply(self.x, other.x)
-                    ),
-                    tm.terry_multiply(self.y, other.y)
-                ),
-                tm.terry_multiply(self.z, other.z)
-            )
-        x = tm.terry_add(
-                tm.terry_add(
-                    tm.terry_add(
-                        tm.terry_multiply(self.w, other.x),
-                        tm.terry_multiply(self.x, other.w)
-                    ),
-                    tm.terry_multiply(self.y, other.z)
-                ),
-                -tm.terry_multiply(self.z, other.y)
-            )
-        y = tm.terry_add(
-                tm.terry_add(
-                    tm.terry_add(
-                        tm.terry_multiply(self.w, other.y),
-                        -tm.terry_multiply(self.x, other.z)
-                    ),
-                    tm.terry_multiply(self.y, other.w)
-                ),
-                tm.terry_multiply(self.z, other.x)
-            )
-        z = tm.terry_add(
-                tm.terry_add(
-                    tm.terry_add(
-                        tm.terry_multiply(self.w, other.z),
-                        tm.terry_multiply(self.x, other.y)
-                    ),
-                    -tm.terry_multiply(self.y, other.x)
-                ),
-                tm.terry_multiply(self.z, other.w)
-            )
+        w, x, y, z = tm.kernels.quat_mul(
+            self.w, self.x, self.y, self.z, other.w, other.x, other.y, other.z
+        )
         return TerryQuaternion(w, x, y, z, tm)
 
+    def __imul__(self, other):
+        if not isinstance(other, TerryQuaternion):
+            raise TypeError("Can only multiply TerryQuaternion by TerryQuaternion in place")
+        self.w, self.x, self.y, self.z = self.math.kernels.quat_mul(
+            self.w, self.x, self.y, self.z, other.w, other.x, other.y, other.z
+        )
+        return self
+
+    def __iadd__(self, other):
+        if not isinstance(other, TerryQuaternion):
+            raise TypeError("Can only add TerryQuaternion to TerryQuaternion")
+        tm = self.math
+        self.w = tm.terry_add(self.w, other.w)
+        self.x = tm.terry_add(self.x, other.x)
+        self.y = tm.terry_add(self.y, other.y)
+        self.z = tm.terry_add(self.z, other.z)
+        return self
+
+    def add_scaled_(self, other, scalar):
+        """In place: self += other * scalar, without the temporary quaternion."""
+        if not isinstance(other, TerryQuaternion):
+            raise TypeError("Can only add TerryQuaternion to TerryQuaternion")
+        tm = self.math
+        mul = other.math.terry_multiply  # other * scalar scales in other's engine
+        self.w = tm.terry_add(self.w, mul(other.w, scalar))
+        self.x = tm.terry_add(self.x, mul(other.x, scalar))
+        self.y = tm.terry_add(self.y, mul(other.y, scalar))
+        self.z = tm.terry_add(self.z, mul(other.z, scalar))
+        return self
+
+    def set_(self, w, x, y, z):
+        self.w = w
+        self.x = x
+        self.y = y
+        self.z = z
+        return self
+
+    def assign_(self, other):
+        return self.set_(other.w, other.x, other.y, other.z)
+
+    def copy(self):
+        return TerryQuaternion(self.w, self.x, self.y, self.z, self.math)
+
     def conjugate(self):
         tm = self.math
         return TerryQuaternion(self.w, -self.x, -self.y, -self.z, tm)
@@ -236,17 +363,474 @@ class TerryQuaternion:
             return TerryQuaternion(1, 0, 0, 0, self.math)
         return TerryQuaternion(self.w / n, self.x / n, self.y / n, self.z / n, self.math)
 
+    def normalize_(self):
+        n = self.norm()
+        if n == 0:
+            return self.set_(1, 0, 0, 0)
+        return self.set_(self.w / n, self.x / n, self.y / n, self.z / n)
+
+    def _matrix_rows(self):
+        # Cached on the quaternion, keyed by its components and mode, so any
+        # change to w, x, y, z (in place or not) is picked up on the next call.
+        tm = self.math
+        key = (self.w, self.x, self.y, self.z, tm.mode)
+        cached = self._matrix
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        mul, add, sub = tm.terry_multiply, tm.terry_add, tm.terry_subtract
+        w, x, y, z = self.w, self.x, self.y, self.z
+        xx, yy, zz = mul(x, x), mul(y, y), mul(z, z)
+        xy, xz, yz = mul(x, y), mul(x, z), mul(y, z)
+        wx, wy, wz = mul(w, x), mul(w, y), mul(w, z)
+        rows = (
+            (sub(1, mul(2, add(yy, zz))), mul(2, sub(xy, wz)), mul(2, add(xz, wy))),
+            (mul(2, add(xy, wz)), sub(1, mul(2, add(xx, zz))), mul(2, sub(yz, wx))),
+            (mul(2, sub(xz, wy)), mul(2, add(yz, wx)), sub(1, mul(2, add(xx, yy)))),
+        )
+        self._matrix = (key, rows)
+        return rows
+
+    def to_matrix3(self):
+        """Rotation matrix of this (unit) quaternion as a TerryMatrix3x3."""
+        return TerryMatrix3x3(self._matrix_rows(), self.math)
+
+    def to_matrix4(self):
+        rows = [list(row) + [0] for row in self._matrix_rows()]
+        rows.append([0, 0, 0, 1])
+        return TerryMatrix4x4(rows, self.math)
+
+    def rotate(self, v):
+        """Rotate a TerryVector3 by this unit quaternion: v + w*t + q_xyz x t, t = 2 * (q_xyz x v)."""
+        tm = self.math
+        cross3 = tm.kernels.cross3
+        mul, add = tm.terry_multiply, tm.terry_add
+        qx, qy, qz = self.x, self.y, self.z
+        tx, ty, tz = (mul(2, c) for c in cross3(qx, qy, qz, v.x, v.y, v.z))
+        cx, cy, cz = cross3(qx, qy, qz, tx, ty, tz)
+        w = self.w
+        return TerryVector3(
+            add(add(v.x, mul(w, tx)), cx),
+            add(add(v.y, mul(w, ty)), cy),
+            add(add(v.z, mul(w, tz)), cz),
+            tm
+        )
+
+    def rotate_many(self, points, out=None):
+        """Rotate many points through the cached rotation matrix in one batched pass."""
+        return self.to_matrix4().transform_directions(points, out)
+
     def __repr__(self):
         return f"TerryQuaternion({self.w}, {self.x}, {self.y}, {self.z})"
 
+class TerryMatrix:
+    """
+    Dense rows x cols matrix on one contiguous array('d').
+    Entry (i, j) lives at offset + i * row_stride + j * col_stride, so
+    transpose() returns a view over the same buffer instead of a copy.
+    Products and LU use the engine's batch API, with plain float loops
+    when the engine is in a_times_b mode.
+    """
+
+    __slots__ = ("rows", "cols", "buffer", "offset", "row_stride", "col_stride", "math")
+
+    BLOCK_SIZE = 64
+
+    def __init__(self, rows, cols, values=None, math_engine=None):
+        if rows < 1 or cols < 1:
+            raise ValueError(f"TerryMatrix needs positive dimensions, got {rows}x{cols}")
+        if values is None:
+            buffer = array("d", bytes(8 * rows * cols))
+        else:
+            buffer = array("d", values)
+            if len(buffer) != rows * cols:
+                raise ValueError(f"Expected {rows * cols} values for a {rows}x{cols} TerryMatrix, got {len(buffer)}")
+        self.rows = rows
+        self.cols = cols
+        self.buffer = buffer
+        self.offset = 0
+        self.row_stride = cols
+        self.col_stride = 1
+        self.math = math_engine or TerryMath.shared()
+
+    @classmethod
+    def from_rows(cls, rows, math_engine=None):
+        rows = [list(row) for row in rows]
+        if not rows or any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("TerryMatrix rows must be non-empty and of equal length")
+        return cls(len(rows), len(rows[0]), [v for row in rows for v in row], math_engine)
+
+    @classmethod
+    def identity(cls, n, math_engine=None):
+        m = cls(n, n, math_engine=math_engine)
+        for i in range(n):
+            m.buffer[i * (n + 1)] = 1.0
+        return m
+
+    def _index(self, key):
+        i, j = key
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError(f"Index {key} out of range for a {self.rows}x{self.cols} TerryMatrix")
+        return self.offset + i * self.row_stride + j * self.col_stride
+
+    def __getitem__(self, key):
+        return self.buffer[self._index(key)]
+
+    def __setitem__(self, key, value):
+        self.buffer[self._index(key)] = value
+
+    def is_contiguous(self):
+        return self.row_stride == self.cols and self.col_stride == 1
+
+    def row(self, i):
+        start = self.offset + i * self.row_stride
+        if self.col_stride == 1:
+            return self.buffer[start:start + self.cols].tolist()
+        return self.buffer[start:start + self.cols * self.col_stride:self.col_stride].tolist()
+
+    def to_rows(self):
+        return [self.row(i) for i in range(self.rows)]
+
+    def transpose(self):
+        """Transposed view sharing this matrix's buffer."""
+        view = TerryMatrix.__new__(TerryMatrix)
+        view.rows = self.cols
+        view.cols = self.rows
+        view.buffer = self.buffer
+        view.offset = self.offset
+        view.row_stride = self.col_stride
+        view.col_stride = self.row_stride
+        view.math = self.math
+        return view
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def copy(self):
+        """Contiguous copy (also materializes a transposed view)."""
+        return TerryMatrix(self.rows, self.cols, [v for row in self.to_rows() for v in row], self.math)
+
+    def __add__(self, other):
+        if not isinstance(other, TerryMatrix):
+            raise TypeError("Can only add TerryMatrix to TerryMatrix")
+        if (self.rows, self.cols) != (other.rows, other.cols):
+            raise ValueError(f"Cannot add {self.rows}x{self.cols} and {other.rows}x{other.cols} matrices")
+        tm = self.math
+        values = []
+        for a, b in zip(self.to_rows(), other.to_rows()):
+            values.extend(tm.terry_add_many(a, b))
+        return TerryMatrix(self.rows, self.cols, values, tm)
+
+    def __mul__(self, other):
+        if isinstance(other, TerryMatrix):
+            return self._matmul(other)
+        if isinstance(other, (list, tuple, array)):
+            if len(other) != self.cols:
+                raise ValueError(f"Vector length {len(other)} does not match {self.cols} columns")
+            tm = self.math
+            return [tm.terry_dot(row, other) for row in self.to_rows()]
+        raise TypeError("Unsupported multiplication for TerryMatrix")
+
+    __matmul__ = __mul__
+
+    def _matmul(self, other):
+        if self.cols != other.rows:
+            raise ValueError(f"Cannot multiply {self.rows}x{self.cols} by {other.rows}x{other.cols}")
+        tm = self.math
+        a_rows = self.to_rows()
+        b_rows = other.to_rows()
+        n, inner, m = self.rows, self.cols, other.cols
+        c_rows = [[0.0] * m for _ in range(n)]
+        block = self.BLOCK_SIZE
+        fast = tm.mode == "a_times_b"
+        # Tiles over (i, k, j). k tiles run in ascending order, so every entry
+        # still accumulates its products left to right.
+        for i0 in range(0, n, block):
+            i1 = min(i0 + block, n)
+            for k0 in range(0, inner, block):
+                k1 = min(k0 + block, inner)
+                for j0 in range(0, m, block):
+                    j1 = min(j0 + block, m)
+                    for i in range(i0, i1):
+                        a_row = a_rows[i]
+                        c_row = c_rows[i]
+                        c_tile = c_row[j0:j1]
+                        for k in range(k0, k1):
+                            a_ik = a_row[k]
+                            b_tile = b_rows[k][j0:j1]
+                            if fast:
+                                c_tile = [c + a_ik * b for c, b in zip(c_tile, b_tile)]
+                            else:
+                                c_tile = tm.terry_add_many(c_tile, tm.terry_multiply_many(a_ik, b_tile))
+                        c_row[j0:j1] = c_tile
+        return TerryMatrix(n, m, [v for row in c_rows for v in row], tm)
+
+    def lu(self):
+        """
+        LU decomposition with partial pivoting.
+        Returns (lu, perm, sign): lu packs the unit-lower L below the diagonal
+        and U on and above it, row i of lu comes from row perm[i] of self, and
+        sign is the permutation's parity (+1 or -1).
+        """
+        if self.rows != self.cols:
+            raise ValueError("LU decomposition needs a square TerryMatrix")
+        tm = self.math
+        n = self.rows
+        a = self.to_rows()
+        perm = list(range(n))
+        sign = 1
+        fast = tm.mode == "a_times_b"
+        for k in range(n):
+            p = max(range(k, n), key=lambda i: abs(a[i][k]))
+            if a[p][k] == 0:
+                raise ValueError("Matrix is singular and cannot be decomposed (zero pivot).")
+            if p != k:
+                a[k], a[p] = a[p], a[k]
+                perm[k], perm[p] = perm[p], perm[k]
+                sign = -sign
+            pivot_row = a[k]
+            pivot_tail = pivot_row[k + 1:]
+            for i in range(k + 1, n):
+                row = a[i]
+                f = tm.terry_divide(row[k], pivot_row[k])
+                row[k] = f
+                if fast:
+                    row[k + 1:] = [x - f * y for x, y in zip(row[k + 1:], pivot_tail)]
+                elif pivot_tail:
+                    row[k + 1:] = tm.terry_subtract_many(row[k + 1:], tm.terry_multiply_many(f, pivot_tail))
+        return TerryMatrix.from_rows(a, tm), perm, sign
+
+    def determinant(self):
+        """Product of the LU pivots, negated for an odd row permutation."""
+        if self.rows != self.cols:
+            raise ValueError("Determinant needs a square TerryMatrix")
+        try:
+            lu, _, sign = self.lu()
+        except ValueError:
+            return 0  # zero pivot: singular
+        det = reduce(self.math.terry_multiply, [lu[i, i] for i in range(self.rows)])
+        return det if sign > 0 else -det
+
+    def solve(self, b):
+        """Solve self * x = b for a vector b (list) or a TerryMatrix of right-hand sides."""
+        lu, perm, _ = self.lu()
+        if isinstance(b, TerryMatrix):
+            columns = [self._substitute(lu, perm, col) for col in b.transpose().to_rows()]
+            return TerryMatrix.from_rows(columns, self.math).transpose().copy()
+        if len(b) != self.rows:
+            raise ValueError(f"Right-hand side has {len(b)} entries, expected {self.rows}")
+        return self._substitute(lu, perm, list(b))
+
+    def _substitute(self, lu, perm, b):
+        tm = self.math
+        n = self.rows
+        rows = lu.to_rows()
+        y = [b[p] for p in perm]
+        for i in range(n):
+            # Forward substitution with the unit-lower L
+            if i:
+                y[i] = tm.terry_subtract(y[i], tm.terry_dot(rows[i][:i], y[:i]))
+        x = [0.0] * n
+        for i in reversed(range(n)):
+            tail = tm.terry_dot(rows[i][i + 1:], x[i + 1:]) if i + 1 < n else 0
+            x[i] = tm.terry_divide(tm.terry_subtract(y[i], tail), rows[i][i])
+        return x
+
+    def __repr__(self):
+        return f"TerryMatrix({self.rows}x{self.cols}, {self.to_rows()})"
+
+class TerryTransformChain:
+    """
+    M1 * M2 * ... * Mk applied to vectors (Mk first).
+    For a few vectors it is cheaper to push them through each matrix in turn;
+    for many, to collapse the chain into one product first. plan(count) picks
+    by multiply count. Collapsing regroups the products, so it is only used
+    when the mode is associative and distributive (and, for 4x4 chains, every
+    matrix is affine, since points are applied with w=1). The collapsed
+    product is cached until a matrix's entries change.
+    """
+
+    __slots__ = ("matrices", "math", "_product_key", "_product")
+
+    def __init__(self, matrices):
+        matrices = list(matrices)
+        if not matrices:
+            raise ValueError("TerryTransformChain needs at least one matrix")
+        kind = type(matrices[0])
+        if kind not in (TerryMatrix4x4, TerryMatrix3x3) or any(type(m) is not kind for m in matrices):
+            raise TypeError("TerryTransformChain needs all TerryMatrix4x4 or all TerryMatrix3x3")
+        self.matrices = matrices
+        self.math = matrices[0].math
+        self._product_key = None
+        self._product = None
+
+    def _key(self):
+        return (self.math.mode,) + tuple(tuple(row) for m in self.matrices for row in m.data)
+
+    def can_collapse(self):
+        properties = self.math.properties
+        if not (properties.associative and properties.distributive):
+            return False
+        return not isinstance(self.matrices[0], TerryMatrix4x4) or all(m.is_affine() for m in self.matrices)
+
+    def plan(self, count):
+        """'collapse' or 'sequential', whichever needs fewer multiplies for count vectors."""
+        return self._plan(count)[0]
+
+    def _plan(self, count):
+        # Returns (plan, key); the entry key is only built when the choice
+        # depends on whether the cached product is current, else it is None
+        if len(self.matrices) == 1 or not self.can_collapse():
+            return "sequential", None
+        # Affine 4x4s skip the bottom row, so a vector costs 9 multiplies either way
+        n = 4 if isinstance(self.matrices[0], TerryMatrix4x4) else 3
+        sequential = count * len(self.matrices) * 9
+        collapse = count * 9
+        if collapse >= sequential:
+            return "sequential", None
+        if collapse + (len(self.matrices) - 1) * n ** 3 < sequential:
+            return "collapse", None
+        key = self._key()
+        return ("collapse" if self._product_key == key else "sequential"), key
+
+    def product(self):
+        return self._collapsed(self._key())
+
+    def _collapsed(self, key):
+        if self._product_key != key:
+            product = self.matrices[0].copy()
+            for m in self.matrices[1:]:
+                product = product * m
+            self._product_key = key
+            self._product = product
+        return self._product
+
+    def apply(self, points):
+        """Apply the chain to a TerryVector3Array or a list of TerryVector3; returns a TerryVector3Array."""
+        if not isinstance(points, TerryVector3Array):
+            points = TerryVector3Array.from_vectors(points, self.math)
+        plan, key = self._plan(len(points))
+        if plan == "collapse":
+            return _apply_matrix(self._collapsed(key if key is not None else self._key()), points)
+        for m in reversed(self.matrices):
+            points = _apply_matrix(m, points)
+        return points
+
+    def apply_one(self, v):
+        result = self.apply([v])[0]
+        return TerryVector3(result.x, result.y, result.z, self.math)
+
+def _apply_matrix(m, points):
+    if isinstance(m, TerryMatrix4x4):
+        return m.transform_points(points)
+    tm = m.math
+    mul, add = tm.terry_multiply_many, tm.terry_add_many
+    xs, ys, zs = points.components
+    return TerryVector3Array(
+        *(add(add(mul(r[0], xs), mul(r[1], ys)), mul(r[2], zs)) for r in m.data),
+        math_engine=tm
+    )
+
 def terry_lerp_vec3(a, b, t):
     """Linear interpolation between two TerryVector3s."""
-    return a + (b - a) * t
+    # a + (b - a) * t without the temporaries; b - a, and so the multiply,
+    # lives in b's engine and the sum in a's.
+    tm, tb = a.math, b.math
+    return TerryVector3(
+        tm.terry_add(a.x, tb.terry_multiply(tb.terry_subtract(b.x, a.x), t)),
+        tm.terry_add(a.y, tb.terry_multiply(tb.terry_subtract(b.y, a.y), t)),
+        tm.terry_add(a.z, tb.terry_multiply(tb.terry_subtract(b.z, a.z), t)),
+        tm
+    )
 
 def terry_slerp_quat(q1, q2, t):
     """Spherical linear interpolation between two TerryQuaternions."""
-    tm = q1.math
-    dot = tm.terry_add(
+    return TerrySlerpSampler(q1, q2).sample(t)
+
+class TerrySlerpSampler:
+    """
+    Interpolates one keyframe pair at many t values.
+    The dot product, hemisphere flip, acos and sin(theta_0) are computed once;
+    sample(t) matches terry_slerp_quat(q1, q2, t). mode="nlerp" swaps slerp for
+    a normalized lerp, which is cheaper and close for small angles. Pass dot
+    when q1 . q2 is already known.
+    """
+
+    __slots__ = ("q1", "q2", "mode", "dot", "theta_0", "sin_theta_0", "math")
+
+    MODES = ("slerp", "nlerp")
+
+    def __init__(self, q1, q2, mode="slerp", dot=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown interpolation mode: {mode}")
+        tm = q1.math
+        if dot is None:
+            dot = _quat_dot(tm, q1, q2)
+        if dot < 0.0:
+            q2 = TerryQuaternion(-q2.w, -q2.x, -q2.y, -q2.z, tm)
+            dot = -dot
+        self.q1 = q1
+        self.q2 = q2
+        self.mode = mode
+        self.dot = dot
+        self.math = tm
+        if mode == "slerp" and dot <= 0.9995:
+            self.theta_0 = math.acos(dot)
+            self.sin_theta_0 = math.sin(self.theta_0)
+        else:
+            # Close quaternions (or nlerp): linear interpolation then normalize
+            self.theta_0 = None
+            self.sin_theta_0 = None
+
+    def sample(self, t):
+        q1, q2, tm = self.q1, self.q2, self.math
+        if self.theta_0 is None:
+            return TerryQuaternion(
+                q1.w + t*(q2.w - q1.w),
+                q1.x + t*(q2.x - q1.x),
+                q1.y + t*(q2.y - q1.y),
+                q1.z + t*(q2.z - q1.z),
+                tm
+            ).normalize()
+        theta = self.theta_0 * t
+        sin_theta = math.sin(theta)
+        s0 = math.cos(theta) - self.dot * sin_theta / self.sin_theta_0
+        s1 = sin_theta / self.sin_theta_0
+        return TerryQuaternion(
+            (q1.w * s0) + (q2.w * s1),
+            (q1.x * s0) + (q2.x * s1),
+            (q1.y * s0) + (q2.y * s1),
+            (q1.z * s0) + (q2.z * s1),
+            tm
+        ).normalize()
+
+    def sample_many(self, ts):
+        """sample(t) for every t in ts, with the interpolation weights computed in one pass."""
+        q1, q2, tm = self.q1, self.q2, self.math
+        if self.theta_0 is None:
+            dw, dx, dy, dz = q2.w - q1.w, q2.x - q1.x, q2.y - q1.y, q2.z - q1.z
+            return [
+                TerryQuaternion(q1.w + t*dw, q1.x + t*dx, q1.y + t*dy, q1.z + t*dz, tm).normalize()
+                for t in ts
+            ]
+        theta_0, sin_theta_0, dot = self.theta_0, self.sin_theta_0, self.dot
+        thetas = [theta_0 * t for t in ts]
+        sines = list(map(math.sin, thetas))
+        s0s = [cos - dot * sin / sin_theta_0 for cos, sin in zip(map(math.cos, thetas), sines)]
+        s1s = [sin / sin_theta_0 for sin in sines]
+        return [
+            TerryQuaternion(
+                (q1.w * s0) + (q2.w * s1),
+                (q1.x * s0) + (q2.x * s1),
+                (q1.y * s0) + (q2.y * s1),
+                (q1.z * s0) + (q2.z * s1),
+                tm
+            ).normalize()
+            for s0, s1 in zip(s0s, s1s)
+        ]
+
+def _quat_dot(tm, q1, q2):
+    return tm.terry_add(
         tm.terry_add(
             tm.terry_multiply(q1.w, q2.w),
             tm.terry_multiply(q1.x, q2.x)
@@ -256,43 +840,91 @@ def terry_slerp_quat(q1, q2, t):
             tm.terry_multiply(q1.z, q2.z)
         )
     )
-    if dot < 0.0:
-        q2 = TerryQuaternion(-q2.w, -q2.x, -q2.y, -q2.z, tm)
-        dot = -dot
-    if dot > 0.9995:
-        # Linear interpolation for very close quaternions
-        result = TerryQuaternion(
-            q1.w + t*(q2.w - q1.w),
-            q1.x + t*(q2.x - q1.x),
-            q1.y + t*(q2.y - q1.y),
-            q1.z + t*(q2.z - q1.z),
-            tm
-        ).normalize()
-        return result
-    theta_0 = math.acos(dot)
-    theta = theta_0 * t
-    sin_theta = math.sin(theta)
-    sin_theta_0 = math.sin(theta_0)
-    s0 = math.cos(theta) - dot * sin_theta / sin_theta_0
-    s1 = sin_theta / sin_theta_0
-    return TerryQuaternion(
-        (q1.w * s0) + (q2.w * s1),
-        (q1.x * s0) + (q2.x * s1),
-        (q1.y * s0) + (q2.y * s1),
-        (q1.z * s0) + (q2.z * s1),
-        tm
-    ).normalize()
 
-def terry_rotation_matrix(axis, angle, math_engine=None):
-    """Terry-based 3D rotation matrix from axis and angle (Rodrigues' formula)."""
-    tm = math_engine or TerryMath()
-    x, y, z = axis.normalize().x, axis.normalize().y, axis.normalize().z
+def terry_slerp_many(q1s, q2s, ts, mode="slerp"):
+    """
+    Interpolate whole tracks of keyframe pairs: result i is q1s[i] -> q2s[i]
+    at ts[i] (ts may also be a single t for every pair). The pair dot
+    products are taken in one batched pass per q1 engine, which is the
+    engine terry_slerp_quat uses for each pair.
+    """
+    q1s = list(q1s)
+    q2s = list(q2s)
+    if len(q1s) != len(q2s):
+        raise ValueError(f"Keyframe lists differ in length: {len(q1s)} != {len(q2s)}")
+    if not q1s:
+        return []
+    if isinstance(ts, (int, float)):
+        ts = [ts] * len(q1s)
+    elif len(ts) != len(q1s):
+        raise ValueError(f"Expected {len(q1s)} t values, got {len(ts)}")
+    groups = {}
+    for i, q1 in enumerate(q1s):
+        groups.setdefault(q1.math, []).append(i)
+    dots = [None] * len(q1s)
+    for tm, pairs in groups.items():
+        a = [q1s[i] for i in pairs]
+        b = [q2s[i] for i in pairs]
+        mul, add = tm.terry_multiply_many, tm.terry_add_many
+        group_dots = add(
+            add(mul([q.w for q in a], [q.w for q in b]), mul([q.x for q in a], [q.x for q in b])),
+            add(mul([q.y for q in a], [q.y for q in b]), mul([q.z for q in a], [q.z for q in b]))
+        )
+        for i, dot in zip(pairs, group_dots):
+            dots[i] = dot
+    return [
+        TerrySlerpSampler(q1, q2, mode, dot).sample(t)
+        for q1, q2, dot, t in zip(q1s, q2s, dots, ts)
+    ]
+
+_ROTATION_CACHE = OrderedDict()
+ROTATION_CACHE_SIZE = 1024
+
+def _axis_products(axis):
+    # Rodrigues' formula needs a unit axis in ordinary floats; a Terry-mode
+    # normalize would not give one, and would tie the rows to the axis engine.
+    x, y, z = axis.x, axis.y, axis.z
+    length = math.sqrt(x*x + y*y + z*z)
+    if length == 0:
+        raise ValueError("Rotation axis must be non-zero")
+    x, y, z = x / length, y / length, z / length
+    return x, y, z, x*x, y*y, z*z, x*y, x*z, y*z
+
+def _rotation_rows(products, angle):
+    x, y, z, xx, yy, zz, xy, xz, yz = products
     c = math.cos(angle)
     s = math.sin(angle)
     t = 1 - c
-    return TerryMatrix4x4([
-        [t*x*x + c,   t*x*y - s*z, t*x*z + s*y, 0],
-        [t*x*y + s*z, t*y*y + c,   t*y*z - s*x, 0],
-        [t*x*z - s*y, t*y_z + s*x, t*z*z + c,   0],
-        [0,           0,           0,           1]
-    ], tm)
+    sx, sy, sz = s*x, s*y, s*z
+    return [
+        [t*xx + c,  t*xy - sz, t*xz + sy, 0],
+        [t*xy + sz, t*yy + c,  t*yz - sx, 0],
+        [t*xz - sy, t*yz + sx, t*zz + c,  0],
+        [0,         0,         0,         1]
+    ]
+
+def terry_rotation_matrix(axis, angle, math_engine=None, cache=False):
+    """
+    Terry-based 3D rotation matrix from axis and angle (Rodrigues' formula).
+    The rows are plain floats, so with cache=True they are memoized on the axis
+    components and angle alone, in a bounded LRU of ROTATION_CACHE_SIZE
+    entries; each call still returns its own matrix.
+    """
+    tm = math_engine or TerryMath.shared()
+    if not cache:
+        return TerryMatrix4x4(_rotation_rows(_axis_products(axis), angle), tm)
+    key = (axis.x, axis.y, axis.z, angle)
+    rows = _ROTATION_CACHE.get(key)
+    if rows is None:
+        rows = _ROTATION_CACHE[key] = _rotation_rows(_axis_products(axis), angle)
+        if len(_ROTATION_CACHE) > ROTATION_CACHE_SIZE:
+            _ROTATION_CACHE.popitem(last=False)
+    else:
+        _ROTATION_CACHE.move_to_end(key)
+    return TerryMatrix4x4(rows, tm)
+
+def terry_rotation_matrices(axis, angles, math_engine=None):
+    """Rotation matrices about one axis for many angles; the axis is normalized once."""
+    tm = math_engine or TerryMath.shared()
+    products = _axis_products(axis)
+    return [TerryMatrix4x4(_rotation_rows(products, angle), tm) for angle in angles]
@@ -1,3 +1,272 @@
+import math
+import operator
+from array import array
+from collections import OrderedDict, namedtuple
+from concurrent.futures import as_completed
+from functools import reduce
+from threading import Lock
+from types import SimpleNamespace
+
+
+def _batch_operands(a, b):
+    a_scalar = isinstance(a, (int, float))
+    b_scalar = isinstance(b, (int, float))
+    if a_scalar and b_scalar:
+        raise TypeError("Batch operations need at least one sequence operand")
+    if a_scalar:
+        return [a] * len(b), b
+    if b_scalar:
+        return a, [b] * len(a)
+    if len(a) != len(b):
+        raise ValueError(f"Batch operands differ in length: {len(a)} != {len(b)}")
+    return a, b
+
+
+def _terry_original_many(a, b):
+    result = list(map(operator.mul, a, b))
+    # Masked fix-up: only the 1 x 1 lanes differ from plain multiplication.
+    for i in [i for i, x in enumerate(a) if x == 1]:
+        if b[i] == 1:
+            result[i] = 2
+    return result
+
+
+def _kernel_source(template):
+    """Python source for a kernel factory with the multiply rule inlined."""
+
+    def mul(a, b):
+        return template.format(a=a, b=b)
+
+    def total(pairs, signs=None):
+        # Left-to-right chain, matching the nested terry_add calls it replaces.
+        signs = signs or "+" * len(pairs)  # the first sign is always "+"
+        parts = [mul(a, b) for a, b in pairs]
+        text = parts[0]
+        for sign, part in zip(signs[1:], parts[1:]):
+            text += f" {sign} {part}"
+        return text
+
+    def unpack(name, n):
+        rows = ", ".join(
+            "(" + ", ".join(f"{name}{i}{j}" for j in range(n)) + ")" for i in range(n)
+        )
+        return f"        {rows} = {name}"
+
+    def matmul(n):
+        rows = []
+        for i in range(n):
+            cells = [
+                total([(f"m{i}{k}", f"n{k}{j}") for k in range(n)]) for j in range(n)
+            ]
+            rows.append("[" + ", ".join(cells) + "]")
+        return [
+            f"    def matmul{n}(m, n):",
+            unpack("m", n),
+            unpack("n", n),
+            "        return [" + ", ".join(rows) + "]",
+        ]
+
+    lines = ["def make_kernels(mul):"]
+    lines += [
+        "    def dot2(ax, ay, bx, by):",
+        f"        return {total([('ax', 'bx'), ('ay', 'by')])}",
+        "    def dot3(ax, ay, az, bx, by, bz):",
+        f"        return {total([('ax', 'bx'), ('ay', 'by'), ('az', 'bz')])}",
+        "    def cross3(ax, ay, az, bx, by, bz):",
+        "        return ("
+        f"{total([('ay', 'bz'), ('az', 'by')], '+-')}, "
+        f"{total([('az', 'bx'), ('ax', 'bz')], '+-')}, "
+        f"{total([('ax', 'by'), ('ay', 'bx')], '+-')})",
+        "    def matvec2(m, x, y):",
+        unpack("m", 2),
+        "        return ("
+        f"{total([('m00', 'x'), ('m01', 'y')])}, "
+        f"{total([('m10', 'x'), ('m11', 'y')])})",
+        "    def affine4(m, x, y, z):",
+        unpack("m", 4),
+        "        return ("
+        + ", ".join(
+            total([(f"m{i}0", "x"), (f"m{i}1", "y"), (f"m{i}2", "z")]) + f" + m{i}3"
+            for i in range(3)
+        )
+        + ")",
+        "    def quat_mul(aw, ax, ay, az, bw, bx, by, bz):",
+        "        return ("
+        f"{total([('aw', 'bw'), ('ax', 'bx'), ('ay', 'by'), ('az', 'bz')], '+---')}, "
+        f"{total([('aw', 'bx'), ('ax', 'bw'), ('ay', 'bz'), ('az', 'by')], '+++-')}, "
+        f"{total([('aw', 'by'), ('ax', 'bz'), ('ay', 'bw'), ('az', 'bx')], '+-++')}, "
+        f"{total([('aw', 'bz'), ('ax', 'by'), ('ay', 'bx'), ('az', 'bw')], '++-+')})",
+    ]
+    for n in (2, 3, 4):
+        lines += matmul(n)
+    names = ["dot2", "dot3", "cross3", "matvec2", "affine4", "quat_mul",
+             "matmul2", "matmul3", "matmul4"]
+    lines.append("    return {" + ", ".join(f"{n!r}: {n}" for n in names) + "}")
+    return "\n".join(lines) + "\n"
+
+
+_KERNEL_FACTORIES = {}
+
+
+def _kernel_factory(template):
+    factory = _KERNEL_FACTORIES.get(template)
+    if factory is None:
+        namespace = {}
+        exec(compile(_kernel_source(template), "<terry-kernels>", "exec"), namespace)
+        factory = _KERNEL_FACTORIES[template] = namespace["make_kernels"]
+    return factory
+
+
+def _terry_original_power(a, b):
+    # 1 x 1 = 2, and 2 x 1 = 2 from then on; every other base is ordinary.
+    if a == 1 and b >= 2 and (isinstance(b, int) or float(b).is_integer()):
+        return 2
+    return a ** b
+
+
+def _terry_original_power_mod(a, b, m):
+    if a == 1 and b >= 2:
+        return 2 % m
+    return pow(a, b, m)
+
+
+def _power_by_squaring(mul, a, b, m=None):
+    """a multiplied by itself b times (b >= 1) in O(log b) rule applications."""
+    result = None
+    base = a
+    while True:
+        if b & 1:
+            result = base if result is None else mul(result, base)
+            if m is not None:
+                result %= m
+        b >>= 1
+        if not b:
+            return result
+        base = mul(base, base)
+        if m is not None:
+            base %= m
+
+
+def _check_exponent(b):
+    if not isinstance(b, int) or b < 0:
+        raise ValueError(
+            f"Exponent must be a non-negative integer in this mode, got {b!r}"
+        )
+
+
+TerryTableInfo = namedtuple(
+    "TerryTableInfo", ["table_hits", "hits", "misses", "maxsize", "currsize"]
+)
+
+# Built tables are shared between engines with the same rule and range; only the
+# most recently used few are kept alive.
+_TABLE_VALUES = OrderedDict()
+TABLE_VALUES_SIZE = 8
+
+
+class TerryTable:
+    """
+    Precomputed Terry Table for one multiply rule.
+    Integer pairs in [low, high] are read from a flat typed array (a tuple when
+    the rule does not give 64-bit ints, so result types are kept); every other
+    pair goes through a bounded LRU cache in front of the rule. The cache is
+    locked, so one table can serve a threaded terry_product; table_hits is
+    counted without the lock and is approximate under threads.
+    A lookup costs more than the built-in rules themselves, so the table only
+    pays off for rules that are expensive to evaluate.
+    """
+
+    def __init__(self, rule, low, high, cache_size=4096):
+        if low > high:
+            raise ValueError(f"Empty Terry Table range: [{low}, {high}]")
+        if cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+        self.rule = rule
+        self.low = low
+        self.high = high
+        self.size = high - low + 1
+        self.cache_size = cache_size
+        key = (rule, low, high)
+        self.values = _TABLE_VALUES.get(key)
+        if self.values is None:
+            span = range(low, high + 1)
+            results = [rule(a, b) for a in span for b in span]
+            try:
+                values = array("q", results)
+            except (OverflowError, TypeError):
+                values = tuple(results)
+            self.values = _TABLE_VALUES[key] = values
+            if len(_TABLE_VALUES) > TABLE_VALUES_SIZE:
+                _TABLE_VALUES.popitem(last=False)
+        else:
+            _TABLE_VALUES.move_to_end(key)
+        self.cache = OrderedDict()
+        self._lock = Lock()
+        self.table_hits = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, a, b):
+        # bool and int subclasses skip the table so their results match the rule.
+        if a.__class__ is int and b.__class__ is int:
+            low = self.low
+            if low <= a <= self.high and low <= b <= self.high:
+                self.table_hits += 1
+                return self.values[(a - low) * self.size + (b - low)]
+        # 1 and 1.0 hash alike but may produce different result types.
+        key = (type(a), a, type(b), b)
+        cache = self.cache
+        with self._lock:
+            if key in cache:
+                self.hits += 1
+                cache.move_to_end(key)
+                return cache[key]
+            self.misses += 1
+        result = self.rule(a, b)
+        if self.cache_size:
+            with self._lock:
+                cache[key] = result
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+        return result
+
+    def info(self):
+        with self._lock:
+            return TerryTableInfo(
+                self.table_hits, self.hits, self.misses, self.cache_size, len(self.cache)
+            )
+
+    def clear_cache(self):
+        with self._lock:
+            self.cache.clear()
+            self.table_hits = self.hits = self.misses = 0
+
+
+# distributive: a * (b + c) == a * b + a * c, which (with associativity) lets
+# matrix products be regrouped.
+TerryModeInfo = namedtuple(
+    "TerryModeInfo", ["commutative", "associative", "identity", "distributive"], defaults=[False]
+)
+
+
+def _fold_products(tm, values):
+    """Fold values with terry_multiply, pairwise when the mode allows regrouping."""
+    if not tm.properties.associative:
+        return reduce(tm.terry_multiply, values)
+    values = list(values)
+    mul = tm.terry_multiply
+    while len(values) > 1:
+        paired = [mul(values[i], values[i + 1]) for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def _sum_products(tm, a, b):
+    return reduce(operator.add, tm.terry_multiply_many(a, b), 0)
+
+
 class TerryMath:
     """
     TerryMath Engine: Foundation for all arithmetic and algebraic operations.
@@ -11,14 +280,101 @@ class TerryMath:
         "terry_original": lambda a, b: 2 if a == 1 and b == 1 else a * b,
     }
 
+    # Elementwise versions of MODES; modes without an entry fall back to
+    # mapping the scalar rule.
+    BATCH_MODES = {
+        "a_plus_b_minus_1": lambda a, b: [x + y - 1 for x, y in zip(a, b)],
+        "a_plus_b": lambda a, b: list(map(operator.add, a, b)),
+        "a_times_b": lambda a, b: list(map(operator.mul, a, b)),
+        "terry_original": _terry_original_many,
+    }
+
+    # Source form of each mode's rule, inlined into the vector/matrix kernels.
+    # {a} and {b} are always plain names, so evaluating them twice is safe.
+    # Modes without a template get kernels that call terry_multiply instead.
+    MULTIPLY_TEMPLATES = {
+        "a_plus_b_minus_1": "({a} + {b} - 1)",
+        "a_plus_b": "({a} + {b})",
+        "a_times_b": "{a} * {b}",
+        "terry_original": "(2 if {a} == 1 and {b} == 1 else {a} * {b})",
+    }
+
+    # Closed forms of a multiplied by itself b times. They also define the
+    # power for negative and fractional b.
+    POWER_RULES = {
+        "a_plus_b_minus_1": lambda a, b: b * (a - 1) + 1,
+        "a_plus_b": lambda a, b: a * b,
+        "a_times_b": lambda a, b: a ** b,
+        "terry_original": _terry_original_power,
+    }
+
+    POWER_MOD_RULES = {
+        "a_plus_b_minus_1": lambda a, b, m: (b * (a - 1) + 1) % m,
+        "a_plus_b": lambda a, b, m: (a * b) % m,
+        "a_times_b": pow,
+        "terry_original": _terry_original_power_mod,
+    }
+
+    # Declared algebra of each rule. Associativity allows regrouping (powers,
+    # tree and parallel reductions); identity seeds reductions of empty input.
+    MODE_PROPERTIES = {
+        "a_plus_b_minus_1": TerryModeInfo(commutative=True, associative=True, identity=1),
+        "a_plus_b": TerryModeInfo(commutative=True, associative=True, identity=0),
+        "a_times_b": TerryModeInfo(commutative=True, associative=True, identity=1, distributive=True),
+        "terry_original": TerryModeInfo(commutative=True, associative=False, identity=None),
+    }
+
+    _SHARED = {}
+    _frozen = False
+
     def __init__(self, mode="terry_original"):
         self.set_mode(mode)
 
+    @classmethod
+    def shared(cls, mode="terry_original"):
+        """
+        Interned engine for `mode`, used by value types created without a
+        math_engine. Shared engines cannot change mode.
+        """
+        engine = cls._SHARED.get(mode)
+        if engine is None:
+            engine = cls(mode)
+            engine._frozen = True
+            cls._SHARED[mode] = engine
+        return engine
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise RuntimeError(
+                "Shared TerryMath engines cannot be reconfigured; pass your own TerryMath() instead"
+            )
+
     def set_mode(self, mode):
+        self._check_not_frozen()
         if mode not in self.MODES:
             raise ValueError(f"Unknown Terry Table mode: {mode}")
         self.mode = mode
         self.multiply_rule = self.MODES[mode]
+        self.properties = self.MODE_PROPERTIES.get(
+            mode, TerryModeInfo(commutative=False, associative=False, identity=None)
+        )
+        table = getattr(self, "table", None)
+        if table is not None:
+            self.enable_table(table.low, table.high, table.cache_size)
+        self.batch_multiply_rule = self.BATCH_MODES.get(mode)
+        template = self.MULTIPLY_TEMPLATES.get(mode, "mul({a}, {b})")
+        self.kernels = SimpleNamespace(**_kernel_factory(template)(self.terry_multiply))
+
+    def enable_table(self, low=-64, high=64, cache_size=4096):
+        """Serve terry_multiply from a TerryTable for the current mode (kept across set_mode)."""
+        self._check_not_frozen()
+        self.table = TerryTable(self.MODES[self.mode], low, high, cache_size)
+        self.multiply_rule = self.table
+
+    def disable_table(self):
+        self._check_not_frozen()
+        self.table = None
+        self.multiply_rule = self.MODES[self.mode]
 
     def terry_multiply(self, a, b):
         return self.multiply_rule(a, b)
@@ -35,20 +391,152 @@ class TerryMath:
     def terry_power(self, a, b):
         if b == 0:
             return 1
+        if b == 1:
+            return a
+        closed_form = self.POWER_RULES.get(self.mode)
+        if closed_form is not None:
+            return closed_form(a, b)
+        _check_exponent(b)
+        if self.properties.associative:
+            return _power_by_squaring(self.terry_multiply, a, b)
         result = a
         for _ in range(1, b):
             result = self.terry_multiply(result, a)
         return result
 
+    def terry_power_mod(self, a, b, m):
+        """terry_power(a, b) % m for integers, without building the full power."""
+        _check_exponent(b)
+        if not isinstance(a, int) or not isinstance(m, int) or m < 1:
+            raise ValueError("terry_power_mod needs an integer base and a positive modulus")
+        if b == 0:
+            return 1 % m
+        closed_form = self.POWER_MOD_RULES.get(self.mode)
+        if closed_form is not None:
+            return closed_form(a, b, m)
+        # Reducing after every step assumes the rule is compatible with
+        # congruence mod m (true for any integer polynomial rule).
+        if self.properties.associative:
+            return _power_by_squaring(self.terry_multiply, a % m, b, m)
+        result = a % m
+        for _ in range(1, b):
+            result = self.terry_multiply(result, a) % m
+        return result
+
+    def terry_multiply_many(self, a, b):
+        """Apply the active multiply rule elementwise; either operand may be a scalar."""
+        a, b = _batch_operands(a, b)
+        if self.batch_multiply_rule is None:
+            return list(map(self.multiply_rule, a, b))
+        return self.batch_multiply_rule(a, b)
+
+    def terry_add_many(self, a, b):
+        a, b = _batch_operands(a, b)
+        return list(map(operator.add, a, b))
+
+    def terry_subtract_many(self, a, b):
+        a, b = _batch_operands(a, b)
+        return list(map(operator.sub, a, b))
+
+    def terry_divide_many(self, a, b):
+        a, b = _batch_operands(a, b)
+        return list(map(operator.truediv, a, b))
+
+    def terry_power_many(self, a, b):
+        a, b = _batch_operands(a, b)
+        return list(map(self.terry_power, a, b))
+
+    def terry_product(self, values, executor=None, chunk_size=4096):
+        """
+        Fold values with terry_multiply. Associative modes reduce pairwise and,
+        given an executor, in chunks across its workers; other modes keep strict
+        left-to-right order. Chunk results of commutative modes are combined as
+        they complete.
+        """
+        values = list(values)
+        if not values:
+            if self.properties.identity is None:
+                raise ValueError(f"Mode {self.mode} has no identity for an empty product")
+            return self.properties.identity
+        if executor is None or not self.properties.associative or len(values) <= chunk_size:
+            return _fold_products(self, values)
+        futures = [
+            executor.submit(_fold_products, self, values[i:i + chunk_size])
+            for i in range(0, len(values), chunk_size)
+        ]
+        if self.properties.commutative:
+            futures = as_completed(futures)
+        return _fold_products(self, [future.result() for future in futures])
+
+    def terry_dot(self, a, b, executor=None, chunk_size=4096):
+        """
+        Sum of terry_multiply(a[i], b[i]). Products are independent and summed with
+        plain +, so every mode can be split into chunks across the executor's
+        workers if given.
+        """
+        if len(a) != len(b):
+            raise ValueError(f"Batch operands differ in length: {len(a)} != {len(b)}")
+        if executor is None or len(a) <= chunk_size:
+            return _sum_products(self, a, b)
+        futures = [
+            executor.submit(_sum_products, self, a[i:i + chunk_size], b[i:i + chunk_size])
+            for i in range(0, len(a), chunk_size)
+        ]
+        return reduce(operator.add, [future.result() for future in futures])
+
+    def __getstate__(self):
+        # Rules and kernels are rebuilt from the mode name, so engines can be
+        # shipped to process pools (custom modes must be registered there too).
+        return {"mode": self.mode}
+
+    def __setstate__(self, state):
+        self.set_mode(state["mode"])
+
+    @classmethod
+    def register_mode(cls, name, rule, commutative=False, associative=False,
+                      identity=None, template=None, distributive=False):
+        """
+        Register a custom multiply rule under `name`. The declared properties
+        are trusted: associative lets reductions and powers regroup the rule,
+        and distributive lets transform chains collapse matrix products.
+        `template` optionally gives the rule as source (see MULTIPLY_TEMPLATES)
+        so the vector/matrix kernels can inline it.
+        """
+        if name in cls.MODES:
+            raise ValueError(f"Terry Table mode already registered: {name}")
+        cls.MODES[name] = rule
+        cls.MODE_PROPERTIES[name] = TerryModeInfo(commutative, associative, identity, distributive)
+        if template is not None:
+            cls.MULTIPLY_TEMPLATES[name] = template
+
     @staticmethod
     def list_modes():
         return list(TerryMath.MODES.keys())
 
+def _sqrt_length(squared):
+    # Some modes give a negative self dot product; there is no real length then.
+    if squared < 0:
+        raise ValueError(f"Squared length is negative in this mode: {squared!r}")
+    return math.sqrt(squared)
+
+def _add_rows_in_place(matrix, other, scalar):
+    """matrix.data += other.data (times scalar, if given), row by row."""
+    add = matrix.math.terry_add
+    mul = other.math.terry_multiply
+    for row, other_row in zip(matrix.data, other.data):
+        if scalar is None:
+            row[:] = [add(a, b) for a, b in zip(row, other_row)]
+        else:
+            row[:] = [add(a, mul(b, scalar)) for a, b in zip(row, other_row)]
+    return matrix
+
 class TerryVector2:
+    __slots__ = ("x", "y", "math")
+
     def __init__(self, x, y, math_engine=None):
         self.x = x
         self.y = y
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
 
     def __add__(self, other):
         if not isinstance(other, TerryVector2):
@@ -87,20 +575,79 @@ class TerryVector2:
     def dot(self, other):
         if not isinstance(other, TerryVector2):
             raise TypeError("Can only take dot product with another TerryVector2")
-        return self.math.terry_add(
-            self.math.terry_multiply(self.x, other.x),
-            self.math.terry_multiply(self.y, other.y)
+        return self.math.kernels.dot2(self.x, self.y, other.x, other.y)
+
+    def __iadd__(self, other):
+        if not isinstance(other, TerryVector2):
+            raise TypeError("Can only add TerryVector2 to TerryVector2")
+        tm = self.math
+        self.x = tm.terry_add(self.x, other.x)
+        self.y = tm.terry_add(self.y, other.y)
+        return self
+
+    def __isub__(self, other):
+        if not isinstance(other, TerryVector2):
+            raise TypeError("Can only subtract TerryVector2 from TerryVector2")
+        tm = self.math
+        self.x = tm.terry_subtract(self.x, other.x)
+        self.y = tm.terry_subtract(self.y, other.y)
+        return self
+
+    def __imul__(self, scalar):
+        if not isinstance(scalar, (int, float)):
+            raise TypeError("Can only multiply TerryVector2 by a scalar")
+        tm = self.math
+        self.x = tm.terry_multiply(self.x, scalar)
+        self.y = tm.terry_multiply(self.y, scalar)
+        return self
+
+    def add_scaled_(self, other, scalar):
+        """In place: self += other * scalar, without the temporary vector."""
+        if not isinstance(other, TerryVector2):
+            raise TypeError("Can only add TerryVector2 to TerryVector2")
+        tm = self.math
+        mul = other.math.terry_multiply  # other * scalar scales in other's engine
+        self.x = tm.terry_add(self.x, mul(other.x, scalar))
+        self.y = tm.terry_add(self.y, mul(other.y, scalar))
+        return self
+
+    def assign_(self, other):
+        self.x = other.x
+        self.y = other.y
+        return self
+
+    def zero_(self):
+        self.x = 0
+        self.y = 0
+        return self
+
+    def copy(self):
+        return TerryVector2(self.x, self.y, self.math)
+
+    def length(self):
+        return _sqrt_length(self.dot(self))
+
+    def normalize(self):
+        n = self.length()
+        if n == 0:
+            return TerryVector2(0, 0, self.math)
+        return TerryVector2(
+            self.math.terry_divide(self.x, n),
+            self.math.terry_divide(self.y, n),
+            self.math
         )
 
     def __repr__(self):
         return f"TerryVector2({self.x}, {self.y})"
 
 class TerryVector3:
+    __slots__ = ("x", "y", "z", "math")
+
     def __init__(self, x, y, z, math_engine=None):
         self.x = x
         self.y = y
         self.z = z
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
 
     def __add__(self, other):
         if not isinstance(other, TerryVector3):
@@ -135,41 +682,337 @@ class TerryVector3:
     def dot(self, other):
         if not isinstance(other, TerryVector3):
             raise TypeError("Can only take dot product with another TerryVector3")
-        return self.math.terry_add(
-            self.math.terry_add(
-                self.math.terry_multiply(self.x, other.x),
-                self.math.terry_multiply(self.y, other.y)
-            ),
-            self.math.terry_multiply(self.z, other.z)
-        )
+        return self.math.kernels.dot3(self.x, self.y, self.z, other.x, other.y, other.z)
 
     def cross(self, other):
         if not isinstance(other, TerryVector3):
             raise TypeError("Can only take cross product with another TerryVector3")
-        x = self.math.terry_subtract(
-            self.math.terry_multiply(self.y, other.z),
-            self.math.terry_multiply(self.z, other.y)
-        )
-        y = self.math.terry_subtract(
-            self.math.terry_multiply(self.z, other.x),
-            self.math.terry_multiply(self.x, other.z)
-        )
-        z = self.math.terry_subtract(
-            self.math.terry_multiply(self.x, other.y),
-            self.math.terry_multiply(self.y, other.x)
+        x, y, z = self.math.kernels.cross3(
+            self.x, self.y, self.z, other.x, other.y, other.z
         )
         return TerryVector3(x, y, z, self.math)
 
+    def __iadd__(self, other):
+        if not isinstance(other, TerryVector3):
+            raise TypeError("Can only add TerryVector3 to TerryVector3")
+        tm = self.math
+        self.x = tm.terry_add(self.x, other.x)
+        self.y = tm.terry_add(self.y, other.y)
+        self.z = tm.terry_add(self.z, other.z)
+        return self
+
+    def __isub__(self, other):
+        if not isinstance(other, TerryVector3):
+            raise TypeError("Can only subtract TerryVector3 from TerryVector3")
+        tm = self.math
+        self.x = tm.terry_subtract(self.x, other.x)
+        self.y = tm.terry_subtract(self.y, other.y)
+        self.z = tm.terry_subtract(self.z, other.z)
+        return self
+
+    def __imul__(self, scalar):
+        if not isinstance(scalar, (int, float)):
+            raise TypeError("Can only multiply TerryVector3 by a scalar")
+        tm = self.math
+        self.x = tm.terry_multiply(self.x, scalar)
+        self.y = tm.terry_multiply(self.y, scalar)
+        self.z = tm.terry_multiply(self.z, scalar)
+        return self
+
+    def add_scaled_(self, other, scalar):
+        """In place: self += other * scalar, without the temporary vector."""
+        if not isinstance(other, TerryVector3):
+            raise TypeError("Can only add TerryVector3 to TerryVector3")
+        tm = self.math
+        mul = other.math.terry_multiply  # other * scalar scales in other's engine
+        self.x = tm.terry_add(self.x, mul(other.x, scalar))
+        self.y = tm.terry_add(self.y, mul(other.y, scalar))
+        self.z = tm.terry_add(self.z, mul(other.z, scalar))
+        return self
+
+    def assign_(self, other):
+        self.x = other.x
+        self.y = other.y
+        self.z = other.z
+        return self
+
+    def zero_(self):
+        self.x = 0
+        self.y = 0
+        self.z = 0
+        return self
+
+    def copy(self):
+        return TerryVector3(self.x, self.y, self.z, self.math)
+
+    def length(self):
+        return _sqrt_length(self.dot(self))
+
+    def normalize(self):
+        n = self.length()
+        if n == 0:
+            return TerryVector3(0, 0, 0, self.math)
+        return TerryVector3(
+            self.math.terry_divide(self.x, n),
+            self.math.terry_divide(self.y, n),
+            self.math.terry_divide(self.z, n),
+            self.math
+        )
+
     def __repr__(self):
         return f"TerryVector3({self.x}, {self.y}, {self.z})"
 
+class _TerryVectorArray:
+    """
+    Struct-of-arrays storage for many vectors: each component lives in its own
+    contiguous array('d') and bulk operations go through the engine's batch API.
+    """
+
+    __slots__ = ("components", "math")
+
+    _VECTOR = None
+    _VIEW = None
+    _AXES = ()
+
+    def __init__(self, *components, math_engine=None):
+        if len(components) != len(self._AXES):
+            raise TypeError(f"{type(self).__name__} needs {len(self._AXES)} component sequences")
+        self.components = [array("d", c) for c in components]
+        if len({len(c) for c in self.components}) > 1:
+            raise ValueError("Component sequences differ in length")
+        self.math = math_engine or TerryMath.shared()
+
+    @classmethod
+    def zeros(cls, n, math_engine=None):
+        return cls(*([0.0] * n for _ in cls._AXES), math_engine=math_engine)
+
+    @classmethod
+    def from_vectors(cls, vectors, math_engine=None):
+        vectors = list(vectors)
+        if math_engine is None and vectors:
+            math_engine = vectors[0].math
+        return cls(
+            *([getattr(v, axis) for v in vectors] for axis in cls._AXES),
+            math_engine=math_engine
+        )
+
+    def to_vectors(self):
+        return [self._VECTOR(*values, self.math) for values in zip(*self.components)]
+
+    def __len__(self):
+        return len(self.components[0])
+
+    def __getitem__(self, index):
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._VIEW(self, index)
+
+    def __setitem__(self, index, vector):
+        # Exact view type: a TerryVector3View is also a TerryVector2View
+        if not (isinstance(vector, self._VECTOR) or type(vector) is self._VIEW):
+            raise TypeError(f"Can only store {self._VECTOR.__name__} in {type(self).__name__}")
+        for column, axis in zip(self.components, self._AXES):
+            column[index] = getattr(vector, axis)
+
+    def __iter__(self):
+        return (self._VIEW(self, i) for i in range(len(self)))
+
+    def _operand_components(self, other, action):
+        if isinstance(other, type(self)):
+            if len(other) != len(self):
+                raise ValueError(f"{type(self).__name__} lengths differ: {len(self)} != {len(other)}")
+            return other.components
+        if isinstance(other, self._VECTOR):
+            # A single vector broadcasts across the whole array.
+            return [getattr(other, axis) for axis in self._AXES]
+        raise TypeError(
+            f"Can only {action} {type(self).__name__} and {type(self).__name__} or {self._VECTOR.__name__}"
+        )
+
+    def _wrap(self, components):
+        return type(self)(*components, math_engine=self.math)
+
+    def __add__(self, other):
+        tm = self.math
+        others = self._operand_components(other, "add")
+        return self._wrap(tm.terry_add_many(a, b) for a, b in zip(self.components, others))
+
+    def __sub__(self, other):
+        tm = self.math
+        others = self._operand_components(other, "subtract")
+        return self._wrap(tm.terry_subtract_many(a, b) for a, b in zip(self.components, others))
+
+    def __mul__(self, scalar):
+        if not isinstance(scalar, (int, float)):
+            raise TypeError(f"Can only multiply {type(self).__name__} by a scalar")
+        tm = self.math
+        return self._wrap(tm.terry_multiply_many(a, scalar) for a in self.components)
+
+    def _store(self, components):
+        for column, values in zip(self.components, components):
+            column[:] = array("d", values)
+        return self
+
+    def __iadd__(self, other):
+        tm = self.math
+        others = self._operand_components(other, "add")
+        return self._store(tm.terry_add_many(a, b) for a, b in zip(self.components, others))
+
+    def __isub__(self, other):
+        tm = self.math
+        others = self._operand_components(other, "subtract")
+        return self._store(tm.terry_subtract_many(a, b) for a, b in zip(self.components, others))
+
+    def __imul__(self, scalar):
+        if not isinstance(scalar, (int, float)):
+            raise TypeError(f"Can only multiply {type(self).__name__} by a scalar")
+        tm = self.math
+        return self._store(tm.terry_multiply_many(a, scalar) for a in self.components)
+
+    def add_scaled_(self, other, scalar):
+        tm = self.math
+        others = self._operand_components(other, "add")
+        scale = other.math
+        scaled = [
+            scale.terry_multiply(b, scalar) if isinstance(b, (int, float))
+            else scale.terry_multiply_many(b, scalar)
+            for b in others
+        ]
+        return self._store(tm.terry_add_many(a, b) for a, b in zip(self.components, scaled))
+
+    def dot(self, other):
+        """Per-element dot products, summed in the same order as the vector classes."""
+        tm = self.math
+        others = self._operand_components(other, "dot")
+        products = [tm.terry_multiply_many(a, b) for a, b in zip(self.components, others)]
+        return array("d", reduce(tm.terry_add_many, products))
+
+    def lengths(self):
+        return array("d", [_sqrt_length(d) for d in self.dot(self)])
+
+    def normalize(self):
+        norms = self.lengths()
+        return self._wrap(
+            [c / n if n else 0.0 for c, n in zip(column, norms)] for column in self.components
+        )
+
+    def __repr__(self):
+        return f"{type(self).__name__}(n={len(self)}, mode={self.math.mode!r})"
+
+class TerryVector2View:
+    """Live view of one element of a TerryVector2Array."""
+
+    __slots__ = ("array", "index")
+
+    def __init__(self, array, index):
+        self.array = array
+        self.index = index
+
+    @property
+    def x(self):
+        return self.array.components[0][self.index]
+
+    @x.setter
+    def x(self, value):
+        self.array.components[0][self.index] = value
+
+    @property
+    def y(self):
+        return self.array.components[1][self.index]
+
+    @y.setter
+    def y(self, value):
+        self.array.components[1][self.index] = value
+
+    def to_vector(self):
+        return TerryVector2(self.x, self.y, self.array.math)
+
+    def __repr__(self):
+        return f"TerryVector2View({self.x}, {self.y})"
+
+class TerryVector3View(TerryVector2View):
+    """Live view of one element of a TerryVector3Array."""
+
+    __slots__ = ()
+
+    @property
+    def z(self):
+        return self.array.components[2][self.index]
+
+    @z.setter
+    def z(self, value):
+        self.array.components[2][self.index] = value
+
+    def to_vector(self):
+        return TerryVector3(self.x, self.y, self.z, self.array.math)
+
+    def __repr__(self):
+        return f"TerryVector3View({self.x}, {self.y}, {self.z})"
+
+class TerryVector2Array(_TerryVectorArray):
+    __slots__ = ()
+
+    _VECTOR = TerryVector2
+    _VIEW = TerryVector2View
+    _AXES = ("x", "y")
+
+    def __init__(self, xs=(), ys=(), math_engine=None):
+        super().__init__(xs, ys, math_engine=math_engine)
+
+    @property
+    def xs(self):
+        return self.components[0]
+
+    @property
+    def ys(self):
+        return self.components[1]
+
+class TerryVector3Array(_TerryVectorArray):
+    __slots__ = ()
+
+    _VECTOR = TerryVector3
+    _VIEW = TerryVector3View
+    _AXES = ("x", "y", "z")
+
+    def __init__(self, xs=(), ys=(), zs=(), math_engine=None):
+        super().__init__(xs, ys, zs, math_engine=math_engine)
+
+    @property
+    def xs(self):
+        return self.components[0]
+
+    @property
+    def ys(self):
+        return self.components[1]
+
+    @property
+    def zs(self):
+        return self.components[2]
+
+    def cross(self, other):
+        tm = self.math
+        ax, ay, az = self.components
+        bx, by, bz = self._operand_components(other, "cross")
+        mul = tm.terry_multiply_many
+        sub = tm.terry_subtract_many
+        return self._wrap([
+            sub(mul(ay, bz), mul(az, by)),
+            sub(mul(az, bx), mul(ax, bz)),
+            sub(mul(ax, by), mul(ay, bx)),
+        ])
+
 class TerryMatrix2x2:
+    __slots__ = ("data", "math")
+
     def __init__(self, a11, a12, a21, a22, math_engine=None):
         self.data = [
             [a11, a12],
             [a21, a22]
         ]
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
 
     def __add__(self, other):
         if not isinstance(other, TerryMatrix2x2):
@@ -184,40 +1027,34 @@ class TerryMatrix2x2:
 
     def __mul__(self, other):
         if isinstance(other, TerryMatrix2x2):
-            m = self
-            n = other
-            return TerryMatrix2x2(
-                self.math.terry_add(
-                    self.math.terry_multiply(m.data[0][0], n.data[0][0]),
-                    self.math.terry_multiply(m.data[0][1], n.data[1][0])
-                ),
-                self.math.terry_add(
-                    self.math.terry_multiply(m.data[0][0], n.data[0][1]),
-                    self.math.terry_multiply(m.data[0][1], n.data[1][1])
-                ),
-                self.math.terry_add(
-                    self.math.terry_multiply(m.data[1][0], n.data[0][0]),
-                    self.math.terry_multiply(m.data[1][1], n.data[1][0])
-                ),
-                self.math.terry_add(
-                    self.math.terry_multiply(m.data[1][0], n.data[0][1]),
-                    self.math.terry_multiply(m.data[1][1], n.data[1][1])
-                ),
-                self.math
-            )
+            (a11, a12), (a21, a22) = self.math.kernels.matmul2(self.data, other.data)
+            return TerryMatrix2x2(a11, a12, a21, a22, self.math)
         elif isinstance(other, TerryVector2):
-            x = self.math.terry_add(
-                self.math.terry_multiply(self.data[0][0], other.x),
-                self.math.terry_multiply(self.data[0][1], other.y)
-            )
-            y = self.math.terry_add(
-                self.math.terry_multiply(self.data[1][0], other.x),
-                self.math.terry_multiply(self.data[1][1], other.y)
-            )
+            x, y = self.math.kernels.matvec2(self.data, other.x, other.y)
             return TerryVector2(x, y, self.math)
         else:
             raise TypeError("Unsupported multiplication for TerryMatrix2x2")
 
+    def __iadd__(self, other):
+        if not isinstance(other, TerryMatrix2x2):
+            raise TypeError("Can only add TerryMatrix2x2 to TerryMatrix2x2")
+        return _add_rows_in_place(self, other, None)
+
+    def __imul__(self, other):
+        if not isinstance(other, TerryMatrix2x2):
+            raise TypeError("Unsupported in-place multiplication for TerryMatrix2x2")
+        self.data[:] = self.math.kernels.matmul2(self.data, other.data)
+        return self
+
+    def add_scaled_(self, other, scalar):
+        if not isinstance(other, TerryMatrix2x2):
+            raise TypeError("Can only add TerryMatrix2x2 to TerryMatrix2x2")
+        return _add_rows_in_place(self, other, scalar)
+
+    def copy(self):
+        (a11, a12), (a21, a22) = self.data
+        return TerryMatrix2x2(a11, a12, a21, a22, self.math)
+
     def determinant(self):
         a = self.math.terry_multiply(self.data[0][0], self.data[1][1])
         b = self.math.terry_multiply(self.data[0][1], self.data[1][0])
@@ -242,11 +1079,39 @@ class TerryMatrix2x2:
     def __repr__(self):
         return f"TerryMatrix2x2({self.data[0][0]}, {self.data[0][1]}, {self.data[1][0]}, {self.data[1][1]})"
 
+def _inverse3x3(m, tm):
+    """Adjugate inverse as rows, or None if the determinant is 0."""
+    mul, sub, add = tm.terry_multiply, tm.terry_subtract, tm.terry_add
+    (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = m
+    # 2x2 minors; row 0's also give the determinant
+    n00 = sub(mul(m11, m22), mul(m12, m21))
+    n01 = sub(mul(m10, m22), mul(m12, m20))
+    n02 = sub(mul(m10, m21), mul(m11, m20))
+    det = add(sub(mul(m00, n00), mul(m01, n01)), mul(m02, n02))
+    if det == 0:
+        return None
+    n10 = sub(mul(m01, m22), mul(m02, m21))
+    n11 = sub(mul(m00, m22), mul(m02, m20))
+    n12 = sub(mul(m00, m21), mul(m01, m20))
+    n20 = sub(mul(m01, m12), mul(m02, m11))
+    n21 = sub(mul(m00, m12), mul(m02, m10))
+    n22 = sub(mul(m00, m11), mul(m01, m10))
+    inv_det = tm.terry_divide(1, det)
+    # Transposed cofactors (sign applied through the multiply rule, as before)
+    return [
+        [mul(mul(1, n00), inv_det), mul(mul(-1, n10), inv_det), mul(mul(1, n20), inv_det)],
+        [mul(mul(-1, n01), inv_det), mul(mul(1, n11), inv_det), mul(mul(-1, n21), inv_det)],
+        [mul(mul(1, n02), inv_det), mul(mul(-1, n12), inv_det), mul(mul(1, n22), inv_det)],
+    ]
+
+
 class TerryMatrix3x3:
+    __slots__ = ("data", "math")
+
     def __init__(self, rows, math_engine=None):
         assert len(rows) == 3 and all(len(row) == 3 for row in rows)
         self.data = [list(row) for row in rows]
-        self.math = math_engine or TerryMath()
+        self.math = math_engine or TerryMath.shared()
 
     def __add__(self, other):
         if not isinstance(other, TerryMatrix3x3):
@@ -261,20 +1126,29 @@ class TerryMatrix3x3:
 
     def __mul__(self, other):
         if isinstance(other, TerryMatrix3x3):
-            result = [[0]*3 for _ in range(3)]
-            for i in range(3):
-                for j in range(3):
-                    result[i][j] = self.math.terry_add(
-                        self.math.terry_add(
-                            self.math.terry_multiply(self.data[i][0], other.data[0][j]),
-                            self.math.terry_multiply(self.data[i][1], other.data[1][j])
-                        ),
-                        self.math.terry_multiply(self.data[i][2], other.data[2][j])
-                    )
-            return TerryMatrix3x3(result, self.math)
+            return TerryMatrix3x3(self.math.kernels.matmul3(self.data, other.data), self.math)
         else:
             raise TypeError("Unsupported multiplication for TerryMatrix3x3")
 
+    def __iadd__(self, other):
+        if not isinstance(other, TerryMatrix3x3):
+            raise TypeError("Can only add TerryMatrix3x3 to TerryMatrix3x3")
+        return _add_rows_in_place(self, other, None)
+
+    def __imul__(self, other):
+        if not isinstance(other, TerryMatrix3x3):
+            raise TypeError("Unsupported in-place multiplication for TerryMatrix3x3")
+        self.data[:] = self.math.kernels.matmul3(self.data, other.data)
+        return self
+
+    def add_scaled_(self, other, scalar):
+        if not isinstance(other, TerryMatrix3x3):
+            raise TypeError("Can only add TerryMatrix3x3 to TerryMatrix3x3")
+        return _add_rows_in_place(self, other, scalar)
+
+    def copy(self):
+        return TerryMatrix3x3(self.data, self.math)
+
     def determinant(self):
         m = self.data
         tm = self.math
@@ -296,40 +1170,28 @@ class TerryMatrix3x3:
         )
 
     def inverse(self):
-        det = self.determinant()
-        if det == 0:
+        inverse = _inverse3x3(self.data, self.math)
+        if inverse is None:
             raise ValueError("Matrix is singular and cannot be inverted (det=0).")
-        tm = self.math
-        m = self.data
+        return TerryMatrix3x3(inverse, self.math)
 
-        def minor(i, j):
-            return [
-                [m[x][y] for y in range(3) if y != j]
-                for x in range(3) if x != i
-            ]
-        def det2x2(sub):
-            return tm.terry_subtract(
-                tm.terry_multiply(sub[0][0], sub[1][1]),
-                tm.terry_multiply(sub[0][1], sub[1][0])
-            )
-
-        cofactors = []
-        for i in range(3):
-            row = []
-            for j in range(3):
-                sign = (-1) ** (i + j)
-                minor_det = det2x2(minor(i, j))
-                row.append(tm.terry_multiply(sign, minor_det))
-            cofactors.append(row)
-
-        adjugate = [[cofactors[j][i] for j in range(3)] for i in range(3)]
-
-        inv_det = tm.terry_divide(1, det)
-        inverse = [
-            [tm.terry_multiply(adjugate[i][j], inv_det) for j in range(3)]
-            for i in range(3)
-        ]
-        return TerryMatrix3x3(inverse, tm)
+    @staticmethod
+    def inverse_many(matrices):
+        """
+        Invert a batch of TerryMatrix3x3 without raising mid-batch.
+        Returns (inverses, singular): inverses[i] is None for each singular
+        matrix, and singular lists their indices.
+        """
+        inverses = []
+        singular = []
+        for index, matrix in enumerate(matrices):
+            inverse = _inverse3x3(matrix.data, matrix.math)
+            if inverse is None:
+                singular.append(index)
+                inverses.append(None)
+            else:
+                inverses.append(TerryMatrix3x3(inverse, matrix.math))
+        return inverses, singular
 
     def __repr__(self):
         return f"TerryMatrix3x3({self.data[0]}, {self.data[1]}, {self.data[2]})"
@@ -4,8 +4,9 @@ from terrylinalg import TerryQuaternion
 class TerryBody:
     def __init__(self, position, velocity, mass, math_engine=None, is_static=False):
         self.math = math_engine or TerryMath()
-        self.position = position  # TerryVector2 or TerryVector3
-        self.velocity = velocity  # TerryVector2 or TerryVector3
+        # Copied because integration updates them in place.
+        self.position = position.copy()  # TerryVector2 or TerryVector3
+        self.velocity = velocity.copy()  # TerryVector2 or TerryVector3
         self.mass = mass
         self.force_accum = self.zero_vector()
         self.is_static = is_static
@@ -17,23 +18,29 @@ class TerryBody:
             return TerryVector2(0, 0, self.math)
 
     def apply_force(self, force):
-        self.force_accum = self.force_accum + force
+        self.force_accum += force
+
+    def apply_scaled_force(self, force, scale):
+        """Accumulate force * scale without building the scaled vector."""
+        self.force_accum.add_scaled_(force, scale)
 
     def apply_impulse(self, impulse):
         if not self.is_static:
-            self.velocity = self.velocity + (impulse * self.math.terry_divide(1, self.mass))
+            self.velocity.add_scaled_(impulse, self.math.terry_divide(1, self.mass))
 
     def integrate(self, dt, friction=0.0):
         if self.is_static:
             return
         # Newton's Second Law: F = m * a => a = F / m
-        acceleration = self.force_accum * self.math.terry_divide(1, self.mass)
-        self.velocity = self.velocity + (acceleration * dt)
+        # The accumulator is cleared below, so it holds the acceleration in place.
+        acceleration = self.force_accum
+        acceleration *= self.math.terry_divide(1, self.mass)
+        self.velocity.add_scaled_(acceleration, dt)
         # Apply friction (simple model)
         if friction > 0.0:
-            self.velocity = self.velocity * (1 - friction)
-        self.position = self.position + (self.velocity * dt)
-        self.force_accum = self.zero_vector()
+            self.velocity *= (1 - friction)
+        self.position.add_scaled_(self.velocity, dt)
+        self.force_accum.zero_()
 
     def momentum(self):
         """Linear momentum: p = m * v"""
@@ -64,15 +71,23 @@ class TerryWorld:
         self.bodies = []
         self.gravity = gravity  # TerryVector2 or TerryVector3 or None
         self.friction = friction
+        self._scratch = {}  # reusable vector per (vector type, engine), see _scratch_vector
 
     def add_body(self, body):
         self.bodies.append(body)
 
+    def _scratch_vector(self, like):
+        key = (type(like), like.math)
+        vector = self._scratch.get(key)
+        if vector is None:
+            vector = self._scratch[key] = like.copy()
+        return vector
+
     def apply_gravity(self):
         if self.gravity is not None:
             for body in self.bodies:
                 if not body.is_static:
-                    body.apply_force(self.gravity * body.mass)
+                    body.apply_scaled_force(self.gravity, body.mass)
 
     def apply_newtonian_gravity(self, G=1.0):
         # Universal gravitation: F = G * m1 * m2 / r^2
@@ -83,7 +98,8 @@ class TerryWorld:
                 b = self.bodies[j]
                 if a.is_static and b.is_static:
                     continue
-                r_vec = b.position - a.position
+                r_vec = self._scratch_vector(b.position).assign_(b.position)
+                r_vec -= a.position
                 r2 = r_vec.dot(r_vec)
                 if r2 == 0:
                     continue  # Avoid division by zero
@@ -91,12 +107,13 @@ class TerryWorld:
                     self.math.terry_multiply(G, self.math.terry_multiply(a.mass, b.mass)),
                     r2
                 )
-                # Direction: normalized r_vec
+                # Direction: normalized r_vec, scaled in place into the force
                 r_len = r2 ** 0.5
-                direction = r_vec * (1.0 / r_len)
-                force = direction * force_mag
+                force = r_vec
+                force *= (1.0 / r_len)
+                force *= force_mag
                 a.apply_force(force)
-                b.apply_force(force * -1)  # Newton's Third Law
+                b.apply_scaled_force(force, -1)  # Newton's Third Law
 
     def step(self, dt):
         # Newton's First Law: If no force, velocity stays the same
@@ -142,9 +159,12 @@ class TerryRigidBody(TerryBody):
     ):
         super().__init__(position, velocity, mass, math_engine, is_static)
         tm = self.math
-        self.orientation = orientation or TerryQuaternion(1, 0, 0, 0, tm)
-        self.angular_velocity = angular_velocity or TerryVector3(0, 0, 0, tm)
+        self.orientation = orientation.copy() if orientation else TerryQuaternion(1, 0, 0, 0, tm)
+        self.angular_velocity = angular_velocity.copy() if angular_velocity else TerryVector3(0, 0, 0, tm)
         self.torque_accum = TerryVector3(0, 0, 0, tm)
+        # Scratch quaternions for the allocation-free orientation update.
+        self._spin = TerryQuaternion(1, 0, 0, 0, tm)
+        self._omega = TerryQuaternion(0, 0, 0, 0, tm)
         self._inertia = inertia
         self.collision_shape = collision_shape
         self.sleeping = False  # <-- Add this line
@@ -186,7 +206,7 @@ class TerryRigidBody(TerryBody):
         """
         Apply a torque (TerryVector3) to the rigid body.
         """
-        self.torque_accum = self.torque_accum + torque
+        self.torque_accum += torque
 
     def integrate(self, dt, friction=0.0, angular_friction=0.0, auto_sleep=True, linear_threshold=1e-5, angular_threshold=1e-5):
         """
@@ -200,21 +220,29 @@ class TerryRigidBody(TerryBody):
         super().integrate(dt, friction)
         # Angular motion (Terry's Law)
         tm = self.math
-        angular_acc = self.torque_accum * tm.terry_divide(1, self.inertia)
-        self.angular_velocity = self.angular_velocity + (angular_acc * dt)
+        angular_acc = self.torque_accum  # cleared below, so scaled in place
+        angular_acc *= tm.terry_divide(1, self.inertia)
+        self.angular_velocity.add_scaled_(angular_acc, dt)
         if angular_friction > 0.0:
-            self.angular_velocity = self.angular_velocity * (1 - angular_friction)
-        # Update orientation using quaternion derivative
-        dq = self.orientation_derivative()
-        self.orientation = TerryQuaternion(
-            self.orientation.w + dq.w * dt,
-            self.orientation.x + dq.x * dt,
-            self.orientation.y + dq.y * dt,
-            self.orientation.z + dq.z * dt,
-            tm
-        ).normalize()
+            self.angular_velocity *= (1 - angular_friction)
+        # Update orientation using quaternion derivative: q += 0.5 * (q * omega) * dt.
+        # The product follows q's engine; the step itself is plain float arithmetic
+        # and the result is normalized in the body's engine.
+        omega = self.angular_velocity
+        q = self.orientation
+        spin = self._spin.assign_(q)
+        spin.math = q.math
+        spin *= self._omega.set_(0, omega.x, omega.y, omega.z)
+        q.set_(
+            q.w + (0.5 * spin.w) * dt,
+            q.x + (0.5 * spin.x) * dt,
+            q.y + (0.5 * spin.y) * dt,
+            q.z + (0.5 * spin.z) * dt
+        )
+        q.math = tm
+        q.normalize_()
         # Reset torque accumulator
-        self.torque_accum = TerryVector3(0, 0, 0, tm)
+        self.torque_accum.zero_()
         # Auto-sleep logic
         if auto_sleep:
             if (self.velocity.dot(self.velocity) < linear_threshold**2 and
@@ -244,11 +272,12 @@ class TerryRigidBody(TerryBody):
         """
         Return a dictionary representing the current state of the rigid body.
         """
+        # Copies, since integration mutates the live vectors in place.
         return {
-            "position": self.position,
-            "velocity": self.velocity,
-            "orientation": self.orientation,
-            "angular_velocity": self.angular_velocity,
+            "position": self.position.copy(),
+            "velocity": self.velocity.copy(),
+            "orientation": self.orientation.copy(),
+            "angular_velocity": self.angular_velocity.copy(),
             "mass": self.mass,
             "inertia": self.inertia,
             "sleeping": self.sleeping,
@@ -259,10 +288,10 @@ class TerryRigidBody(TerryBody):
         """
         Set the state of the rigid body from a dictionary (as produced by get_state).
         """
-        self.position = state.get("position", self.position)
-        self.velocity = state.get("velocity", self.velocity)
-        self.orientation = state.get("orientation", self.orientation)
-        self.angular_velocity = state.get("angular_velocity", self.angular_velocity)
+        self.position = state.get("position", self.position).copy()
+        self.velocity = state.get("velocity", self.velocity).copy()
+        self.orientation = state.get("orientation", self.orientation).copy()
+        self.angular_velocity = state.get("angular_velocity", self.angular_velocity).copy()
         self.mass = state.get("mass", self.mass)
         self.inertia = state.get("inertia", self.inertia)
         self.sleeping = state.get("sleeping", self.sleeping)
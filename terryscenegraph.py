@@ -0,0 +1,149 @@
+from array import array
+from terrymath import TerryMath
+from terrylinalg import TerryMatrix4x4, TerryQuaternion
+
+# Transform hierarchy for TerryMath scenes.
+# Each node keeps a local TerryMatrix4x4 and a cached world matrix. Changing a
+# local transform marks only that node's subtree dirty and flags its ancestors
+# as having dirty descendants. World matrices are recomputed (parent world *
+# local, in the node's engine) the next time they are read, and update()
+# descends only into flagged subtrees, so clean subtrees are never touched.
+
+
+class TerrySceneNode:
+    __slots__ = ("name", "parent", "children", "_local", "_world", "_dirty", "_dirty_below", "math")
+
+    def __init__(self, name=None, local=None, math_engine=None):
+        self.math = math_engine or (local.math if local is not None else TerryMath.shared())
+        self.name = name
+        self.parent = None
+        self.children = []
+        self._local = local.copy() if local is not None else TerryMatrix4x4.identity(self.math)
+        self._world = None
+        self._dirty = True
+        self._dirty_below = False
+
+    @property
+    def local(self):
+        return self._local
+
+    def set_local(self, matrix):
+        if not isinstance(matrix, TerryMatrix4x4):
+            raise TypeError("Local transform must be a TerryMatrix4x4")
+        self._local = matrix.copy()
+        self.mark_dirty()
+
+    def set_rotation(self, rotation, translation=None):
+        """Set the local transform from a TerryQuaternion and an optional TerryVector3 translation."""
+        if not isinstance(rotation, TerryQuaternion):
+            raise TypeError("Rotation must be a TerryQuaternion")
+        if rotation.math is not self.math:
+            rotation = TerryQuaternion(rotation.w, rotation.x, rotation.y, rotation.z, self.math)
+        local = rotation.to_matrix4()
+        if translation is not None:
+            local.data[0][3] = translation.x
+            local.data[1][3] = translation.y
+            local.data[2][3] = translation.z
+        self._local = local
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """Flag this subtree for recomputation; call after editing local.data in place."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._dirty and node is not self:
+                # Its whole subtree is already dirty
+                continue
+            node._dirty = True
+            stack.extend(node.children)
+        node = self.parent
+        while node is not None and not node._dirty_below:
+            node._dirty_below = True
+            node = node.parent
+
+    def add_child(self, child):
+        if not isinstance(child, TerrySceneNode):
+            raise TypeError("Can only add TerrySceneNode children")
+        node = self
+        while node is not None:
+            if node is child:
+                raise ValueError("Adding this child would create a cycle")
+            node = node.parent
+        if child.parent is not None:
+            child.parent.remove_child(child)
+        child.parent = self
+        self.children.append(child)
+        child.mark_dirty()
+        return child
+
+    def remove_child(self, child):
+        self.children.remove(child)
+        child.parent = None
+        child.mark_dirty()
+
+    @property
+    def world(self):
+        if self._dirty:
+            # Walk up to the highest dirty ancestor and refresh downwards from there
+            top = self
+            while top.parent is not None and top.parent._dirty:
+                top = top.parent
+            chain = []
+            node = self
+            while node is not top:
+                chain.append(node)
+                node = node.parent
+            chain.append(top)
+            for node in reversed(chain):
+                node._refresh()
+        return self._world
+
+    def _refresh(self):
+        if self.parent is None:
+            self._world = TerryMatrix4x4(self._local.data, self.math)
+        else:
+            product = self.math.kernels.matmul4(self.parent._world.data, self._local.data)
+            self._world = TerryMatrix4x4(product, self.math)
+        self._dirty = False
+        # A changed world matrix leaves every child dirty
+        self._dirty_below = bool(self.children)
+
+    def update(self):
+        """Recompute every dirty world matrix below this node in one top-down pass."""
+        self.world  # refreshes this node and any dirty ancestors
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._dirty:
+                node._refresh()
+            if node._dirty_below:
+                node._dirty_below = False
+                stack.extend(reversed(node.children))
+
+    def walk(self):
+        """Nodes of this subtree in depth-first pre-order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def flatten_world(self, out=None):
+        """
+        World matrices of this subtree, in walk() order, as one contiguous
+        array('d') of 16 row-major values per node. out is reused when given.
+        """
+        self.update()
+        nodes = list(self.walk())
+        size = 16 * len(nodes)
+        if out is None:
+            out = array("d", bytes(8 * size))
+        elif len(out) != size:
+            raise ValueError(f"Output buffer holds {len(out)} values, expected {size}")
+        for k, node in enumerate(nodes):
+            out[16 * k:16 * (k + 1)] = array("d", node._world.to_flat_list())
+        return out
+
+    def __repr__(self):
+        return f"TerrySceneNode({self.name!r}, children={len(self.children)})"
@@ -0,0 +1,645 @@
+import heapq
+import math
+from collections import namedtuple
+from terrymath import TerryMath, TerryVector3Array
+from terrygeometry import TerryPlane, TerrySphere, TerryBox, TerryTriangle, TerryMesh, _ray_triangle
+
+# Spatial acceleration structures for TerryGeometry.
+# Culling (bounding boxes, cell lookups, splitting planes) works on plain
+# coordinates, like TerryBox.intersect_ray, while every exact hit, containment
+# or distance test still goes through the TerryMath kernels. Plain bounds only
+# enclose what those tests can reach in some modes, so TerryBVH and TerryScene
+# cull in a_times_b only and TerryKDTree prunes in a_times_b and terry_original;
+# other modes test everything, and answers match the per-primitive methods.
+# TerrySpatialHash point queries are instead defined as bounds plus exact test.
+
+TerryRayHit = namedtuple("TerryRayHit", ["index", "t", "u", "v"])
+
+_INF = float("inf")
+
+
+def _slab(bounds, origin, inverse, t_max):
+    """Entry distance of a ray into an AABB (min xyz, max xyz), or None if it misses before t_max."""
+    t_min = 0.0
+    for axis in range(3):
+        o = origin[axis]
+        lo, hi = bounds[axis], bounds[axis + 3]
+        inv = inverse[axis]
+        if inv is None:
+            # Parallel to this slab: inside it or never
+            if o < lo or o > hi:
+                return None
+            continue
+        t0 = (lo - o) * inv
+        t1 = (hi - o) * inv
+        if t0 > t1:
+            t0, t1 = t1, t0
+        if t0 > t_min:
+            t_min = t0
+        if t1 < t_max:
+            t_max = t1
+        if t_min > t_max:
+            return None
+    return t_min
+
+
+def _culls(tm):
+    """Whether plain-coordinate bounds enclose every hit of tm's exact tests."""
+    return tm.mode == "a_times_b"
+
+
+def _enter(bounds, origin, inverse, t_max):
+    """Stand-in for _slab where bounds cannot cull: every box is entered at 0."""
+    return 0.0
+
+
+def _plane_prunes(tm):
+    """
+    Whether a k-d splitting plane at plain distance d bounds tm's squared
+    distances from below by d * d: true when every Terry square is at least the
+    plain one (terry_original only turns 1 x 1 into 2).
+    """
+    return tm.mode in ("a_times_b", "terry_original")
+
+
+def _ray_setup(ray):
+    o, d = ray.origin, ray.direction
+    origin = (o.x, o.y, o.z)
+    direction = (d.x, d.y, d.z)
+    inverse = tuple(1.0 / c if c != 0 else None for c in direction)
+    return origin, direction, inverse
+
+
+class TerryBVH:
+    """
+    Bounding volume hierarchy over TerryTriangles (or a TerryMesh), built with a binned
+    surface-area heuristic. Nodes live in one flat list; each node is
+    [min x, min y, min z, max x, max y, max z, left, right, start, count],
+    with count > 0 marking a leaf over order[start:start + count].
+    Call refit() after moving vertices; the tree shape is kept. Outside
+    a_times_b the node bounds do not cull and every triangle is tested.
+    """
+
+    __slots__ = ("triangles", "leaf_size", "math", "order", "nodes")
+
+    BINS = 12
+
+    def __init__(self, triangles, leaf_size=4, math_engine=None):
+        if isinstance(triangles, TerryMesh):
+            triangles = triangles.triangles()
+        self.triangles = list(triangles)
+        if not self.triangles:
+            raise ValueError("TerryBVH needs at least one triangle")
+        if leaf_size < 1:
+            raise ValueError(f"leaf_size must be positive, got {leaf_size}")
+        self.leaf_size = leaf_size
+        self.math = math_engine or self.triangles[0].math
+        self.order = list(range(len(self.triangles)))
+        self.nodes = []
+        self._build()
+
+    def _triangle_bounds(self):
+        result = []
+        for tri in self.triangles:
+            a, b, c = tri.v0, tri.v1, tri.v2
+            result.append((
+                min(a.x, b.x, c.x), min(a.y, b.y, c.y), min(a.z, b.z, c.z),
+                max(a.x, b.x, c.x), max(a.y, b.y, c.y), max(a.z, b.z, c.z),
+            ))
+        return result
+
+    @staticmethod
+    def _union(boxes):
+        boxes = list(boxes)
+        return [min(b[0] for b in boxes), min(b[1] for b in boxes), min(b[2] for b in boxes),
+                max(b[3] for b in boxes), max(b[4] for b in boxes), max(b[5] for b in boxes)]
+
+    @staticmethod
+    def _area(box):
+        dx, dy, dz = box[3] - box[0], box[4] - box[1], box[5] - box[2]
+        return 2.0 * (dx * dy + dy * dz + dz * dx)
+
+    def _build(self):
+        boxes = self._triangle_bounds()
+        centroids = [((b[0] + b[3]) * 0.5, (b[1] + b[4]) * 0.5, (b[2] + b[5]) * 0.5) for b in boxes]
+        order = self.order
+        nodes = self.nodes
+        nodes.append(None)
+        stack = [(0, 0, len(order))]
+        while stack:
+            index, start, end = stack.pop()
+            items = order[start:end]
+            box = self._union(boxes[i] for i in items)
+            split = self._split(items, boxes, centroids, box) if len(items) > self.leaf_size else None
+            if split is None:
+                nodes[index] = box + [-1, -1, start, len(items)]
+                continue
+            axis, bin_of, best_bin = split
+            left_items = [i for i in items if bin_of(centroids[i][axis]) < best_bin]
+            right_items = [i for i in items if bin_of(centroids[i][axis]) >= best_bin]
+            order[start:end] = left_items + right_items
+            middle = start + len(left_items)
+            left, right = len(nodes), len(nodes) + 1
+            nodes.extend((None, None))
+            nodes[index] = box + [left, right, start, 0]
+            stack.append((right, middle, end))
+            stack.append((left, start, middle))
+
+    def _split(self, items, boxes, centroids, box):
+        """(axis, bin_of, split_bin) of the cheapest binned SAH split, or None if a leaf is cheaper."""
+        lows = [min(centroids[i][a] for i in items) for a in range(3)]
+        highs = [max(centroids[i][a] for i in items) for a in range(3)]
+        axis = max(range(3), key=lambda a: highs[a] - lows[a])
+        extent = highs[axis] - lows[axis]
+        parent_area = self._area(box)
+        if extent <= 0 or parent_area <= 0:
+            return None
+        bins = self.BINS
+        low, scale = lows[axis], bins / extent
+
+        def bin_of(c):
+            return min(int((c - low) * scale), bins - 1)
+
+        counts = [0] * bins
+        bin_boxes = [None] * bins
+        for i in items:
+            b = bin_of(centroids[i][axis])
+            counts[b] += 1
+            bin_boxes[b] = boxes[i] if bin_boxes[b] is None else self._union((bin_boxes[b], boxes[i]))
+        best_cost, best_bin = len(items), None
+        for split in range(1, bins):
+            left = [bb for bb in bin_boxes[:split] if bb is not None]
+            right = [bb for bb in bin_boxes[split:] if bb is not None]
+            if not left or not right:
+                continue
+            n_left = sum(counts[:split])
+            cost = 1.0 + (self._area(self._union(left)) * n_left
+                          + self._area(self._union(right)) * (len(items) - n_left)) / parent_area
+            if cost < best_cost:
+                best_cost, best_bin = cost, split
+        if best_bin is None:
+            return None
+        return axis, bin_of, best_bin
+
+    def refit(self):
+        """Recompute node bounds bottom-up from the triangles' current vertices."""
+        boxes = self._triangle_bounds()
+        nodes = self.nodes
+        order = self.order
+        # Children are always stored after their parent
+        for node in reversed(nodes):
+            if node[9]:
+                box = self._union(boxes[i] for i in order[node[8]:node[8] + node[9]])
+            else:
+                box = self._union((nodes[node[6]], nodes[node[7]]))
+            node[:6] = box
+
+    def _traverse(self, ray, t_max, any_hit):
+        origin, direction, inverse = _ray_setup(ray)
+        ox, oy, oz = origin
+        dx, dy, dz = direction
+        kernels = self.math.kernels
+        nodes = self.nodes
+        order = self.order
+        triangles = self.triangles
+        best = None
+        slab = _slab if _culls(self.math) else _enter
+        entry = slab(nodes[0], origin, inverse, t_max)
+        stack = [(entry, 0)] if entry is not None else []
+        while stack:
+            entry, index = stack.pop()
+            if entry > t_max:
+                continue
+            node = nodes[index]
+            count = node[9]
+            if not count:
+                children = []
+                for child in (node[6], node[7]):
+                    child_entry = slab(nodes[child], origin, inverse, t_max)
+                    if child_entry is not None:
+                        children.append((child_entry, child))
+                # Nearer child on top of the stack
+                children.sort(reverse=True)
+                stack.extend(children)
+                continue
+            for i in order[node[8]:node[8] + count]:
+                tri = triangles[i]
+                a, b, c = tri.v0, tri.v1, tri.v2
+                hit = _ray_triangle(kernels, ox, oy, oz, dx, dy, dz,
+                                    a.x, a.y, a.z, b.x, b.y, b.z, c.x, c.y, c.z)
+                if hit is not None and hit[0] < t_max:
+                    best = TerryRayHit(i, *hit)
+                    if any_hit:
+                        return best
+                    t_max = hit[0]
+        return best
+
+    def intersect(self, ray, max_distance=_INF):
+        """Nearest hit as TerryRayHit(index, t, u, v), or None."""
+        return self._traverse(ray, max_distance, False)
+
+    def intersect_any(self, ray, max_distance=_INF):
+        """Any hit closer than max_distance (e.g. for shadow rays), or None."""
+        return self._traverse(ray, max_distance, True)
+
+    def __len__(self):
+        return len(self.triangles)
+
+    def __repr__(self):
+        return f"TerryBVH({len(self.triangles)} triangles, {len(self.nodes)} nodes)"
+
+
+class TerrySpatialHash:
+    """
+    Uniform grid over primitive bounds (anything with bounds() returning a
+    TerryBox, such as TerrySphere, TerryBox and TerryTriangle). Each primitive is
+    bucketed in every cell its bounds touch; point and box queries only visit
+    the cells they cover, so a point query reports a primitive only when its
+    bounds contain the point as well as its exact test. The grid itself works
+    on plain coordinates; exact tests run in each primitive's own engine.
+    """
+
+    __slots__ = ("cell_size", "_cells", "_items", "_next_key")
+
+    def __init__(self, cell_size):
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = cell_size
+        self._cells = {}
+        self._items = {}
+        self._next_key = 0
+
+    def _cell(self, x, y, z):
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(y / size), math.floor(z / size))
+
+    def _entry(self, primitive):
+        """(primitive, bounds as min xyz + max xyz, (low cell, high cell))."""
+        box = primitive.bounds()
+        lo, hi = box.min_corner, box.max_corner
+        bounds = (lo.x, lo.y, lo.z, hi.x, hi.y, hi.z)
+        return primitive, bounds, (self._cell(lo.x, lo.y, lo.z), self._cell(hi.x, hi.y, hi.z))
+
+    @staticmethod
+    def _cells_in(low, high):
+        for i in range(low[0], high[0] + 1):
+            for j in range(low[1], high[1] + 1):
+                for k in range(low[2], high[2] + 1):
+                    yield (i, j, k)
+
+    def _link(self, key, cell_range):
+        cells = self._cells
+        for cell in self._cells_in(*cell_range):
+            bucket = cells.get(cell)
+            if bucket is None:
+                bucket = cells[cell] = set()
+            bucket.add(key)
+
+    def _unlink(self, key, cell_range):
+        cells = self._cells
+        for cell in self._cells_in(*cell_range):
+            bucket = cells[cell]
+            bucket.discard(key)
+            if not bucket:
+                del cells[cell]
+
+    def insert(self, primitive):
+        """Add a primitive; returns the key used by remove, move and queries."""
+        key = self._next_key
+        self._next_key += 1
+        entry = self._items[key] = self._entry(primitive)
+        self._link(key, entry[2])
+        return key
+
+    def remove(self, key):
+        primitive, _, cell_range = self._items.pop(key)
+        self._unlink(key, cell_range)
+        return primitive
+
+    def move(self, key, primitive=None):
+        """Re-bucket a primitive after it moved (or replace it); only changed cells are touched."""
+        old, _, cell_range = self._items[key]
+        entry = self._items[key] = self._entry(primitive if primitive is not None else old)
+        if entry[2] != cell_range:
+            self._unlink(key, cell_range)
+            self._link(key, entry[2])
+
+    def get(self, key):
+        return self._items[key][0]
+
+    def query_point(self, pt):
+        """Sorted keys of the primitives whose bounds contain pt and whose contains_point(pt) is true."""
+        x, y, z = pt.x, pt.y, pt.z
+        bucket = self._cells.get(self._cell(x, y, z), ())
+        items = self._items
+        result = []
+        for key in bucket:
+            primitive, b, _ = items[key]
+            if (b[0] <= x <= b[3] and b[1] <= y <= b[4] and b[2] <= z <= b[5]
+                    and primitive.contains_point(pt)):
+                result.append(key)
+        return sorted(result)
+
+    def query_box(self, box):
+        """Sorted keys of the primitives whose bounds overlap the TerryBox `box`."""
+        lo, hi = box.min_corner, box.max_corner
+        candidates = set()
+        cells = self._cells
+        low = self._cell(lo.x, lo.y, lo.z)
+        high = self._cell(hi.x, hi.y, hi.z)
+        if (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1) > len(cells):
+            # Large query: walk the occupied cells instead of the covered ones
+            for cell, bucket in cells.items():
+                if all(low[a] <= cell[a] <= high[a] for a in range(3)):
+                    candidates.update(bucket)
+        else:
+            for cell in self._cells_in(low, high):
+                bucket = cells.get(cell)
+                if bucket:
+                    candidates.update(bucket)
+        result = []
+        for key in candidates:
+            b = self._items[key][1]
+            if (b[0] <= hi.x and b[3] >= lo.x and
+                    b[1] <= hi.y and b[4] >= lo.y and
+                    b[2] <= hi.z and b[5] >= lo.z):
+                result.append(key)
+        return sorted(result)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __repr__(self):
+        return f"TerrySpatialHash({len(self._items)} primitives, {len(self._cells)} cells)"
+
+
+TerrySceneHit = namedtuple("TerrySceneHit", ["index", "t", "primitive"])
+
+_HIT_EPSILON = 1e-6
+
+
+class TerryScene:
+    """
+    Closest-hit ray casting over mixed TerrySphere, TerryBox, TerryPlane and
+    TerryTriangle primitives. Per-primitive constants (sphere centre and
+    radius squared, triangle vertices, bounding boxes) are precomputed when a
+    primitive is added; call refresh() after moving primitives. Every exact
+    test runs in the scene's engine. In a_times_b, candidates are visited in
+    order of bounding-box entry distance, so the search stops once the nearest
+    hit is closer than every remaining box; other modes test every primitive.
+    Hits need t > 1e-6, like TerryTriangle.intersect_ray.
+    """
+
+    __slots__ = ("primitives", "math", "_prepared")
+
+    def __init__(self, primitives=(), math_engine=None):
+        self.math = math_engine or TerryMath.shared()
+        self.primitives = []
+        self._prepared = []
+        for primitive in primitives:
+            self.add(primitive)
+
+    def _prepare(self, primitive):
+        if isinstance(primitive, TerryPlane):
+            p, n = primitive.point, primitive.normal
+            return ("plane", None, (p.x, p.y, p.z, n.x, n.y, n.z))
+        box = primitive.bounds()
+        lo, hi = box.min_corner, box.max_corner
+        bounds = (lo.x, lo.y, lo.z, hi.x, hi.y, hi.z)
+        if isinstance(primitive, TerrySphere):
+            c = primitive.center
+            return ("sphere", bounds, (c.x, c.y, c.z, self.math.terry_multiply(primitive.radius, primitive.radius)))
+        if isinstance(primitive, TerryTriangle):
+            a, b, c = primitive.v0, primitive.v1, primitive.v2
+            return ("triangle", bounds, (a.x, a.y, a.z, b.x, b.y, b.z, c.x, c.y, c.z))
+        return ("box", bounds, None)
+
+    def add(self, primitive):
+        """Add a primitive; returns its index in hits."""
+        if not isinstance(primitive, (TerrySphere, TerryBox, TerryPlane, TerryTriangle)):
+            raise TypeError(f"TerryScene cannot hold {type(primitive).__name__}")
+        self.primitives.append(primitive)
+        self._prepared.append(self._prepare(primitive))
+        return len(self.primitives) - 1
+
+    def refresh(self):
+        """Recompute the cached constants after primitives moved or resized."""
+        self._prepared = [self._prepare(p) for p in self.primitives]
+
+    def _hit(self, index, ray, origin, direction, dd):
+        kind, _, consts = self._prepared[index]
+        kernels = self.math.kernels
+        if kind == "sphere":
+            cx, cy, cz, r2 = consts
+            ox, oy, oz = origin[0] - cx, origin[1] - cy, origin[2] - cz
+            b = 2 * kernels.dot3(ox, oy, oz, *direction)
+            c = kernels.dot3(ox, oy, oz, ox, oy, oz) - r2
+            discriminant = b * b - 4 * dd * c
+            if discriminant < 0:
+                return None
+            sqrt_disc = discriminant ** 0.5
+            near = (-b - sqrt_disc) / (2 * dd)
+            far = (-b + sqrt_disc) / (2 * dd)
+        elif kind == "triangle":
+            hit = _ray_triangle(kernels, *origin, *direction, *consts)
+            return hit[0] if hit is not None else None
+        elif kind == "plane":
+            px, py, pz, nx, ny, nz = consts
+            denom = kernels.dot3(nx, ny, nz, *direction)
+            if abs(denom) < 1e-6:
+                return None
+            near = far = kernels.dot3(px - origin[0], py - origin[1], pz - origin[2], nx, ny, nz) / denom
+            if near < 0:
+                return None
+        else:
+            span = self.primitives[index].intersect_ray(ray)
+            if span is None:
+                return None
+            near, far = span
+        if near > _HIT_EPSILON:
+            return near
+        if far > _HIT_EPSILON:
+            return far
+        return None
+
+    def _candidates(self, origin, inverse, t_max):
+        """(entry distance, index) of primitives whose bounds the ray enters before t_max."""
+        slab = _slab if _culls(self.math) else _enter
+        found = []
+        for index, (kind, bounds, _) in enumerate(self._prepared):
+            if bounds is None:
+                found.append((0.0, index))
+                continue
+            entry = slab(bounds, origin, inverse, t_max)
+            if entry is not None:
+                found.append((entry, index))
+        found.sort()
+        return found
+
+    def raycast(self, ray, max_distance=_INF):
+        """Nearest hit as TerrySceneHit(index, t, primitive), or None."""
+        origin, direction, inverse = _ray_setup(ray)
+        dd = self.math.kernels.dot3(*direction, *direction)
+        best = None
+        best_t = max_distance
+        for entry, index in self._candidates(origin, inverse, max_distance):
+            if entry > best_t:
+                break
+            t = self._hit(index, ray, origin, direction, dd)
+            if t is not None and t < best_t:
+                best, best_t = index, t
+        if best is None:
+            return None
+        return TerrySceneHit(best, best_t, self.primitives[best])
+
+    def occluded(self, ray, max_distance=_INF):
+        """Shadow-ray test: True as soon as any primitive is hit closer than max_distance."""
+        origin, direction, inverse = _ray_setup(ray)
+        dd = self.math.kernels.dot3(*direction, *direction)
+        slab = _slab if _culls(self.math) else _enter
+        for index, (kind, bounds, _) in enumerate(self._prepared):
+            if bounds is not None and slab(bounds, origin, inverse, max_distance) is None:
+                continue
+            t = self._hit(index, ray, origin, direction, dd)
+            if t is not None and t < max_distance:
+                return True
+        return False
+
+    def __len__(self):
+        return len(self.primitives)
+
+    def __repr__(self):
+        return f"TerryScene({len(self.primitives)} primitives)"
+
+
+class TerryKDTree:
+    """
+    k-d tree over a 3D point set for k-nearest and fixed-radius queries.
+    Distances are squared (engine dot3 kernel), so no square roots are taken.
+    Splitting planes prune in a_times_b and terry_original, where no Terry
+    square is below the plain one; other modes visit every leaf.
+    Built in bulk from a TerryVector3Array (or list of TerryVector3) by median
+    splits on the axis of widest spread. Nodes live in one flat list as
+    [axis, split, left, right, start, count], count > 0 marking a leaf over
+    order[start:start + count]. Rebuild after moving points.
+    """
+
+    __slots__ = ("points", "leaf_size", "math", "order", "nodes", "_coords")
+
+    def __init__(self, points, leaf_size=8, math_engine=None):
+        if not isinstance(points, TerryVector3Array):
+            points = TerryVector3Array.from_vectors(points, math_engine)
+        if not len(points):
+            raise ValueError("TerryKDTree needs at least one point")
+        if leaf_size < 1:
+            raise ValueError(f"leaf_size must be positive, got {leaf_size}")
+        self.points = points
+        self.leaf_size = leaf_size
+        self.math = math_engine or points.math
+        self._coords = [list(c) for c in points.components]
+        self.order = list(range(len(points)))
+        self.nodes = []
+        self._build()
+
+    def _build(self):
+        coords = self._coords
+        order = self.order
+        nodes = self.nodes
+        nodes.append(None)
+        stack = [(0, 0, len(order))]
+        while stack:
+            index, start, end = stack.pop()
+            if end - start <= self.leaf_size:
+                nodes[index] = [-1, 0.0, -1, -1, start, end - start]
+                continue
+            items = order[start:end]
+            spreads = [max(c[i] for i in items) - min(c[i] for i in items) for c in coords]
+            axis = max(range(3), key=spreads.__getitem__)
+            if spreads[axis] == 0:
+                # All points coincide
+                nodes[index] = [-1, 0.0, -1, -1, start, end - start]
+                continue
+            column = coords[axis]
+            items.sort(key=column.__getitem__)
+            order[start:end] = items
+            middle = start + len(items) // 2
+            left, right = len(nodes), len(nodes) + 1
+            nodes.extend((None, None))
+            nodes[index] = [axis, column[order[middle]], left, right, start, 0]
+            stack.append((right, middle, end))
+            stack.append((left, start, middle))
+
+    def nearest(self, point, k=1):
+        """The k nearest points as [(index, squared distance)], nearest first."""
+        if k < 1:
+            raise ValueError(f"k must be positive, got {k}")
+        q = (point.x, point.y, point.z)
+        xs, ys, zs = self._coords
+        dot3 = self.math.kernels.dot3
+        prune = _plane_prunes(self.math)
+        nodes, order = self.nodes, self.order
+        heap = []  # max-heap of (-distance, -index) holding the best k so far
+        stack = [(0.0 if prune else -_INF, 0)]
+        while stack:
+            bound, index = stack.pop()
+            if len(heap) == k and bound > -heap[0][0]:
+                continue
+            axis, split, left, right, start, count = nodes[index]
+            if count:
+                qx, qy, qz = q
+                for i in order[start:start + count]:
+                    dx, dy, dz = xs[i] - qx, ys[i] - qy, zs[i] - qz
+                    entry = (-dot3(dx, dy, dz, dx, dy, dz), -i)
+                    if len(heap) < k:
+                        heapq.heappush(heap, entry)
+                    elif entry > heap[0]:
+                        heapq.heapreplace(heap, entry)
+                continue
+            diff = q[axis] - split
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append((max(bound, diff * diff) if prune else bound, far))
+            stack.append((bound, near))
+        return sorted(((-i, -d) for d, i in heap), key=lambda hit: (hit[1], hit[0]))
+
+    def within(self, point, radius):
+        """Sorted indices of the points at distance <= radius."""
+        q = (point.x, point.y, point.z)
+        xs, ys, zs = self._coords
+        dot3 = self.math.kernels.dot3
+        prune = _plane_prunes(self.math)
+        r2 = self.math.terry_multiply(radius, radius)
+        nodes, order = self.nodes, self.order
+        found = []
+        stack = [0]
+        while stack:
+            axis, split, left, right, start, count = nodes[stack.pop()]
+            if count:
+                qx, qy, qz = q
+                for i in order[start:start + count]:
+                    dx, dy, dz = xs[i] - qx, ys[i] - qy, zs[i] - qz
+                    if dot3(dx, dy, dz, dx, dy, dz) <= r2:
+                        found.append(i)
+                continue
+            diff = q[axis] - split
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append(near)
+            if not prune or diff * diff <= r2:
+                stack.append(far)
+        found.sort()
+        return found
+
+    def nearest_many(self, points, k=1):
+        """nearest() for every point of a TerryVector3Array or list."""
+        return [self.nearest(p, k) for p in points]
+
+    def within_many(self, points, radius):
+        return [self.within(p, radius) for p in points]
+
+    def __len__(self):
+        return len(self.order)
+
+    def __repr__(self):
+        return f"TerryKDTree({len(self.order)} points, {len(self.nodes)} nodes)"
@@ -84,4 +84,14 @@ def test_matrix2x2_repr():
 
 def test_matrix3x3_repr():
     m = TerryMatrix3x3([[1,2,3],[4,5,6],[7,8,9]])
-    assert "TerryMatrix3x3" in repr(m)
\ No newline at end of file
+    assert "TerryMatrix3x3" in repr(m)
+
+def test_shared_engine_cannot_change_mode():
+    with pytest.raises(RuntimeError):
+        TerryMath.shared().set_mode("a_plus_b")
+    assert TerryMath.shared().mode == "terry_original"
+    with pytest.raises(RuntimeError):
+        TerryMath.shared().enable_table()
+    with pytest.raises(RuntimeError):
+        TerryMath.shared().disable_table()
+    assert getattr(TerryMath.shared(), "table", None) is None
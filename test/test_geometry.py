@@ -1,8 +1,9 @@
-from terrymath import TerryMath, TerryVector3
+import pytest
+from terrymath import TerryMath, TerryVector3, TerryVector3Array
 from terrygeometry import (
     TerryPoint, TerryLine, TerrySegment, TerryRay, TerryPlane,
     TerrySphere, TerryBox, TerryTriangle, terry_cube, terry_quad,
-    terry_distance, terry_angle
+    terry_distance, terry_angle, terry_intersect_rays, TerryMesh
 )
 
 def test_point_addition():
@@ -130,4 +131,141 @@ def test_terry_distance_and_angle():
     expected = (b - a).dot(b - a) ** 0.5
     assert math.isclose(dist, expected)
     expected_angle = terry_angle(a, b, math_engine=tm)
-    assert math.isclose(angle, expected_angle)
\ No newline at end of file
+    assert math.isclose(angle, expected_angle)
+
+def test_triangle_bounds_and_barycentric_hit():
+    tm = TerryMath("a_times_b")
+    tri = TerryTriangle(TerryVector3(0, 0, 0, tm), TerryVector3(2, 0, 1, tm), TerryVector3(0, 3, 0, tm), tm)
+    box = tri.bounds()
+    assert (box.min_corner.x, box.min_corner.y, box.min_corner.z) == (0, 0, 0)
+    assert (box.max_corner.x, box.max_corner.y, box.max_corner.z) == (2, 3, 1)
+    ray = TerryRay(TerryVector3(0.5, 0.6, -1, tm), TerryVector3(0, 0, 1, tm), tm)
+    t, u, v = tri.intersect_ray_barycentric(ray)
+    assert t == tri.intersect_ray(ray)
+    assert (u, v) == pytest.approx((0.25, 0.2))
+
+def test_packet_intersection_matches_scalar_method():
+    tm = TerryMath()
+    near = TerryTriangle(TerryVector3(-1, -1, 1, tm), TerryVector3(3, -1, 1, tm), TerryVector3(-1, 3, 1, tm), tm)
+    far = TerryTriangle(TerryVector3(-1, -1, 4, tm), TerryVector3(3, -1, 4, tm), TerryVector3(-1, 3, 4, tm), tm)
+    origins = TerryVector3Array([0, 0.5, 5, 0], [0, 0.5, 5, 0], [0, 0, 0, 6], math_engine=tm)
+    directions = TerryVector3Array([0, 0, 0, 0], [0, 0, 0, 0], [1, 1, 1, 1], math_engine=tm)
+    distances, ids = terry_intersect_rays(origins, directions, [far, near])
+    assert list(ids) == [1, 1, -1, -1]
+    for k in range(2):
+        ray = TerryRay(origins[k].to_vector(), directions[k].to_vector(), tm)
+        assert distances[k] == near.intersect_ray(ray)
+    assert distances[2] == float("inf")
+
+def test_terry_cube_mesh_normals_and_edges():
+    tm = TerryMath("a_times_b")
+    cube = terry_cube(TerryVector3(1, 2, 3, tm), 2, math_engine=tm)
+    assert isinstance(cube, TerryMesh) and cube.face_count() == 12
+    assert (cube[6].x, cube[6].y, cube[6].z) == (2, 3, 4)
+    assert len(cube.edges()) == 18
+    normals = cube.face_normals()
+    assert normals is cube.face_normals()
+    # Every face normal points away from the centre
+    for f in range(12):
+        a = cube[cube.face(f)[0]]
+        n = normals[f]
+        assert (a.x - 1) * n.x + (a.y - 2) * n.y + (a.z - 3) * n.z > 0
+    # In-place edits plus mark_dirty() rebuild the cached normals and bases
+    probe = TerryVector3Array.from_vectors([TerryVector3(-4, 1.2, 2.1, tm)], tm)
+    cube.contains_points(probe)
+    cube.vertices.xs[0] = -5
+    cube.mark_dirty()
+    fresh = TerryMesh(list(cube), cube.indices, tm)
+    rebuilt = [(n.x, n.y, n.z) for n in cube.face_normals()]
+    assert rebuilt == [(n.x, n.y, n.z) for n in fresh.face_normals()]
+    assert rebuilt != [(n.x, n.y, n.z) for n in normals]
+    assert list(cube.contains_points(probe)) == list(fresh.contains_points(probe)) == [1]
+    assert [(v.x, v.y, v.z) for v in cube[6:]] == [(2, 3, 4), (0, 3, 4)]
+
+def test_terry_quad_honours_normal():
+    tm = TerryMath("a_times_b")
+    quad = terry_quad(TerryVector3(0, 0, 0, tm), 2, TerryVector3(0, 3, 0, tm), math_engine=tm)
+    assert all(v.y == 0 for v in quad)
+    n = quad.face_normals()[0]
+    assert (n.x, n.y, n.z) == pytest.approx((0, 1, 0))
+
+def test_mesh_from_triangles_shares_vertices():
+    tm = TerryMath("a_times_b")
+    cube = terry_cube(TerryVector3(0, 0, 0, tm), 2, math_engine=tm)
+    mesh = TerryMesh.from_triangles(cube.triangles())
+    assert len(mesh) == 8 and mesh.face_count() == 12
+    with pytest.raises(ValueError):
+        TerryMesh(cube.vertices, [0, 1, 8])
+
+def test_triangle_basis_cache_and_batch_containment():
+    tm = TerryMath("a_times_b")
+    tri = TerryTriangle(TerryVector3(0, 0, 0, tm), TerryVector3(1, 0, 0, tm), TerryVector3(0, 1, 0, tm), tm)
+    points = [TerryVector3(0.2, 0.2, 0, tm), TerryVector3(0.8, 0.8, 0, tm), TerryVector3(1.5, 0, 0, tm)]
+    assert tri.contains_points(points) == [tri.contains_point(p) for p in points] == [True, False, False]
+    tri.v1 = TerryVector3(2, 0, 0, tm)
+    tri.v2 = TerryVector3(0, 2, 0, tm)
+    assert tri.contains_points(TerryVector3Array.from_vectors(points, tm)) == [True, True, True]
+
+def test_mesh_contains_points_reports_face():
+    tm = TerryMath("a_times_b")
+    quad = terry_quad(TerryVector3(0, 0, 0, tm), 2, TerryVector3(0, 0, 1, tm), math_engine=tm)
+    points = [TerryVector3(0.5, -0.5, 0, tm), TerryVector3(-0.5, 0.5, 0, tm), TerryVector3(3, 0, 0, tm)]
+    assert list(quad.contains_points(points)) == [0, 1, -1]
+    bases = quad._face_bases()
+    assert quad._face_bases() is bases
+    for i in range(len(quad)):
+        quad.vertices.xs[i] += 3
+    quad.mark_dirty()
+    assert quad._face_bases() is not bases
+    assert list(quad.contains_points(points)) == [-1, -1, 0]
+
+def test_sphere_and_box_bounds():
+    tm = TerryMath("a_times_b")
+    b = TerrySphere(TerryVector3(1, 2, 3, tm), 2, tm).bounds()
+    assert (b.min_corner.x, b.max_corner.z) == (-1, 5)
+    box = TerryBox(TerryVector3(0, 0, 0, tm), TerryVector3(1, 1, 1, tm), tm)
+    assert box.bounds().max_corner is box.max_corner
+
+def test_triangle_intersect_ray_uses_vertex_and_ray_engines():
+    ray_engine = TerryMath("a_plus_b")
+    for tm in (ray_engine, TerryMath("a_plus_b_minus_1")):
+        # Engine-less triangle: the products follow the vertex and ray engines
+        tri = TerryTriangle(TerryVector3(0, 0, 0, tm), TerryVector3(4, 0, 0, tm), TerryVector3(0, 4, 0, tm))
+        o, d = TerryVector3(1, 1, -2, ray_engine), TerryVector3(0, 0, 1, ray_engine)
+        edge1, edge2 = tri.v1 - tri.v0, tri.v2 - tri.v0
+        h = d.cross(edge2)
+        f = 1.0 / edge1.dot(h)
+        s = o - tri.v0
+        q = s.cross(edge1)
+        u, v, t = f * s.dot(h), f * d.dot(q), f * edge2.dot(q)
+        expected = (t, u, v) if 0 <= u <= 1 and v >= 0 and u + v <= 1 and t > 1e-6 else None
+        assert expected is not None
+        assert tri.intersect_ray_barycentric(TerryRay(o, d)) == expected
+
+def test_basis_caches_follow_the_vertex_engine_mode():
+    tm = TerryMath("a_times_b")
+    vertex_engine = TerryMath("a_times_b")
+    points = [TerryVector3(x / 4, y / 4, 0, tm) for x in range(-2, 7) for y in range(-2, 7)]
+    tri = TerryTriangle(TerryVector3(0, 0, 0, vertex_engine), TerryVector3(1, 0, 0, vertex_engine),
+                        TerryVector3(0, 1, 0, vertex_engine))
+    mesh = TerryMesh(TerryVector3Array([0, 1, 0], [0, 0, 1], [0, 0, 0], math_engine=vertex_engine), [0, 1, 2], tm)
+    before = tri.contains_points(points)
+    mesh_before = list(mesh.contains_points(points))
+    vertex_engine.set_mode("a_plus_b")
+    fresh = TerryTriangle(tri.v0, tri.v1, tri.v2)
+    after = [fresh.contains_point(p) for p in points]
+    assert after != before
+    assert tri.contains_points(points) == [tri.contains_point(p) for p in points] == after
+    fresh_mesh = TerryMesh(mesh.vertices, mesh.indices, tm)
+    assert list(mesh.contains_points(points)) == list(fresh_mesh.contains_points(points)) != mesh_before
+
+def test_batch_containment_runs_in_the_points_engine():
+    tm, point_engine = TerryMath("a_times_b"), TerryMath("a_plus_b")
+    points = [TerryVector3(x / 4, y / 4, 0, point_engine) for x in range(-6, 7) for y in range(-6, 7)]
+    tri = TerryTriangle(TerryVector3(0, 0, 0, tm), TerryVector3(1, 0, 0, tm), TerryVector3(0, 1, 0, tm), tm)
+    expected = [tri.contains_point(p) for p in points]
+    assert tri.contains_points(points) == tri.contains_points(TerryVector3Array.from_vectors(points)) == expected
+    quad = terry_quad(TerryVector3(0, 0, 0, tm), 2, TerryVector3(0, 0, 1, tm), math_engine=tm)
+    faces = quad.triangles()
+    expected = [next((f for f, face in enumerate(faces) if face.contains_point(p)), -1) for p in points]
+    assert list(quad.contains_points(points)) == expected
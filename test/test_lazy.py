@@ -0,0 +1,45 @@
+import pytest
+from terrymath import TerryMath, TerryVector2, TerryVector3, TerryMatrix3x3, TerryVector3Array
+from terrylinalg import TerryMatrix4x4
+from terrylazy import TerryExpr, terry_lazy
+
+def test_lazy_lerp_matches_eager():
+    for mode in TerryMath.list_modes():
+        tm = TerryMath(mode=mode)
+        a = TerryVector3(1, 2, 0.5, tm)
+        b = TerryVector3(1, 4, 3, tm)
+        expr = terry_lazy(a) + (terry_lazy(b) - a) * 0.25
+        assert isinstance(expr, TerryExpr)
+        result = expr.evaluate()
+        expected = a + (b - a) * 0.25
+        assert (result.x, result.y, result.z) == (expected.x, expected.y, expected.z)
+
+def test_lazy_matrix_vector_and_dot():
+    tm = TerryMath()
+    m = TerryMatrix4x4([[1, 0, 0, 2], [0, 1, 0, 3], [0, 0, 1, 4], [0, 0, 0, 1]], math_engine=tm)
+    a = TerryVector3(1, 1, 1, tm)
+    b = TerryVector3(0, 1, 2, tm)
+    moved = (terry_lazy(m) * (terry_lazy(a) + b)).evaluate()
+    expected = m * (a + b)
+    assert (moved.x, moved.y, moved.z) == (expected.x, expected.y, expected.z)
+    assert terry_lazy(a).cross(b).dot(a).evaluate() == a.cross(b).dot(a)
+    n = TerryMatrix3x3([[1, 2, 3], [4, 5, 6], [7, 8, 9]], tm)
+    assert (terry_lazy(n) * n).evaluate().data == (n * n).data
+
+def test_lazy_expression_over_vector_array():
+    tm = TerryMath()
+    points = TerryVector3Array([0, 1, 2], [1, 1, 1], [2, 0, 1], math_engine=tm)
+    target = TerryVector3(1, 1, 1, tm)
+    result = (terry_lazy(points) + (terry_lazy(target) - points) * 0.5).evaluate()
+    assert isinstance(result, TerryVector3Array)
+    for got, p in zip(result.to_vectors(), points.to_vectors()):
+        expected = p + (target - p) * 0.5
+        assert (got.x, got.y, got.z) == (expected.x, expected.y, expected.z)
+    dots = terry_lazy(points).dot(target).evaluate()
+    assert list(dots) == [p.dot(target) for p in points.to_vectors()]
+
+def test_lazy_rejects_mismatched_shapes():
+    with pytest.raises(TypeError):
+        terry_lazy(TerryVector2(1, 2)) + TerryVector3(1, 2, 3)
+    with pytest.raises(TypeError):
+        terry_lazy("not a vector")
@@ -1,5 +1,11 @@
-from terrymath import TerryMath
-from terrylinalg import TerryMatrix4x4, TerryQuaternion
+from array import array
+import pytest
+from terrymath import TerryMath, TerryVector3, TerryVector3Array, TerryMatrix2x2, TerryMatrix3x3
+from terrylinalg import (
+    TerryMatrix4x4, TerryQuaternion, TerryMatrix, TerrySlerpSampler, TerryTransformChain,
+    terry_slerp_quat, terry_slerp_many, terry_rotation_matrix, terry_rotation_matrices,
+    terry_lerp_vec3
+)
 
 def test_matrix4x4_addition():
     tm = TerryMath()
@@ -126,4 +132,236 @@ def test_quaternion_conjugate_and_norm():
             tm.terry_multiply(q.z, q.z)
         )
     )) ** 0.5
-    assert norm == expected_norm
\ No newline at end of file
+    assert norm == expected_norm
+
+def test_quaternion_in_place_product_and_normalize():
+    tm = TerryMath()
+    q1 = TerryQuaternion(1, 2, 3, 4, math_engine=tm)
+    q2 = TerryQuaternion(0.5, 1, 0, 1, math_engine=tm)
+    expected = q1 * q2
+    q = q1.copy()
+    q *= q2
+    assert (q.w, q.x, q.y, q.z) == (expected.w, expected.x, expected.y, expected.z)
+    q.normalize_()
+    n = expected.normalize()
+    assert (q.w, q.x, q.y, q.z) == (n.w, n.x, n.y, n.z)
+
+def test_matrix4x4_in_place_multiply():
+    tm = TerryMath()
+    m = TerryMatrix4x4([[1, 2, 0, 1], [0, 1, 0, 2], [3, 0, 1, 0], [0, 0, 0, 1]], math_engine=tm)
+    expected = m * m
+    m *= m.copy()
+    assert m.data == expected.data
+
+def test_dense_matrix_blocked_product_matches_naive():
+    tm = TerryMath("terry_original")
+    a = TerryMatrix.from_rows([[(i * 7 + j) % 5 - 2 for j in range(70)] for i in range(3)], tm)
+    b = TerryMatrix.from_rows([[(i + 3 * j) % 4 - 1 for j in range(66)] for i in range(70)], tm)
+    c = a * b
+    for i in range(3):
+        for j in (0, 63, 64, 65):
+            acc = 0.0
+            for k in range(70):
+                acc = tm.terry_add(acc, tm.terry_multiply(a[i, k], b[k, j]))
+            assert c[i, j] == acc
+
+def test_dense_matrix_transpose_is_a_view():
+    m = TerryMatrix.from_rows([[1, 2, 3], [4, 5, 6]])
+    t = m.transpose()
+    assert t.buffer is m.buffer
+    assert t.to_rows() == [[1, 4], [2, 5], [3, 6]]
+    t[2, 0] = 9
+    assert m[0, 2] == 9
+
+def test_dense_matrix_solve_and_determinant():
+    tm = TerryMath()
+    m = TerryMatrix.from_rows([[4, 3, 2], [2, 1, 3], [3, 2, 1]], tm)
+    x = m.solve([1, 2, 3])
+    assert m * x == pytest.approx([1, 2, 3])
+    assert m.determinant() == pytest.approx(3)
+    singular = TerryMatrix.from_rows([[1, 2], [2, 4]], tm)
+    assert singular.determinant() == 0
+    with pytest.raises(ValueError):
+        singular.solve([1, 1])
+    with pytest.raises(ValueError):
+        TerryMatrix.from_rows([[1, 2, 3], [4, 5, 6]], tm).determinant()
+
+def test_dense_determinant_matches_fixed_size_in_default_mode():
+    tm = TerryMath()
+    for rows in ([[1, 0], [0, 3]], [[0, 2], [5, 1]], [[1, 2], [3, 4]]):
+        assert TerryMatrix.from_rows(rows, tm).determinant() == pytest.approx(
+            TerryMatrix2x2(*rows[0], *rows[1], tm).determinant()
+        )
+    for rows in ([[1, 0, 0], [0, 2, 0], [0, 0, 3]], [[0, 0, 2], [0, 3, 0], [5, 0, 0]]):
+        assert TerryMatrix.from_rows(rows, tm).determinant() == pytest.approx(
+            TerryMatrix3x3(rows, tm).determinant()
+        )
+
+def test_matrix4x4_inverse_general_and_affine():
+    tm = TerryMath("a_times_b")
+    general = TerryMatrix4x4([[2, 0, 1, 3], [1, 3, 0, 1], [0, 1, 4, 2], [1, 0, 2, 5]], math_engine=tm)
+    affine = TerryMatrix4x4([[0, -1, 0, 5], [1, 0, 0, -2], [0, 0, 2, 1], [0, 0, 0, 1]], math_engine=tm)
+    assert affine.is_affine() and not general.is_affine()
+    for m in (general, affine):
+        product = (m * m.inverse()).data
+        for i in range(4):
+            for j in range(4):
+                assert product[i][j] == pytest.approx(1 if i == j else 0, abs=1e-12)
+    assert affine.determinant() == pytest.approx(2)
+    assert general.determinant() == pytest.approx(TerryMatrix.from_rows(general.data, tm).determinant())
+
+def test_matrix4x4_determinant_keeps_laplace_in_terry_modes():
+    shear = [[1, 2, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+    assert TerryMatrix4x4(shear, math_engine=TerryMath("a_plus_b")).determinant() == -2
+    tm = TerryMath("terry_original")
+    m = TerryMatrix4x4([[2, 1, 0, 0], [1, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], math_engine=tm)
+    assert m.determinant() == 2
+    m.inverse()
+    singular = TerryMatrix4x4([[1, 1, 0, 3], [1, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], math_engine=tm)
+    assert singular.is_affine() and singular.determinant() == 0
+    with pytest.raises(ValueError):
+        singular.inverse()
+
+def test_matrix4x4_inverse_singular():
+    m = TerryMatrix4x4([[1, 2, 3, 4], [2, 4, 6, 8], [0, 1, 0, 1], [1, 0, 1, 0]])
+    with pytest.raises(ValueError):
+        m.inverse()
+
+def test_matrix4x4_transform_points_matches_single_multiply():
+    tm = TerryMath()
+    m = TerryMatrix4x4([[0, -1, 0, 5], [1, 0, 0, -2], [0, 0, 2, 1], [0, 0, 0, 1]], math_engine=tm)
+    points = [TerryVector3(1, 2, 3, tm), TerryVector3(-1, 0.5, 4, tm)]
+    result = m.transform_points(TerryVector3Array.from_vectors(points, tm))
+    for got, p in zip(result, points):
+        expected = m * p
+        assert (got.x, got.y, got.z) == (expected.x, expected.y, expected.z)
+    out = array("d", bytes(8 * 6))
+    assert m.transform_points([1, 2, 3, -1, 0.5, 4], out) is out
+    assert list(out) == [c for v in result for c in (v.x, v.y, v.z)]
+
+def test_matrix4x4_transform_projective_and_directions():
+    tm = TerryMath("a_times_b")
+    m = TerryMatrix4x4([[2, 0, 0, 3], [0, 2, 0, 0], [0, 0, 1, 0], [0, 0, 1, 0]], math_engine=tm)
+    assert list(m.transform_points([1, 2, 4], project=True)) == [1.25, 1.0, 1.0]
+    expected = m * TerryVector3(1, 2, 4, tm)
+    assert list(m.transform_points([1, 2, 4])) == [expected.x, expected.y, expected.z]
+    out = array("d", [7.0] * 6)
+    with pytest.raises(ValueError):
+        m.transform_points([1, 2, 4, 1, 1, 0], out, project=True)
+    assert list(out) == [7.0] * 6
+    assert list(m.transform_directions([1, 2, 4])) == [2.0, 4.0, 4.0]
+    with pytest.raises(ValueError):
+        m.transform_points([1, 2])
+
+def test_quaternion_rotate_matches_sandwich_product():
+    tm = TerryMath("a_times_b")
+    q = TerryQuaternion(0.8, 0.2, -0.4, 0.4, math_engine=tm).normalize()
+    v = TerryVector3(1, 2, 3, tm)
+    rotated = q.rotate(v)
+    sandwich = q * TerryQuaternion(0, v.x, v.y, v.z, tm) * q.conjugate()
+    assert (rotated.x, rotated.y, rotated.z) == pytest.approx((sandwich.x, sandwich.y, sandwich.z))
+    batch = q.rotate_many(TerryVector3Array.from_vectors([v, v], tm))
+    assert (batch[1].x, batch[1].y, batch[1].z) == pytest.approx((sandwich.x, sandwich.y, sandwich.z))
+
+def test_quaternion_matrix_cache_follows_changes():
+    tm = TerryMath("a_times_b")
+    q = TerryQuaternion(1, 0, 0, 0, math_engine=tm)
+    assert q.to_matrix3().data == [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    q.set_(0, 0, 0, 1)
+    assert q.to_matrix4().data[0][:2] == [-1, 0]
+
+def test_lerp_vec3_scales_in_the_end_engine():
+    a = TerryVector3(1, 2, -1, TerryMath("a_times_b"))
+    b = TerryVector3(3, 1, 0.5, TerryMath("a_plus_b"))
+    got = terry_lerp_vec3(a, b, 0.25)
+    expected = a + (b - a) * 0.25
+    assert (got.x, got.y, got.z) == (expected.x, expected.y, expected.z)
+    assert got.math is a.math
+
+def test_slerp_sampler_matches_terry_slerp_quat():
+    tm = TerryMath()
+    q1 = TerryQuaternion(1, 0, 0, 0, math_engine=tm)
+    q2 = TerryQuaternion(0.6, 0, 0.8, 0, math_engine=tm)
+    sampler = TerrySlerpSampler(q1, q2)
+    ts = [0, 0.25, 0.5, 1]
+    for got, t in zip(sampler.sample_many(ts), ts):
+        expected = terry_slerp_quat(q1, q2, t)
+        assert (got.w, got.x, got.y, got.z) == (expected.w, expected.x, expected.y, expected.z)
+    batch = terry_slerp_many([q1, q2], [q2, q1], 0.25)
+    assert batch[0].w == terry_slerp_quat(q1, q2, 0.25).w
+    assert batch[1].y == terry_slerp_quat(q2, q1, 0.25).y
+
+def test_slerp_sampler_nlerp_mode():
+    tm = TerryMath("a_times_b")
+    sampler = TerrySlerpSampler(TerryQuaternion(1, 0, 0, 0, tm), TerryQuaternion(0, 0, 0, 1, tm), "nlerp")
+    half = sampler.sample(0.5)
+    assert (half.w, half.z) == pytest.approx((2 ** -0.5, 2 ** -0.5))
+    with pytest.raises(ValueError):
+        TerrySlerpSampler(half, half, "cubic")
+
+def test_slerp_many_uses_each_keyframe_engine():
+    plain, shifted = TerryMath("a_times_b"), TerryMath("a_plus_b_minus_1")
+    q1s = [TerryQuaternion(0.8, 0, 0.6, 0, plain), TerryQuaternion(0.8, 0, 0.6, 0, shifted)]
+    q2s = [TerryQuaternion(0.6, 0.8, 0, 0, plain)] * 2
+    batch = terry_slerp_many(q1s, q2s, [0.3, 0.3])
+    expected = [terry_slerp_quat(q1, q2, 0.3) for q1, q2 in zip(q1s, q2s)]
+    assert [(q.w, q.x, q.y, q.z) for q in batch] == [(q.w, q.x, q.y, q.z) for q in expected]
+    assert (batch[0].w, batch[0].x) != (batch[1].w, batch[1].x)
+    sampler = TerrySlerpSampler(q1s[0], q2s[0], "nlerp")
+    ts = [0, 0.4, 1]
+    assert [(q.w, q.y) for q in sampler.sample_many(ts)] == [(sampler.sample(t).w, sampler.sample(t).y) for t in ts]
+
+def test_rotation_matrix_about_z():
+    tm = TerryMath("a_times_b")
+    m = terry_rotation_matrix(TerryVector3(0, 0, 2, tm), 0.5 * 3.141592653589793, tm)
+    v = m * TerryVector3(1, 0, 0, tm)
+    assert (v.x, v.y, v.z) == pytest.approx((0, 1, 0))
+
+def test_rotation_matrix_cache_and_batch():
+    tm = TerryMath("a_times_b")
+    axis = TerryVector3(1, 1, 0, tm)
+    first = terry_rotation_matrix(axis, 0.3, tm, cache=True)
+    first.data[0][0] = 99
+    second = terry_rotation_matrix(axis, 0.3, tm, cache=True)
+    assert second.data == terry_rotation_matrix(axis, 0.3, tm).data
+    batch = terry_rotation_matrices(axis, [0.1, 0.3], tm)
+    assert batch[1].data == second.data
+
+def test_rotation_matrix_is_orthonormal_for_any_axis_engine():
+    rows = [row[:3] for row in terry_rotation_matrix(TerryVector3(1, 1, 0), 0.7).data[:3]]
+    for i in range(3):
+        for j in range(3):
+            dot = sum(rows[i][k] * rows[j][k] for k in range(3))
+            assert dot == pytest.approx(1 if i == j else 0, abs=1e-12)
+    cached = terry_rotation_matrix(TerryVector3(1, 2, 2, TerryMath("a_plus_b")), 0.4, cache=True)
+    assert cached.data == terry_rotation_matrix(TerryVector3(1, 2, 2, TerryMath("a_times_b")), 0.4).data
+    with pytest.raises(ValueError):
+        terry_rotation_matrix(TerryVector3(0, 0, 0), 0.4)
+
+def test_transform_chain_picks_order_and_caches_product():
+    tm = TerryMath("a_times_b")
+    a = TerryMatrix4x4([[0, -1, 0, 1], [1, 0, 0, 2], [0, 0, 1, 3], [0, 0, 0, 1]], math_engine=tm)
+    b = TerryMatrix4x4([[2, 0, 0, 0], [0, 2, 0, 0], [0, 0, 2, 1], [0, 0, 0, 1]], math_engine=tm)
+    chain = TerryTransformChain([a, b, a])
+    assert chain.plan(1) == "sequential"
+    assert chain.plan(50) == "collapse"
+    points = [TerryVector3(i, 2 * i, 1, tm) for i in range(50)]
+    expected = [a * (b * (a * p)) for p in points]
+    result = chain.apply(points)
+    assert [(v.x, v.y, v.z) for v in result] == pytest.approx([(v.x, v.y, v.z) for v in expected])
+    assert chain.product() is chain.product()
+    one = chain.apply_one(points[3])
+    assert (one.x, one.y, one.z) == (expected[3].x, expected[3].y, expected[3].z)
+    # A current cached product makes collapsing worth it even for one vector
+    assert chain.plan(1) == "collapse"
+    b.data[0][3] = 5
+    assert chain.plan(1) == "sequential"
+    moved = chain.apply_one(points[3])
+    assert (moved.x, moved.y, moved.z) == pytest.approx(tuple(getattr(a * (b * (a * points[3])), c) for c in "xyz"))
+
+def test_transform_chain_never_regroups_non_distributive_modes():
+    tm = TerryMath("terry_original")
+    m = TerryMatrix4x4.identity(tm)
+    assert TerryTransformChain([m, m, m]).plan(10 ** 6) == "sequential"
+    with pytest.raises(TypeError):
+        TerryTransformChain([m, TerryQuaternion(1, 0, 0, 0, tm)])
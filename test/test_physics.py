@@ -1,4 +1,5 @@
 from terrymath import TerryMath, TerryVector2, TerryVector3
+from terrylinalg import TerryQuaternion
 from terryphysics import TerryBody, TerryWorld, TerryRigidBody
 
 def test_body_apply_force_and_integrate():
@@ -132,4 +133,83 @@ def test_rigidbody_repr():
     pos = TerryVector3(0, 0, 0, tm)
     vel = TerryVector3(1, 0, 0, tm)
     rigid = TerryRigidBody(pos, vel, mass=2, math_engine=tm)
-    assert "TerryRigidBody" in repr(rigid)
\ No newline at end of file
+    assert "TerryRigidBody" in repr(rigid)
+
+def test_integrate_updates_state_in_place_without_touching_inputs():
+    tm = TerryMath()
+    pos = TerryVector3(0, 0, 0, tm)
+    vel = TerryVector3(1, 0, 0, tm)
+    rigid = TerryRigidBody(pos, vel, mass=2, angular_velocity=TerryVector3(0, 1, 0, tm), math_engine=tm)
+    position, velocity, orientation = rigid.position, rigid.velocity, rigid.orientation
+    rigid.apply_force(TerryVector3(2, 0, 0, tm))
+    rigid.integrate(dt=0.5)
+    assert rigid.position is position and rigid.velocity is velocity
+    assert rigid.orientation is orientation
+    assert (pos.x, vel.x) == (0, 1)
+    assert rigid.velocity.x == tm.terry_add(1, tm.terry_multiply(tm.terry_multiply(2, tm.terry_divide(1, 2)), 0.5))
+    assert rigid.force_accum.x == 0
+
+def test_state_snapshot_is_not_mutated_by_integration():
+    tm = TerryMath()
+    rigid = TerryRigidBody(TerryVector3(0, 0, 0, tm), TerryVector3(1, 0, 0, tm), mass=1, math_engine=tm)
+    state = rigid.get_state()
+    rigid.integrate(dt=1, auto_sleep=False)
+    assert state["position"].x == 0
+    rigid.set_state(state)
+    assert rigid.position.x == 0
+
+def test_orientation_step_adds_in_plain_floats():
+    tm = TerryMath("a_plus_b")
+    omega = TerryVector3(0.2, 0.4, 0.1, tm)
+    rigid = TerryRigidBody(
+        TerryVector3(0, 0, 0, tm), TerryVector3(0, 0, 0, tm), mass=1,
+        angular_velocity=omega, math_engine=tm
+    )
+    q = rigid.orientation
+    start = q.copy()
+    rigid.integrate(dt=0.1, auto_sleep=False)
+    w = rigid.angular_velocity
+    dq = start * TerryQuaternion(0, w.x, w.y, w.z, tm)
+    expected = TerryQuaternion(
+        start.w + (0.5 * dq.w) * 0.1, start.x + (0.5 * dq.x) * 0.1,
+        start.y + (0.5 * dq.y) * 0.1, start.z + (0.5 * dq.z) * 0.1, tm
+    ).normalize()
+    assert (q.w, q.x, q.y, q.z) == (expected.w, expected.x, expected.y, expected.z)
+
+def test_world_forces_follow_the_scaled_vector_engine():
+    body_tm, gravity_tm = TerryMath("a_times_b"), TerryMath("a_plus_b")
+    world = TerryWorld(body_tm, gravity=TerryVector2(0, -3, gravity_tm))
+    body = TerryBody(TerryVector2(0, 0, body_tm), TerryVector2(0, 0, body_tm), mass=2, math_engine=body_tm)
+    world.add_body(body)
+    world.apply_gravity()
+    expected = world.gravity * 2
+    assert (body.force_accum.x, body.force_accum.y) == (expected.x, expected.y)
+
+def test_newtonian_gravity_scratch_is_per_engine():
+    engines = {"P": TerryMath("a_times_b"), "R": TerryMath("a_plus_b"), "S": TerryMath("a_plus_b")}
+    positions = {"P": 0, "R": 1, "S": 3}
+
+    def pull_on_s(names):
+        world = TerryWorld(TerryMath("a_times_b"))
+        for name in names:
+            tm = engines[name]
+            world.add_body(TerryBody(
+                TerryVector3(positions[name], 0, 0, tm), TerryVector3(0, 0, 0, tm), mass=1, math_engine=tm
+            ))
+        world.apply_newtonian_gravity()
+        return world.bodies[-1].force_accum.x
+
+    assert pull_on_s("PRS") == pull_on_s("PS") + pull_on_s("RS")
+
+def test_newtonian_gravity_separation_uses_second_body_engine():
+    ta, tb = TerryMath("a_times_b"), TerryMath("a_plus_b")
+    world = TerryWorld(TerryMath("a_times_b"))
+    a = TerryBody(TerryVector3(0, 1, 0, ta), TerryVector3(0, 0, 0, ta), mass=1, math_engine=ta)
+    b = TerryBody(TerryVector3(3, 2, 2, tb), TerryVector3(0, 0, 0, tb), mass=1, math_engine=tb)
+    world.add_body(a)
+    world.add_body(b)
+    world.apply_newtonian_gravity()
+    r_vec = b.position - a.position
+    r2 = r_vec.dot(r_vec)
+    expected = r_vec * (1.0 / r2 ** 0.5) * (1.0 / r2)
+    assert (a.force_accum.x, a.force_accum.y, a.force_accum.z) == (expected.x, expected.y, expected.z)
@@ -0,0 +1,68 @@
+import pytest
+from terrymath import TerryMath, TerryVector3
+from terrylinalg import TerryMatrix4x4, TerryQuaternion
+from terryscenegraph import TerrySceneNode
+
+def translation(x, y, z, tm):
+    return TerryMatrix4x4([[1, 0, 0, x], [0, 1, 0, y], [0, 0, 1, z], [0, 0, 0, 1]], tm)
+
+def test_world_matrix_composes_parent_chain():
+    tm = TerryMath("a_times_b")
+    root = TerrySceneNode("root", translation(1, 0, 0, tm))
+    arm = root.add_child(TerrySceneNode("arm", translation(0, 2, 0, tm)))
+    hand = arm.add_child(TerrySceneNode("hand", translation(0, 0, 3, tm)))
+    assert hand.world.data == (root.local * arm.local * hand.local).data
+    root.set_local(translation(5, 0, 0, tm))
+    assert [row[3] for row in hand.world.data[:3]] == [5, 2, 3]
+
+def test_only_dirty_subtrees_are_recomputed():
+    tm = TerryMath("a_times_b")
+    root = TerrySceneNode("root", math_engine=tm)
+    left = root.add_child(TerrySceneNode("left", translation(1, 0, 0, tm)))
+    right = root.add_child(TerrySceneNode("right", translation(0, 1, 0, tm)))
+    root.update()
+    left_world = left.world
+    right.set_rotation(TerryQuaternion(0, 0, 0, 1, tm), TerryVector3(0, 4, 0, tm))
+    root.update()
+    assert left.world is left_world
+    assert right.world.data[1][3] == 4
+
+def test_flatten_world_buffer():
+    tm = TerryMath("a_times_b")
+    root = TerrySceneNode("root", translation(1, 2, 3, tm))
+    root.add_child(TerrySceneNode("child", translation(1, 1, 1, tm)))
+    buffer = root.flatten_world()
+    assert len(buffer) == 32
+    assert buffer[16 + 3] == 2 and buffer[16 + 7] == 3 and buffer[16 + 11] == 4
+    assert root.flatten_world(buffer) is buffer
+    with pytest.raises(ValueError):
+        root.add_child(root)
+
+def test_world_product_runs_in_the_node_engine():
+    parent_tm, child_tm = TerryMath("a_plus_b"), TerryMath("a_times_b")
+    root = TerrySceneNode("root", translation(1, 2, 3, parent_tm))
+    child = root.add_child(TerrySceneNode("child", translation(0, 1, 0, child_tm)))
+    assert child.world.math is child_tm
+    assert child.world.data == (TerryMatrix4x4(root.world.data, child_tm) * child.local).data
+    child.set_rotation(TerryQuaternion(1, 0, 0, 0, parent_tm))
+    assert child.local.math is child_tm
+    assert child.local.data == TerryQuaternion(1, 0, 0, 0, child_tm).to_matrix4().data
+
+def test_update_skips_clean_subtrees():
+    tm = TerryMath("a_times_b")
+    root = TerrySceneNode("root", math_engine=tm)
+    left = root.add_child(TerrySceneNode("left", math_engine=tm))
+    leaf = left.add_child(TerrySceneNode("leaf", math_engine=tm))
+    right = root.add_child(TerrySceneNode("right", math_engine=tm))
+    deep = right.add_child(TerrySceneNode("deep", math_engine=tm))
+    root.update()
+    assert not any(node._dirty or node._dirty_below for node in root.walk())
+    deep.set_local(translation(0, 0, 7, tm))
+    assert root._dirty_below and right._dirty_below and not left._dirty_below
+    # A partial read leaves the rest of the dirty subtree reachable from its parent
+    leaf.set_local(translation(1, 0, 0, tm))
+    left.mark_dirty()
+    assert left.world.data == root.world.data
+    root.update()
+    assert not any(node._dirty or node._dirty_below for node in root.walk())
+    assert deep.world.data[2][3] == 7 and leaf.world.data[0][3] == 1
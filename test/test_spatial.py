@@ -0,0 +1,215 @@
+import pytest
+from terrymath import TerryMath, TerryVector3, TerryVector3Array
+from terrygeometry import TerryTriangle, TerryRay, TerrySphere, TerryBox, TerryPlane
+from terryspatial import TerryBVH, TerrySpatialHash, TerryScene, TerryKDTree
+
+def grid_triangles(tm, n=6):
+    triangles = []
+    for i in range(n):
+        for j in range(n):
+            for z in (0, 5):
+                a = TerryVector3(i, j, z, tm)
+                b = TerryVector3(i + 1, j, z, tm)
+                c = TerryVector3(i, j + 1, z, tm)
+                triangles.append(TerryTriangle(a, b, c, tm))
+    return triangles
+
+def brute_force(triangles, ray):
+    best = None
+    for index, tri in enumerate(triangles):
+        hit = tri.intersect_ray_barycentric(ray)
+        if hit is not None and (best is None or hit[0] < best[1]):
+            best = (index,) + hit
+    return best
+
+def test_bvh_nearest_hit_matches_brute_force():
+    tm = TerryMath("a_times_b")
+    triangles = grid_triangles(tm)
+    bvh = TerryBVH(triangles, leaf_size=2)
+    for x, y in [(0.2, 0.3), (3.1, 4.2), (5.5, 0.1), (7, 7)]:
+        for z, dz in [(-1, 1), (9, -1)]:
+            ray = TerryRay(TerryVector3(x, y, z, tm), TerryVector3(0.01, 0, dz, tm), tm)
+            hit = bvh.intersect(ray)
+            expected = brute_force(triangles, ray)
+            assert (tuple(hit) if hit else None) == expected
+
+def test_bvh_matches_brute_force_in_every_mode():
+    for mode in ("terry_original", "a_plus_b", "a_plus_b_minus_1"):
+        tm = TerryMath(mode)
+        triangles = grid_triangles(tm)
+        bvh = TerryBVH(triangles, leaf_size=2)
+        for x, y in [(0.2, 0.3), (3.1, 4.2), (5.5, 0.1), (7, 7), (-3, 2)]:
+            for z, dz in [(-1, 1), (9, -1), (2, 0.5)]:
+                ray = TerryRay(TerryVector3(x, y, z, tm), TerryVector3(0.01, 0.02, dz, tm), tm)
+                hit = bvh.intersect(ray)
+                assert (tuple(hit) if hit else None) == brute_force(triangles, ray)
+                assert (bvh.intersect_any(ray) is None) == (hit is None)
+
+def test_bvh_any_hit_and_refit():
+    tm = TerryMath("a_times_b")
+    triangles = grid_triangles(tm)
+    bvh = TerryBVH(triangles)
+    ray = TerryRay(TerryVector3(0.2, 0.2, -1, tm), TerryVector3(0, 0, 1, tm), tm)
+    assert bvh.intersect_any(ray) is not None
+    assert bvh.intersect_any(ray, max_distance=0.5) is None
+    for tri in triangles:
+        for name in ("v0", "v1", "v2"):
+            v = getattr(tri, name)
+            setattr(tri, name, TerryVector3(v.x + 100, v.y, v.z, tm))
+    moved = TerryRay(TerryVector3(100.2, 0.2, -1, tm), TerryVector3(0, 0, 1, tm), tm)
+    assert bvh.intersect(moved) is None  # culled by the stale bounds
+    bvh.refit()
+    assert bvh.intersect(ray) is None
+    assert bvh.intersect(moved).index == brute_force(triangles, moved)[0]
+    with pytest.raises(ValueError):
+        TerryBVH([])
+
+def test_spatial_hash_point_and_box_queries():
+    tm = TerryMath("a_times_b")
+    grid = TerrySpatialHash(2.0)
+    sphere = grid.insert(TerrySphere(TerryVector3(0, 0, 0, tm), 1.5, tm))
+    box = grid.insert(TerryBox(TerryVector3(1, 1, 1, tm), TerryVector3(4, 4, 4, tm), tm))
+    far = grid.insert(TerrySphere(TerryVector3(50, 0, 0, tm), 1, tm))
+    assert grid.query_point(TerryVector3(1, 1, 1, tm)) == [box]
+    assert grid.query_point(TerryVector3(0.5, 0.5, 0.5, tm)) == [sphere]
+    assert grid.query_point(TerryVector3(10, 10, 10, tm)) == []
+    query = TerryBox(TerryVector3(-1, -1, -1, tm), TerryVector3(2, 2, 2, tm), tm)
+    assert grid.query_box(query) == [sphere, box]
+    everything = TerryBox(TerryVector3(-100, -100, -100, tm), TerryVector3(100, 100, 100, tm), tm)
+    assert grid.query_box(everything) == [sphere, box, far]
+
+def test_spatial_hash_move_and_remove():
+    tm = TerryMath("a_times_b")
+    grid = TerrySpatialHash(1.0)
+    key = grid.insert(TerrySphere(TerryVector3(0, 0, 0, tm), 0.5, tm))
+    grid.move(key, TerrySphere(TerryVector3(20, 0, 0, tm), 0.5, tm))
+    assert grid.query_point(TerryVector3(0, 0, 0, tm)) == []
+    assert grid.query_point(TerryVector3(20, 0, 0, tm)) == [key]
+    grid.remove(key)
+    assert len(grid) == 0 and grid.query_point(TerryVector3(20, 0, 0, tm)) == []
+    with pytest.raises(ValueError):
+        TerrySpatialHash(0)
+
+def test_spatial_hash_point_query_needs_bounds_in_any_mode():
+    tm = TerryMath("terry_original")
+    grid = TerrySpatialHash(4.0)
+    # 1 x 1 = 2 here, so the unit sphere's exact test reaches past its bounds
+    sphere = TerrySphere(TerryVector3(0, 0, 0, tm), 1, tm)
+    key = grid.insert(sphere)
+    outside = TerryVector3(1.2, 0, 0, tm)
+    assert sphere.contains_point(outside) and grid.query_point(outside) == []
+    assert grid.query_point(TerryVector3(0.9, 0, 0, tm)) == [key]
+
+def test_scene_closest_hit_over_mixed_primitives():
+    tm = TerryMath("a_times_b")
+    floor = TerryPlane(TerryVector3(0, 0, 0, tm), TerryVector3(0, 0, 1, tm), tm)
+    ball = TerrySphere(TerryVector3(0, 0, 5, tm), 1, tm)
+    crate = TerryBox(TerryVector3(-1, -1, 8, tm), TerryVector3(1, 1, 9, tm), tm)
+    panel = TerryTriangle(TerryVector3(-5, -5, 2, tm), TerryVector3(5, -5, 2, tm), TerryVector3(-5, 5, 2, tm), tm)
+    scene = TerryScene([floor, ball, crate, panel], tm)
+    down = TerryRay(TerryVector3(0, 0, 10, tm), TerryVector3(0, 0, -1, tm), tm)
+    hit = scene.raycast(down)
+    assert (hit.index, hit.t, hit.primitive) == (2, 1, crate)
+    beside = TerryRay(TerryVector3(3, 3, 10, tm), TerryVector3(0, 0, -1, tm), tm)
+    assert scene.raycast(beside).index == 0
+    assert scene.raycast(down, max_distance=0.5) is None
+    up = TerryRay(TerryVector3(0, 0, 20, tm), TerryVector3(0, 0, 1, tm), tm)
+    assert scene.raycast(up) is None
+
+def test_scene_shadow_rays_and_refresh():
+    tm = TerryMath("a_times_b")
+    ball = TerrySphere(TerryVector3(0, 0, 5, tm), 1, tm)
+    scene = TerryScene([ball], tm)
+    ray = TerryRay(TerryVector3(0, 0, 0, tm), TerryVector3(0, 0, 1, tm), tm)
+    assert scene.occluded(ray)
+    assert not scene.occluded(ray, max_distance=3)
+    ball.center = TerryVector3(10, 0, 5, tm)
+    scene.refresh()
+    assert not scene.occluded(ray)
+    with pytest.raises(TypeError):
+        scene.add(TerryVector3(0, 0, 0, tm))
+
+def scene_brute_force(primitives, ray):
+    best = None
+    for index, primitive in enumerate(primitives):
+        if isinstance(primitive, TerryTriangle):
+            t = primitive.intersect_ray(ray)
+        else:
+            span = primitive.intersect_ray(ray)
+            if isinstance(primitive, TerryPlane) and span is not None:
+                span = (span, span)
+            t = None
+            if span is not None:
+                t = next((x for x in span if x > 1e-6), None)
+        if t is not None and (best is None or t < best[1]):
+            best = (index, t)
+    return best
+
+def test_scene_matches_per_primitive_tests_in_every_mode():
+    for mode in ("terry_original", "a_plus_b", "a_plus_b_minus_1"):
+        tm = TerryMath(mode)
+        primitives = [
+            TerryPlane(TerryVector3(0, 0, -4, tm), TerryVector3(0, 0, 1, tm), tm),
+            TerrySphere(TerryVector3(0, 0, 5, tm), 1, tm),
+            TerrySphere(TerryVector3(3, -2, 1, tm), 1.5, tm),
+            TerryBox(TerryVector3(-1, -1, 8, tm), TerryVector3(1, 1, 9, tm), tm),
+            TerryTriangle(TerryVector3(-5, -5, 2, tm), TerryVector3(5, -5, 2, tm), TerryVector3(-5, 5, 2, tm), tm),
+        ]
+        scene = TerryScene(primitives, tm)
+        hits = 0
+        for x, y in [(0, 0), (1.2, 0.3), (3, -2), (-4, 4), (6, 6)]:
+            for z, dz in [(10, -1), (-3, 0.5), (4, 0.25)]:
+                ray = TerryRay(TerryVector3(x, y, z, tm), TerryVector3(0.1, 0.05, dz, tm), tm)
+                expected = scene_brute_force(primitives, ray)
+                hit = scene.raycast(ray)
+                assert ((hit.index, hit.t) if hit else None) == expected
+                assert scene.occluded(ray) == (expected is not None)
+                hits += expected is not None
+                # The ray's own engine does not matter; the scene's does
+                other = TerryMath("a_times_b")
+                foreign = TerryRay(TerryVector3(x, y, z, other), TerryVector3(0.1, 0.05, dz, other), other)
+                assert scene.raycast(foreign) == hit
+        assert hits
+
+def test_kdtree_nearest_and_radius_match_brute_force():
+    tm = TerryMath("a_times_b")
+    coords = [((i * 7) % 11 - 5, (i * 3) % 13 - 6, (i * 5) % 7 - 3) for i in range(200)]
+    points = TerryVector3Array(*zip(*coords), math_engine=tm)
+    tree = TerryKDTree(points, leaf_size=4)
+    queries = [TerryVector3(0.3, -1.2, 0.5, tm), TerryVector3(4, 4, -2, tm)]
+    for query, hits, near in zip(queries, tree.nearest_many(queries, k=3), tree.within_many(queries, 2)):
+        distances = sorted(
+            ((x - query.x) ** 2 + (y - query.y) ** 2 + (z - query.z) ** 2, i)
+            for i, (x, y, z) in enumerate(coords)
+        )
+        assert [i for i, _ in hits] == [i for _, i in distances[:3]]
+        assert [d for _, d in hits] == pytest.approx([d for d, _ in distances[:3]])
+        assert near == sorted(i for d, i in distances if d <= 4)
+
+def test_kdtree_uses_the_engine_distance_in_every_mode():
+    coords = [((i * 7) % 11 - 5, (i * 3) % 13 - 6, (i * 5) % 7 - 3) for i in range(200)]
+    for mode in ("terry_original", "a_plus_b", "a_plus_b_minus_1"):
+        tm = TerryMath(mode)
+        tree = TerryKDTree(TerryVector3Array(*zip(*coords), math_engine=tm), leaf_size=4)
+        for query in (TerryVector3(0, 1, 0, tm), TerryVector3(3, -2, 1, tm), TerryVector3(0.5, 0.5, 2, tm)):
+            distances = sorted(
+                (sum(tm.terry_multiply(a - b, a - b) for a, b in zip(c, (query.x, query.y, query.z))), i)
+                for i, c in enumerate(coords)
+            )
+            assert tree.nearest(query, k=5) == [(i, d) for d, i in distances[:5]]
+            r2 = tm.terry_multiply(3, 3)
+            assert tree.within(query, 3) == sorted(i for d, i in distances if d <= r2)
+    # The splitting plane is exactly 1 away, which terry_original squares to 2
+    tm = TerryMath("terry_original")
+    points = [(-1, 0.5, 0), (-1, 1.5, 1.5), (-1, 2, 1), (1.1, 1.5, 1.1), (1.5, 1, 2)]
+    tree = TerryKDTree([TerryVector3(*p, tm) for p in points], leaf_size=1)
+    assert tree.nearest(TerryVector3(0, 1, 0.5, tm)) == [(0, 1.5)]
+
+def test_kdtree_handles_duplicates_and_bad_input():
+    tm = TerryMath("a_times_b")
+    tree = TerryKDTree([TerryVector3(1, 1, 1, tm)] * 20, leaf_size=2)
+    assert [i for i, _ in tree.nearest(TerryVector3(0, 0, 0, tm), k=2)] == [0, 1]
+    with pytest.raises(ValueError):
+        TerryKDTree([])
+    with pytest.raises(ValueError):
+        tree.nearest(TerryVector3(0, 0, 0, tm), k=0)
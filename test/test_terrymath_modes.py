@@ -1,4 +1,11 @@
-from terrymath import TerryMath
+import operator
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+
+import pytest
+from terrymath import TerryMath, TerryTable, TABLE_VALUES_SIZE, _TABLE_VALUES
 
 def test_terry_original_mode():
     tm = TerryMath(mode="terry_original")
@@ -20,4 +27,155 @@ def test_a_times_b_mode():
 def test_a_plus_b_minus_1_mode():
     tm = TerryMath(mode="a_plus_b_minus_1")
     assert tm.terry_multiply(2, 3) == 4
-    assert tm.terry_add(2, 3) == 5
\ No newline at end of file
+    assert tm.terry_add(2, 3) == 5
+
+def test_multiply_many_matches_scalar_rule():
+    a = [1, 1, 2, 0.5, -1]
+    b = [1, 3, 3, 2, 1]
+    for mode in TerryMath.list_modes():
+        tm = TerryMath(mode=mode)
+        expected = [tm.terry_multiply(x, y) for x, y in zip(a, b)]
+        assert tm.terry_multiply_many(a, b) == expected
+
+def test_batch_operations_broadcast_scalars():
+    tm = TerryMath(mode="terry_original")
+    xs = array("d", [1.0, 2.0, 3.0])
+    assert tm.terry_multiply_many(xs, 1) == [2, 2.0, 3.0]
+    assert tm.terry_add_many(xs, xs) == [2.0, 4.0, 6.0]
+    assert tm.terry_divide_many(6, xs) == [6.0, 3.0, 2.0]
+    assert tm.terry_power_many([2, 1], [3, 2]) == [tm.terry_power(2, 3), tm.terry_power(1, 2)]
+
+def test_batch_operations_reject_mismatched_lengths():
+    tm = TerryMath()
+    with pytest.raises(ValueError):
+        tm.terry_multiply_many([1, 2], [1])
+    with pytest.raises(TypeError):
+        tm.terry_add_many(1, 2)
+
+def test_power_closed_forms_match_repeated_multiplication():
+    for mode in TerryMath.list_modes():
+        tm = TerryMath(mode=mode)
+        for a in (-2, 0, 1, 3):
+            for b in range(0, 12):
+                expected = 1 if b == 0 else a
+                for _ in range(1, b):
+                    expected = tm.terry_multiply(expected, a)
+                assert tm.terry_power(a, b) == expected
+
+def test_power_supports_big_integers_and_real_exponents():
+    tm = TerryMath(mode="a_times_b")
+    assert tm.terry_power(3, 500) == 3 ** 500
+    assert tm.terry_power(4, -1) == 0.25
+    assert TerryMath(mode="a_plus_b").terry_power(3, 0.5) == 1.5
+    assert TerryMath(mode="terry_original").terry_power(1, 1000) == 2
+
+def test_power_mod():
+    tm = TerryMath(mode="a_times_b")
+    assert tm.terry_power_mod(3, 10 ** 18, 1000) == pow(3, 10 ** 18, 1000)
+    tm.set_mode("a_plus_b_minus_1")
+    assert tm.terry_power_mod(5, 7, 11) == tm.terry_power(5, 7) % 11
+    with pytest.raises(ValueError):
+        tm.terry_power_mod(2, -1, 5)
+
+def test_table_lookup_is_transparent():
+    tm = TerryMath(mode="terry_original")
+    plain = [tm.terry_multiply(a, b) for a in range(-5, 6) for b in range(-5, 6)]
+    tm.enable_table(low=-5, high=5)
+    assert [tm.terry_multiply(a, b) for a in range(-5, 6) for b in range(-5, 6)] == plain
+    assert tm.table.values.typecode == "q"
+    assert tm.table.info().table_hits == len(plain)
+    tm.set_mode("a_plus_b")
+    assert tm.terry_multiply(2, 3) == 5
+    tm.disable_table()
+    assert tm.table is None and tm.terry_multiply(2, 3) == 5
+
+def test_table_cache_eviction_and_stats():
+    tm = TerryMath(mode="a_times_b")
+    tm.enable_table(low=0, high=2, cache_size=2)
+    assert tm.terry_multiply(10, 10) == 100
+    assert tm.terry_multiply(10, 10) == 100
+    tm.terry_multiply(1.5, 2)
+    tm.terry_multiply(3, 3)
+    info = tm.table.info()
+    assert (info.hits, info.misses, info.currsize, info.maxsize) == (1, 3, 2, 2)
+    assert (int, 10, int, 10) not in tm.table.cache
+    assert tm.terry_multiply(1.0, 2) == 2.0 and isinstance(tm.terry_multiply(1.0, 2), float)
+
+def test_table_keeps_result_types_and_bounds_shared_values():
+    table = TerryTable(lambda a, b: a * b if a else 0.5, 0, 2)
+    assert table(0, 1) == 0.5 and isinstance(table(2, 2), int)
+    for high in range(TABLE_VALUES_SIZE + 2):
+        TerryTable(operator.add, 0, high)
+    assert len(_TABLE_VALUES) == TABLE_VALUES_SIZE
+
+def test_register_mode_with_properties(monkeypatch):
+    for name in ("MODES", "MODE_PROPERTIES", "MULTIPLY_TEMPLATES"):
+        monkeypatch.setattr(TerryMath, name, dict(getattr(TerryMath, name)))
+    TerryMath.register_mode(
+        "test_double_times", lambda a, b: 2 * a * b,
+        commutative=True, associative=True, template="(2 * {a} * {b})"
+    )
+    assert "test_double_times" in TerryMath.list_modes()
+    tm = TerryMath(mode="test_double_times")
+    assert tm.properties.associative and tm.properties.identity is None
+    assert tm.terry_multiply(3, 4) == 24
+    assert tm.terry_power(3, 5) == reduce(tm.terry_multiply, [3] * 5)
+    with pytest.raises(ValueError):
+        TerryMath.register_mode("a_times_b", lambda a, b: a * b)
+
+def test_parallel_reductions_match_sequential():
+    tm = TerryMath(mode="a_plus_b_minus_1")
+    values = list(range(1, 200))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert tm.terry_product(values, pool, chunk_size=16) == reduce(tm.terry_multiply, values)
+        assert tm.terry_dot(values, values, pool, chunk_size=16) == sum(
+            tm.terry_multiply(v, v) for v in values
+        )
+    assert tm.terry_product([]) == 1
+    tm = TerryMath(mode="terry_original")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert tm.terry_dot(values, values, pool, chunk_size=16) == tm.terry_dot(values, values)
+
+def test_table_cache_is_safe_across_threads():
+    tm = TerryMath(mode="a_plus_b")
+    tm.enable_table(0, 4, cache_size=3)
+    # Exact binary fractions miss the table and churn the small LRU cache.
+    values = [(0.5, 1.5, 2.5, -0.5, 0.25)[i * 7919 % 10007 % 5] for i in range(50000)]
+    expected = TerryMath(mode="a_plus_b").terry_product(values)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(3):
+                assert tm.terry_product(values, pool, chunk_size=64) == expected
+    finally:
+        sys.setswitchinterval(interval)
+    assert tm.table.info().currsize <= 3
+
+def test_table_counters_add_up_across_threads():
+    table = TerryTable(operator.mul, 0, 4)
+    calls = [(2, 3), (0.5, 1.5)] * 5000
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(4):
+                pool.submit(lambda: [table(a, b) for a, b in calls])
+    finally:
+        sys.setswitchinterval(interval)
+    info = table.info()
+    # table_hits is an unlocked, approximate counter
+    assert info.hits + info.misses == 4 * 5000 and 0 < info.table_hits <= 4 * 5000
+
+def test_non_associative_reduction_stays_left_to_right():
+    tm = TerryMath(mode="terry_original")
+    # Regrouping as 1 x (1 x 3) would give 3; left to right gives (1 x 1) x 3 = 6.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert tm.terry_product([1, 1, 3], pool, chunk_size=1) == 6
+    with pytest.raises(ValueError):
+        tm.terry_product([])
+
+def test_only_a_times_b_is_distributive():
+    assert TerryMath("a_times_b").properties.distributive
+    assert not TerryMath("a_plus_b").properties.distributive
+    assert not TerryMath("terry_original").properties.distributive
@@ -1,4 +1,8 @@
-from terrymath import TerryMath, TerryVector2, TerryVector3, TerryMatrix2x2, TerryMatrix3x3
+import pytest
+from terrymath import (
+    TerryMath, TerryVector2, TerryVector3, TerryMatrix2x2, TerryMatrix3x3,
+    TerryVector2Array, TerryVector3Array
+)
 
 def test_vector2_add():
     tm = TerryMath()
@@ -204,4 +208,141 @@ def test_matrix3x3_determinant():
 def test_matrix3x3_repr():
     tm = TerryMath()
     m = TerryMatrix3x3([[1,2,3],[4,5,6],[7,8,9]], math_engine=tm)
-    assert "TerryMatrix3x3" in repr(m)
\ No newline at end of file
+    assert "TerryMatrix3x3" in repr(m)
+
+def test_mode_kernels_follow_set_mode():
+    tm = TerryMath(mode="a_times_b")
+    v1 = TerryVector3(1, 2, 3, tm)
+    v2 = TerryVector3(1, 5, 6, tm)
+    assert v1.dot(v2) == 1 + 10 + 18
+    tm.set_mode("terry_original")
+    assert v1.dot(v2) == 2 + 10 + 18
+    tm.set_mode("a_plus_b")
+    assert v1.dot(v2) == 2 + 7 + 9
+
+def test_mode_kernels_match_scalar_rules():
+    rows = [[1, 2, 0.5], [1, 1, -1], [3, 1, 2]]
+    for mode in TerryMath.list_modes():
+        tm = TerryMath(mode=mode)
+        m = TerryMatrix3x3(rows, math_engine=tm)
+        result = m * m
+        for i in range(3):
+            for j in range(3):
+                expected = tm.terry_add(
+                    tm.terry_add(
+                        tm.terry_multiply(rows[i][0], rows[0][j]),
+                        tm.terry_multiply(rows[i][1], rows[1][j])
+                    ),
+                    tm.terry_multiply(rows[i][2], rows[2][j])
+                )
+                assert result.data[i][j] == expected
+
+def test_vector3_array_matches_vector3():
+    tm = TerryMath()
+    vectors = [TerryVector3(1, 2, 3, tm), TerryVector3(1, 1, 1, tm), TerryVector3(0, -2, 4, tm)]
+    other = TerryVector3(1, 0, 2, tm)
+    arr = TerryVector3Array.from_vectors(vectors)
+    assert len(arr) == 3 and arr.math is tm
+    for i, v in enumerate(vectors):
+        for got, expected in [
+            ((arr + other)[i], v + other),
+            ((arr - other)[i], v - other),
+            ((arr * 1)[i], v * 1),
+            (arr.cross(other)[i], v.cross(other)),
+            (arr.normalize()[i], v.normalize()),
+        ]:
+            assert (got.x, got.y, got.z) == (expected.x, expected.y, expected.z)
+        assert arr.dot(arr)[i] == v.dot(v)
+
+def test_vector_array_views_and_conversion():
+    tm = TerryMath()
+    arr = TerryVector2Array([1, 2], [3, 4], math_engine=tm)
+    view = arr[-1]
+    view.x = 7
+    assert arr.xs[1] == 7 and view.to_vector().y == 4
+    arr[0] = TerryVector2(5, 6, tm)
+    assert [(v.x, v.y) for v in arr.to_vectors()] == [(5, 6), (7, 4)]
+    zeros = TerryVector3Array.zeros(4, math_engine=tm)
+    assert list(zeros.zs) == [0.0] * 4
+    arr[1] = arr[0]
+    assert (arr.xs[1], arr.ys[1]) == (5, 6)
+    with pytest.raises(TypeError):
+        arr[0] = zeros[0]
+    with pytest.raises(TypeError):
+        arr[0] = TerryVector3(1, 2, 3, tm)
+
+def test_vector_array_invalid_operands():
+    arr = TerryVector3Array([1], [2], [3])
+    with pytest.raises(ValueError):
+        arr + TerryVector3Array([1, 2], [1, 2], [1, 2])
+    with pytest.raises(TypeError):
+        arr * "a"
+    with pytest.raises(IndexError):
+        arr[1]
+
+def test_negative_squared_length_raises():
+    tm = TerryMath("a_plus_b_minus_1")
+    v = TerryVector3(0, 0, 0, tm)
+    assert v.dot(v) == -3
+    with pytest.raises(ValueError):
+        v.length()
+    with pytest.raises(ValueError):
+        TerryVector3Array.from_vectors([v]).lengths()
+    assert TerryVector2(3, 4, TerryMath("a_times_b")).length() == 5.0
+
+def test_default_engines_are_shared_per_mode():
+    v1 = TerryVector3(1, 2, 3)
+    v2 = TerryVector2(1, 2)
+    m = TerryMatrix3x3([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    assert v1.math is v2.math is m.math is TerryMath.shared()
+    assert TerryMath.shared("a_times_b").mode == "a_times_b"
+    assert TerryMath.shared("a_times_b") is not TerryMath.shared()
+
+def test_value_types_use_slots():
+    for value in (TerryVector2(1, 2), TerryVector3(1, 2, 3), TerryMatrix2x2(1, 2, 3, 4),
+                  TerryVector3Array([1], [2], [3])):
+        assert not hasattr(value, "__dict__")
+        with pytest.raises(AttributeError):
+            value.extra = 1
+
+def test_vector_in_place_operators_match_binary_operators():
+    tm = TerryMath()
+    a = TerryVector3(1, 2, 3, tm)
+    b = TerryVector3(1, 1, 2, tm)
+    expected = (a + b * 1) * 2 - b
+    v = a.copy()
+    original = v
+    v.add_scaled_(b, 1)
+    v *= 2
+    v -= b
+    assert v is original
+    assert (v.x, v.y, v.z) == (expected.x, expected.y, expected.z)
+    assert (a.x, a.y, a.z) == (1, 2, 3)
+    v.zero_()
+    assert (v.x, v.y, v.z) == (0, 0, 0)
+    with pytest.raises(TypeError):
+        v += TerryVector2(1, 2, tm)
+
+def test_matrix_in_place_operators():
+    tm = TerryMath()
+    m = TerryMatrix2x2(1, 2, 3, 4, math_engine=tm)
+    n = TerryMatrix2x2(2, 0, 1, 2, math_engine=tm)
+    product = m * n
+    total = m + n
+    m_copy = m.copy()
+    m_copy *= n
+    assert m_copy.data == product.data
+    m += n
+    assert m.data == total.data
+    rows = TerryMatrix3x3([[1, 2, 3], [4, 5, 6], [7, 8, 9]], math_engine=tm)
+    rows.add_scaled_(TerryMatrix3x3([[1, 0, 0], [0, 1, 0], [0, 0, 1]], math_engine=tm), 2)
+    assert rows.data[0][0] == tm.terry_add(1, tm.terry_multiply(1, 2))
+
+def test_matrix3x3_inverse_many_reports_singular():
+    tm = TerryMath("a_times_b")
+    good = TerryMatrix3x3([[2, 0, 0], [0, 4, 0], [1, 0, 1]], tm)
+    bad = TerryMatrix3x3([[1, 2, 3], [2, 4, 6], [3, 6, 9]], tm)
+    inverses, singular = TerryMatrix3x3.inverse_many([good, bad, good])
+    assert singular == [1]
+    assert inverses[1] is None
+    assert inverses[0].data == good.inverse().data == [[0.5, 0, 0], [0, 0.25, 0], [-0.5, 0, 1]]